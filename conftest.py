@@ -1,25 +1,739 @@
+import os
 import pytest
+import random
+import re
+import shutil
+import subprocess
+import sys
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from dataclasses import dataclass
 import logging
 logging.getLogger("WDM").setLevel(logging.WARNING)
 
 
+def _worker_id() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def _is_controller(pytest_config) -> bool:
+    """True in a plain run and in the xdist controller, False inside a worker."""
+    return not hasattr(pytest_config, "workerinput")
+
+
+def _new_driver():
+    from utils.browser import chrome_options, new_driver
+    clones = _get_profile_clones()
+    d = new_driver(chrome_options(user_data_dir=clones.new())) if clones is not None else new_driver()
+    if _net_profile is not None:
+        from utils.netprofile import apply_profile
+        apply_profile(d, _net_profile)
+    return d
+
+
+def _traces_dir() -> str:
+    from utils import config
+    return os.path.join(config.REPORTS_DIR, "traces")
+
+
 @pytest.fixture
-def driver():
-    opts = webdriver.ChromeOptions()
-    opts.add_argument("--start-maximized")
-    opts.add_argument("--lang=en-US")
-    opts.add_experimental_option("prefs", {
-        "intl.accept_languages": "en,en_US",
-        "translate": {"enabled": False},
-    })
-    opts.add_argument("--incognito")
-
-    d = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+def driver(request):
+    reuse = request.config.getoption("--reuse-browser")
+    monitor = None
+    if reuse:
+        d = _get_browser_pool().acquire()
+    else:
+        d = _new_driver()
+        if request.config.getoption("--browser-health"):
+            from utils.browser_health import BrowserMonitor
+            monitor = BrowserMonitor(d, len(_browser_monitors) + 1)
+    trace = None
+    if request.config.getoption("--trace-commands"):
+        from utils.command_trace import CommandTrace
+        trace = CommandTrace(request.node.nodeid).attach(d)
     yield d
+    if trace is not None:
+        trace.detach()
+        name = re.sub(r"[^\w.-]+", "_", request.node.nodeid).strip("_")
+        trace.dump(os.path.join(_traces_dir(), _worker_id(), f"{name}.jsonl"))
+    if reuse:
+        _record_health(*_browser_pool.release(request.node.nodeid))
+        return
+    if monitor is not None:
+        _browser_monitors.append(monitor)
+        _record_health(monitor.sample(request.node.nodeid), None)
     time.sleep(5)
     d.quit()
 
+
+# ---------------- Browser health / reuse ----------------
+# --browser-health samples RSS, JS heap and DOM nodes after each test; --reuse-browser
+# also keeps one Chrome per worker across tests and recycles it past the HealthLimits
+# (BROWSER_MAX_* in .env). See utils/browser_health.py.
+_browser_pool = None
+_browser_monitors = []
+
+
+def _browser_health_dir() -> str:
+    from utils import config
+    return os.path.join(config.REPORTS_DIR, "browser_health")
+
+
+def _get_browser_pool():
+    global _browser_pool
+    if _browser_pool is None:
+        from utils.browser_health import BrowserPool, HealthLimits
+        _browser_pool = BrowserPool(_new_driver, HealthLimits.from_config())
+    return _browser_pool
+
+
+def _record_health(sample, reason):
+    if _report_store is None or sample is None:
+        return
+    _report_store.append("browser_health", nodeid=sample.test, browser=sample.browser, tests=sample.tests,
+                         commands=sample.commands, rss_mb=sample.rss_mb, js_heap_mb=sample.js_heap_mb,
+                         dom_nodes=sample.dom_nodes)
+    if reason is not None:
+        _report_store.append("browser_recycle", nodeid=sample.test, browser=sample.browser,
+                             tests=sample.tests, reason=reason)
+
+
+def _dump_browser_health():
+    from utils import browser_health
+
+    path = os.path.join(_browser_health_dir(), f"{_worker_id()}.json")
+    if _browser_pool is not None:
+        _browser_pool.close()
+        browser_health.dump(path, _browser_pool)
+    elif _browser_monitors:
+        browser_health.dump(path, _browser_monitors)
+
+
+# ---------------- Shared employee flow ----------------
+# The flow is a small dependency graph:
+#
+#   logged_in_driver ─┐
+#   created_employee ─┴─> employee_driver  (Personal Details of the shared record)
+#
+# `created_employee` is session scoped, so each worker creates ONE employee and the
+# downstream tests that only need "some existing employee" reuse it. If any upstream
+# step fails, pytest caches that error and every dependent test errors with it
+# instead of re-running login → PIM → Add Employee → Save on its own.
+
+@dataclass(frozen=True)
+class CreatedEmployee:
+    emp_number: int
+    first: str
+    middle: str
+    last: str
+    employee_id: str
+    data: "EmployeeData"        # the generated record (personal/job values to set on it)
+
+
+def _employee_tag() -> str:
+    from utils import config
+    from utils.cleanup import new_tag
+    return new_tag(config.EMPLOYEE_TAG_PREFIX)
+
+
+@pytest.fixture
+def employee_tag():
+    """Employee Id for a record this test creates — lets the cleanup find it (utils/cleanup.py)."""
+    return _employee_tag()
+
+
+@pytest.fixture
+def track_employee():
+    """Register an empNumber the test created, so it is deleted at session end."""
+    from utils.cleanup import CREATED
+    return CREATED.add
+
+
+class UpstreamStepError(RuntimeError):
+    """Raised when a step that shared fixtures depend on did not complete."""
+
+
+@pytest.fixture
+def logged_in_driver(driver):
+    from pages.login_page import LoginPage
+
+    assert LoginPage(driver).login(), "Login did not reach the Dashboard"
+    return driver
+
+
+@pytest.fixture(scope="session")
+def created_employee(test_data):
+    from pages.login_page import LoginPage
+    from pages.pim_page import PIMPage
+    from pages.add_employee_page import AddEmployeePage
+    from utils.cleanup import CREATED
+
+    data = test_data.take()
+    first, middle, last = data.first, data.middle, data.last
+    employee_id = _employee_tag()
+    step = "start browser"
+    d = _new_driver()
+    try:
+        step = "login"
+        LoginPage(d).login()
+        step = "open Add Employee"
+        if not PIMPage(d).open_add_employee():
+            raise UpstreamStepError("Could not open Add Employee page")
+        add = AddEmployeePage(d)
+        step = "fill employee details"
+        add.is_loaded()
+        add.fill_employee_details(first, middle, last, employee_id)
+        step = "save employee"
+        add.save_employee()
+        step = "read empNumber"
+        emp_number = CREATED.add(add.get_emp_number())
+    except Exception as e:
+        raise UpstreamStepError(f"created_employee: step '{step}' failed: {e!r}") from e
+    finally:
+        d.quit()
+
+    return CreatedEmployee(emp_number, first, middle, last, employee_id, data)
+
+
+@pytest.fixture
+def employee_driver(logged_in_driver, created_employee):
+    """Logged-in driver already on the shared employee's Personal Details screen."""
+    from pages.pim_page import PIMPage
+
+    assert PIMPage(logged_in_driver).open_employee(created_employee.emp_number), \
+        f"Could not open employee {created_employee.emp_number}"
+    return logged_in_driver
+
+
+@pytest.fixture
+def hrm_api(logged_in_driver):
+    """REST client sharing the browser's login session (for read-only API verification)."""
+    from utils import config
+    from utils.hrm_api import HrmApi
+
+    api = HrmApi.from_driver(logged_in_driver, config.APP_URL)
+    yield api
+    api.session.close()
+
+
+# ---------------- Seeded test data ----------------
+# One seed per run (shared with xdist workers) drives utils/test_data.py. Tests that take
+# an `employee_data` argument are parametrized with the first --data-count records; the
+# `test_data` fixture hands out records from a separate, per-worker slice of the index space.
+_data_seed = None
+_TAKE_BASE = 1_000_000
+
+
+def pytest_configure(config):
+    global _data_seed, _warm_profile
+    seed = config.getoption("--data-seed")
+    if seed is None and hasattr(config, "workerinput"):
+        seed = config.workerinput.get("data_seed")
+    _data_seed = int(seed) if seed is not None else random.randrange(1, 10 ** 6)
+    _configure_network(config)
+    _start_logging(config)
+    _warm_profile = config.getoption("--warm-profile")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist: every worker must generate the same parameters as the controller."""
+    node.workerinput["data_seed"] = _data_seed
+
+
+def pytest_report_header(config):
+    return f"test data seed: {_data_seed} (reproduce with --data-seed {_data_seed})"
+
+
+def pytest_generate_tests(metafunc):
+    if "employee_data" in metafunc.fixturenames:
+        from utils.test_data import EmployeeDataGenerator
+
+        gen = EmployeeDataGenerator(_data_seed)
+        records = list(gen.stream(0, metafunc.config.getoption("--data-count")))
+        metafunc.parametrize("employee_data", records, ids=[r.label for r in records])
+
+
+@pytest.fixture(scope="session")
+def test_data(pytestconfig):
+    """Seeded record generator for this worker (`.take()` for the next unused record)."""
+    from utils.test_data import Catalog, EmployeeDataGenerator
+
+    catalog = None
+    if pytestconfig.getoption("--data-catalog") == "api":
+        from utils import config
+        from utils.hrm_api import HrmApi
+
+        api = HrmApi(config.APP_URL).login(config.USERNAME, config.PASSWORD)
+        catalog = Catalog.from_api(api)
+        api.session.close()
+    worker = _worker_id()
+    index = int(worker[2:]) if worker.startswith("gw") else 0
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return EmployeeDataGenerator(_data_seed, catalog, offset=_TAKE_BASE + index, stride=workers)
+
+
+# ---------------- Network profiles / wait statistics ----------------
+# --net-profile throttles every browser through CDP (utils/netprofile.py); with it, or
+# with --wait-stats, every WebDriverWait.until is timed per call site (utils/wait_stats.py)
+# so slow links show up as page-object waits running out of headroom.
+_net_profile = None
+
+
+def _waits_dir() -> str:
+    from utils import config
+    return os.path.join(config.REPORTS_DIR, "waits")
+
+
+def _configure_network(config):
+    global _net_profile
+    spec = config.getoption("--net-profile")
+    if spec:
+        from utils.netprofile import parse_profile
+        try:
+            _net_profile = parse_profile(spec)
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+    if spec or config.getoption("--wait-stats"):
+        from utils.wait_stats import WAITS
+        WAITS.install()
+
+
+def _dump_waits():
+    wait_stats = sys.modules.get("utils.wait_stats")  # only imported with --wait-stats / --net-profile
+    if wait_stats is not None and wait_stats.WAITS.stats:
+        wait_stats.WAITS.dump(os.path.join(_waits_dir(), f"{_worker_id()}.json"),
+                              _net_profile.name if _net_profile is not None else "none")
+
+
+# ---------------- Logging ----------------
+# Every process logs through a queue to reports/logs/<worker>.log (JSON lines tagged
+# with test, worker and step; utils/logsetup.py). `--log-dir` moves the files.
+_log_pipeline = None
+
+
+def _start_logging(pytest_config):
+    global _log_pipeline
+    from utils import config
+    from utils.logsetup import start_logging
+
+    directory = pytest_config.getoption("--log-dir") or os.path.join(config.REPORTS_DIR, "logs")
+    _log_pipeline = start_logging(directory, _worker_id(), config.LOG_LEVEL,
+                                  int(config.LOG_MAX_MB * 2 ** 20), config.LOG_BACKUPS)
+
+
+def pytest_unconfigure(config):
+    if _log_pipeline is not None:
+        _log_pipeline.stop()
+
+
+# ---------------- Warm browser profiles ----------------
+# --warm-profile starts every browser on a clone of a user-data-dir that has already
+# loaded the login and PIM screens (utils/profile_template.py): cached bundles and
+# compiled JS, no cookies. The first process that needs it builds the template.
+_warm_profile = False
+_profile_clones = None
+_template_info = None
+
+
+def _template_dir() -> str:
+    from utils import config
+    return os.path.join(config.REPORTS_DIR, "chrome_template")
+
+
+def _get_profile_clones():
+    global _profile_clones, _template_info
+    if not _warm_profile:
+        return None
+    if _profile_clones is None:
+        from utils import config
+        from utils.browser import chrome_options, new_driver
+        from utils.profile_template import ProfileClones, ensure_template
+
+        _template_info = ensure_template(
+            _template_dir(), lambda user_data_dir: new_driver(chrome_options(user_data_dir=user_data_dir)),
+            key=config.BASE_URL)
+        _profile_clones = ProfileClones(_template_dir())
+    return _profile_clones
+
+
+def _close_profile_clones():
+    if _profile_clones is not None:
+        _profile_clones.cleanup()
+
+
+def _warm_profile_summary() -> str | None:
+    if _profile_clones is None or _template_info is None:
+        return None
+    age = (time.time() - _template_info["built"]) / 60
+    modes = ", ".join(f"{n} by {m}" for m, n in _profile_clones.modes.items()) or "none"
+    return (f"warm profile: template {_template_info['bytes'] / 2 ** 20:.0f} MB, built in "
+            f"{_template_info['seconds']:.0f}s {age:.0f} min ago; clones: {modes}")
+
+
+# ---------------- Python profiling ----------------
+# --profile-python wraps each test (setup + call + teardown) in cProfile and writes
+# reports/profile/<worker>/<test>.pstats; tools/profile_report.py merges them.
+def _profile_dir() -> str:
+    from utils import config
+    return os.path.join(config.REPORTS_DIR, "profile")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    if not item.config.getoption("--profile-python"):
+        yield
+        return
+    from utils.pyprofile import Profiler
+
+    with Profiler() as prof:
+        yield
+    name = re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_")
+    prof.dump(os.path.join(_profile_dir(), _worker_id(), f"{name}.pstats"))
+
+
+# ---------------- Test impact ----------------
+# --record-impact stores the page-object methods each test calls in reports/impact/map.json;
+# --changed-since REF then runs only the tests the diff against REF can affect
+# (utils/impact.py), or everything when shared code changed.
+_impact_summary = None
+_record_impact = False
+
+
+def _impact_dir() -> str:
+    from utils import config
+    return os.path.join(config.REPORTS_DIR, "impact")
+
+
+def _impact_map(pytest_config) -> str:
+    return pytest_config.getoption("--impact-map") or os.path.join(_impact_dir(), "map.json")
+
+
+def _select_impacted(config, items):
+    global _impact_summary
+    base = config.getoption("--changed-since")
+    if not base:
+        return
+    from utils import config as settings
+    from utils.sharding import estimate, recorded_durations
+    from utils.impact import git_changes, load_map, select_tests
+
+    try:
+        changes = git_changes(base)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise pytest.UsageError(f"--changed-since {base}: git diff failed: {getattr(e, 'stderr', e)}")
+    keep = select_tests([item.nodeid for item in items], load_map(_impact_map(config)), changes)
+    costs = estimate([item.nodeid for item in items],
+                     recorded_durations(os.path.join(settings.REPORTS_DIR, "history")))
+    deselected = [item for item in items if item.nodeid not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = [item for item in items if item.nodeid in keep]
+    saved = sum(costs[i.nodeid] for i in deselected)
+    if changes.full_run:
+        why = changes.full_run
+    else:
+        why = "changed " + (", ".join(sorted(changes.symbols)[:6]) or "no page objects")
+        if len(changes.symbols) > 6:
+            why += f" (+{len(changes.symbols) - 6} more)"
+    _impact_summary = (f"impact since {base}: {len(items)} of {len(costs)} tests selected, "
+                       f"~{saved:.0f}s of ~{sum(costs.values()):.0f}s saved; {why}")
+    if _report_store is not None:
+        _report_store.append("impact", base=base, selected=len(items), total=len(costs),
+                             saved_s=round(saved, 1), full_run=changes.full_run,
+                             symbols=sorted(changes.symbols))
+
+
+def _start_impact_recording(pytest_config):
+    global _record_impact
+    if pytest_config.getoption("--record-impact") and not pytest_config.pluginmanager.has_plugin("dsession"):
+        from utils.impact import IMPACT
+        IMPACT.install()
+        _record_impact = True
+
+
+def pytest_runtest_logstart(nodeid, location):
+    from utils.logsetup import set_test
+    set_test(nodeid)
+    if _record_impact:
+        from utils.impact import IMPACT
+        IMPACT.begin()
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    from utils.logsetup import set_test
+    set_test("")
+    if _record_impact:
+        from utils.impact import IMPACT
+        IMPACT.end(nodeid)
+
+
+def _dump_impact(pytest_config):
+    if not pytest_config.getoption("--record-impact"):
+        return
+    from utils.impact import IMPACT, update_map
+
+    if _record_impact and IMPACT.tests:
+        IMPACT.dump(os.path.join(_impact_dir(), "runs", f"{_worker_id()}.json"))
+    if _is_controller(pytest_config):
+        runs = os.path.join(_impact_dir(), "runs")
+        dumps = [os.path.join(runs, n) for n in sorted(os.listdir(runs))] if os.path.isdir(runs) else []
+        update_map(_impact_map(pytest_config), dumps)
+        shutil.rmtree(runs, ignore_errors=True)
+
+
+# ---------------- Sharding ----------------
+# --shard i/N keeps the i-th of N duration-balanced subsets (utils/sharding.py);
+# tools/merge_shards.py combines the runners' reports afterwards.
+_shard_summary = None
+
+
+def pytest_collection_modifyitems(config, items):
+    global _shard_summary
+    _select_impacted(config, items)
+    spec = config.getoption("--shard")
+    if not spec:
+        return
+    from utils import config as settings
+    from utils.sharding import estimate, parse_shard, plan_shards, recorded_durations
+
+    try:
+        index, total = parse_shard(spec)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    history = config.getoption("--shard-history") or os.path.join(settings.REPORTS_DIR, "history")
+    durations = recorded_durations(history)
+    costs = estimate([item.nodeid for item in items], durations)
+    keep = set(plan_shards(costs, total)[index - 1])
+    selected = [item for item in items if item.nodeid in keep]
+    deselected = [item for item in items if item.nodeid not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    _shard_summary = (f"shard {index}/{total}: {len(selected)} of {len(costs)} tests, "
+                      f"~{sum(costs[i.nodeid] for i in selected):.0f}s of ~{sum(costs.values()):.0f}s "
+                      f"({len(durations)} with recorded durations)")
+
+
+# ---------------- Step retry / flakiness report ----------------
+def _steps_dir() -> str:
+    from utils import config
+    return os.path.join(config.REPORTS_DIR, "steps")
+
+
+def pytest_sessionstart(session):
+    if _is_controller(session.config):
+        shutil.rmtree(_steps_dir(), ignore_errors=True)
+        shutil.rmtree(_browser_health_dir(), ignore_errors=True)
+        shutil.rmtree(_waits_dir(), ignore_errors=True)
+        if session.config.getoption("--profile-python"):
+            shutil.rmtree(_profile_dir(), ignore_errors=True)
+        if session.config.getoption("--trace-commands"):
+            shutil.rmtree(_traces_dir(), ignore_errors=True)
+        if session.config.getoption("--record-impact"):
+            shutil.rmtree(os.path.join(_impact_dir(), "runs"), ignore_errors=True)
+        _preflight_locators(session.config)
+    _open_report_store(session.config)
+    _start_impact_recording(session.config)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    steps = sys.modules.get("utils.step_stats")  # not imported = no page-object step ran (e.g. --collect-only)
+    if steps is not None and steps.STATS.stats:
+        steps.STATS.dump(os.path.join(_steps_dir(), f"{_worker_id()}.json"))
+    _dump_browser_health()
+    _dump_waits()
+    _close_profile_clones()
+    _dump_impact(session.config)
+    _cleanup_created_employees(session.config)
+    _close_report_store(exitstatus)
+
+
+def _preflight_locators(pytest_config):
+    snapshot_dir = pytest_config.getoption("--preflight-locators")
+    if not snapshot_dir:
+        return
+    from utils.locator_check import check_locators, format_results, load_snapshots
+
+    snapshots = load_snapshots(snapshot_dir)
+    if not snapshots:
+        pytest.exit(f"--preflight-locators: no snapshots in {snapshot_dir} (run python -m tools.capture_dom)", 3)
+    results = check_locators(snapshots)
+    if any(r.status in ("missing", "ambiguous", "invalid") for r in results):
+        pytest.exit("Locator pre-flight failed:\n" + "\n".join(format_results(results)), 3)
+
+
+# ---------------- Streaming result store ----------------
+# Each process that runs tests appends one record per test to its own shard in
+# reports/history/ (see utils/report_store.py); tools/report_dashboard.py renders it.
+_report_store = None
+_test_phases: dict[str, dict] = {}
+
+
+def _open_report_store(pytest_config):
+    global _report_store
+    if pytest_config.pluginmanager.has_plugin("dsession"):
+        return  # xdist controller: the workers write their own shards
+    from utils import config
+    from utils.report_store import ReportStore, new_run_id
+
+    run_id = os.environ.get("HRM_RUN_ID") or os.environ.get("PYTEST_XDIST_TESTRUNUID") or new_run_id()
+    _report_store = ReportStore(os.path.join(config.REPORTS_DIR, "history"), run_id, _worker_id())
+    _report_store.append("session_start", args=list(pytest_config.invocation_params.args),
+                         shard=pytest_config.getoption("--shard"))
+
+
+def _close_report_store(exitstatus):
+    global _report_store
+    if _report_store is not None:
+        _report_store.append("session_finish", exitstatus=int(exitstatus))
+        _report_store.close()
+        _report_store = None
+
+
+def pytest_runtest_logreport(report):
+    if _report_store is None:
+        return
+    phases = _test_phases.setdefault(report.nodeid, {})
+    phases[report.when] = report
+    if report.when != "teardown":
+        return
+    steps = sys.modules.get("utils.step_stats")  # not imported = this test ran no page-object step
+
+    phases = _test_phases.pop(report.nodeid)
+    setup, call = phases.get("setup"), phases.get("call")
+    if setup is not None and setup.failed:
+        outcome = "error"
+    elif (setup is not None and setup.skipped) or (call is not None and call.skipped):
+        outcome = "skipped"
+    elif call is not None and call.failed:
+        outcome = "failed"
+    elif report.failed:
+        outcome = "error"
+    else:
+        outcome = "passed"
+    _report_store.append(
+        "test",
+        nodeid=report.nodeid,
+        outcome=outcome,
+        duration=round(sum(r.duration for r in phases.values()), 3),
+        steps=steps.STATS.take_timeline() if steps is not None else [],
+    )
+
+
+# ---------------- Cleanup of suite-created employees ----------------
+_cleanup_report = None
+
+
+def pytest_addoption(parser):
+    parser.addoption("--keep-employees", action="store_true",
+                     help="don't delete the employee records this run created")
+    parser.addoption("--preflight-locators", nargs="?", const="snapshots/dom", default=None, metavar="DIR",
+                     help="check page-object locators against DOM snapshots before starting any browser")
+    parser.addoption("--trace-commands", action="store_true",
+                     help="record every WebDriver command per test into reports/traces/ (see tools/trace_analyze.py)")
+    parser.addoption("--data-seed", type=int, default=None,
+                     help="seed of the generated test data (default: random, printed in the header)")
+    parser.addoption("--data-count", type=int, default=1,
+                     help="number of generated records each employee_data test runs with")
+    parser.addoption("--data-catalog", choices=("default", "api"), default="default",
+                     help="take job titles, sub-units, ... from the built-in list or from the instance")
+    parser.addoption("--net-profile", default=None, metavar="NAME|SPEC",
+                     help="throttle the browsers: 3g, slow-3g, satellite, ... or 'latency=200,down=1000,up=500,loss=1'")
+    parser.addoption("--wait-stats", action="store_true",
+                     help="time every page-object wait against its timeout (on by default with --net-profile)")
+    parser.addoption("--profile-python", action="store_true",
+                     help="cProfile every test into reports/profile/ (see tools/profile_report.py)")
+    parser.addoption("--shard", default=None, metavar="i/N",
+                     help="run only the i-th of N subsets of the tests, balanced by recorded duration")
+    parser.addoption("--shard-history", default=None, metavar="DIR",
+                     help="result store to take test durations from (default <REPORTS_DIR>/history)")
+    parser.addoption("--log-dir", default=None, metavar="DIR",
+                     help="where each worker writes its JSON-lines log (default <REPORTS_DIR>/logs)")
+    parser.addoption("--record-impact", action="store_true",
+                     help="record the page-object methods each test calls into reports/impact/map.json")
+    parser.addoption("--changed-since", default=None, metavar="REF",
+                     help="run only the tests affected by the changes since git REF (all of them if shared code changed)")
+    parser.addoption("--impact-map", default=None, metavar="PATH",
+                     help="impact map to record into / select with (default <REPORTS_DIR>/impact/map.json)")
+    parser.addoption("--warm-profile", action="store_true",
+                     help="start browsers on clones of a pre-warmed profile (cached bundles, no cookies)")
+    parser.addoption("--browser-health", action="store_true",
+                     help="sample browser RSS, JS heap and DOM nodes after each test")
+    parser.addoption("--reuse-browser", action="store_true",
+                     help="reuse one browser per worker, recycling it past the BROWSER_MAX_* limits")
+
+
+def _cleanup_created_employees(pytest_config):
+    global _cleanup_report
+    from utils.cleanup import CREATED
+
+    if not CREATED.emp_numbers or pytest_config.getoption("--keep-employees"):
+        return
+    from utils import config
+    from utils.hrm_api import HrmApi
+
+    try:
+        api = HrmApi(config.APP_URL).login(config.USERNAME, config.PASSWORD)
+        _cleanup_report = CREATED.delete_all(api)
+        api.session.close()
+    except Exception as e:
+        logging.getLogger(__name__).warning("Employee cleanup failed: %r", e)
+        return
+    if _report_store is not None:
+        _report_store.append("cleanup", removed=_cleanup_report.removed, found=_cleanup_report.found,
+                             failed=_cleanup_report.failed, seconds=round(_cleanup_report.seconds, 3))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if _impact_summary is not None:
+        terminalreporter.write_line(_impact_summary)
+    if _shard_summary is not None:
+        terminalreporter.write_line(_shard_summary)
+    if _warm_profile_summary() is not None:
+        terminalreporter.write_line(_warm_profile_summary())
+    if _cleanup_report is not None:
+        terminalreporter.write_line(f"employee cleanup: {_cleanup_report.line()}")
+    if not _is_controller(config):
+        return
+    if config.getoption("--trace-commands"):
+        from utils.command_trace import analyze, load_traces, rank
+
+        traces = load_traces([_traces_dir()]) if os.path.isdir(_traces_dir()) else {}
+        top = rank([f for recs in traces.values() for f in analyze(recs)])[:5]
+        if top:
+            terminalreporter.section("redundant WebDriver commands")
+            for a in top:
+                terminalreporter.write_line(f"{a['ms']:8.0f}ms  {a['count']:3d}x  {a['kind']:<18} {a['site']}  {a['detail']}")
+            terminalreporter.write_line("full report: python -m tools.trace_analyze reports/traces")
+    if config.getoption("--profile-python"):
+        from utils.pyprofile import format_report, merge_profiles, profile_files
+
+        stats = merge_profiles(profile_files(_profile_dir()))
+        if stats is not None:
+            terminalreporter.section("python profile (all workers)")
+            for line in format_report(stats, top=10):
+                terminalreporter.write_line(line)
+            terminalreporter.write_line("full report: python -m tools.profile_report reports/profile")
+    if os.path.isdir(_waits_dir()):
+        from utils.wait_stats import format_waits, load_waits
+
+        for profile, waits in load_waits(_waits_dir()).items():
+            terminalreporter.section(f"page-object waits (network: {profile})")
+            for line in format_waits(waits):
+                terminalreporter.write_line(line)
+    from utils.browser_health import format_health, load_reports
+
+    health = load_reports(_browser_health_dir())
+    if health:
+        terminalreporter.section("browser health")
+        for line in format_health(health):
+            terminalreporter.write_line(line)
+    if not os.path.isdir(_steps_dir()):
+        return
+    from utils.step_stats import load_stats, format_flakiness
+
+    stats = load_stats(_steps_dir())
+    if any(st.retries or st.failures for st in stats.values()):
+        terminalreporter.section("flaky page-object steps")
+        for line in format_flakiness(stats):
+            terminalreporter.write_line(line)
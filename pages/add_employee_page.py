@@ -1,4 +1,7 @@
 # pages/add_employee_page.py
+import re
+
+from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -10,6 +13,7 @@ class AddEmployeePage:
     FIRST_NAME   = (By.NAME, "firstName")
     MIDDLE_NAME  = (By.NAME, "middleName")
     LAST_NAME    = (By.NAME, "lastName")
+    EMPLOYEE_ID  = (By.XPATH, "//label[normalize-space()='Employee Id']/..//following-sibling::div//input")
     SAVE_BTN     = (By.XPATH, "//button[@type='submit']")
 
     # Success toast shown after save
@@ -18,6 +22,9 @@ class AddEmployeePage:
         "//p[contains(@class,'oxd-text--toast-title') and contains(.,'Success')]"
     )
 
+    # After save OrangeHRM redirects to /pim/viewPersonalDetails/empNumber/<n>
+    EMP_NUMBER_URL = re.compile(r"/empNumber/(\d+)")
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, config.DEFAULT_WAIT)
@@ -30,8 +37,8 @@ class AddEmployeePage:
         return True
 
     # --- Actions ---
-    def fill_employee_details(self, first: str, middle: str, last: str) -> None:
-        """Type the employee's first, middle, and last names."""
+    def fill_employee_details(self, first: str, middle: str, last: str, employee_id: str | None = None) -> None:
+        """Type the employee's first, middle, and last names (and optionally replace the suggested Employee Id)."""
         self.wait.until(EC.visibility_of_element_located(self.FIRST_NAME)).clear()
         self.driver.find_element(*self.FIRST_NAME).send_keys(first)
 
@@ -41,8 +48,20 @@ class AddEmployeePage:
         self.driver.find_element(*self.LAST_NAME).clear()
         self.driver.find_element(*self.LAST_NAME).send_keys(last)
 
+        if employee_id is not None:
+            # The field is pre-filled with the next free id; .clear() alone is undone by Vue
+            emp_id = self.driver.find_element(*self.EMPLOYEE_ID)
+            emp_id.send_keys(Keys.CONTROL, "a")
+            emp_id.send_keys(Keys.DELETE)
+            emp_id.send_keys(employee_id)
+
     def save_employee(self) -> bool:
         """Click Save and wait for the success toast."""
         self.driver.find_element(*self.SAVE_BTN).click()
         self.wait.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
         return True
+
+    def get_emp_number(self) -> int:
+        """Wait for the post-save redirect and return the new record's empNumber from the URL."""
+        match = self.wait.until(lambda d: self.EMP_NUMBER_URL.search(d.current_url))
+        return int(match.group(1))
@@ -9,7 +9,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
+from pages.form_snapshot import read_card, to_display, to_iso
 from utils import config
+from utils.steps import RETRYABLE, run_step
 
 
 class EmployeePersonalPage:
@@ -88,6 +90,19 @@ class EmployeePersonalPage:
         except TimeoutException:
             pass
 
+    def _reset_ready(self):
+        """Readiness reset between step retries: close any open dropdown, let overlays settle."""
+        try:
+            ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+        except Exception:
+            pass
+        self._wait_loader_gone()
+        self._wait_toast_gone()
+
+    def _step(self, name: str, action, retry_on=None):
+        kwargs = {"retry_on": retry_on} if retry_on else {}
+        return run_step(f"EmployeePersonalPage.{name}", action, reset=self._reset_ready, **kwargs)
+
     def _open_dropdown(self, icon_locator):
         el = self.wait.until(EC.presence_of_element_located(icon_locator))
         self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
@@ -254,25 +269,38 @@ class EmployeePersonalPage:
     # ------------------ actions ------------------
     def set_personal_details(self, nationality: str, marital_status: str, dob: str, gender: str) -> bool:
         """Fill Employment/Personal details and save."""
-        self._select_from_custom_dropdown(self.NATIONALITY_DD_ICON, nationality)
-        self._select_from_custom_dropdown(self.MARITAL_STATUS_DD_ICON, marital_status)
-
-        self.wait.until(EC.visibility_of_element_located(self.DOB_INPUT)).clear()
-        self.driver.find_element(*self.DOB_INPUT).send_keys(dob)
-
-        if gender.lower().startswith("f"):
-            self.wait.until(EC.element_to_be_clickable(self.GENDER_FEMALE)).click()
-        else:
-            self.wait.until(EC.element_to_be_clickable(self.GENDER_MALE)).click()
-
-        self._wait_loader_gone()
-        self.driver.find_element(*self.SAVE_BTN).click()
-
-        self.wait.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
+        self._step("set_personal_details/Nationality",
+                   lambda: self._select_from_custom_dropdown(self.NATIONALITY_DD_ICON, nationality))
+        self._step("set_personal_details/Marital Status",
+                   lambda: self._select_from_custom_dropdown(self.MARITAL_STATUS_DD_ICON, marital_status))
+
+        def _fill_dob():
+            dob_el = self.wait.until(EC.visibility_of_element_located(self.DOB_INPUT))
+            dob_el.clear()
+            dob_el.send_keys(to_display(dob, dob_el.get_attribute("placeholder")))
+        self._step("set_personal_details/Date of Birth", _fill_dob)
+
+        gender_radio = self.GENDER_FEMALE if gender.lower().startswith("f") else self.GENDER_MALE
+        self._step("set_personal_details/Gender",
+                   lambda: self.wait.until(EC.element_to_be_clickable(gender_radio)).click())
+
+        def _save():
+            self._wait_loader_gone()
+            self.driver.find_element(*self.SAVE_BTN).click()
+            self.wait.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
+        self._step("set_personal_details/Save", _save)
         self._wait_toast_gone()
         self._wait_loader_gone()
         return True
 
+    def read_personal_details(self) -> dict:
+        """Current values of every field in the Personal Details card (one script call); dates as ISO."""
+        snap = read_card(self.driver, "Personal Details")
+        if snap.get("Date of Birth"):
+            placeholder = self.driver.find_element(*self.DOB_INPUT).get_attribute("placeholder")
+            snap["Date of Birth"] = to_iso(snap["Date of Birth"], placeholder)
+        return snap
+
     def add_attachment(self, file_path: str, comment: str = "") -> bool:
         """
         Attach a file in the Attachments card, EXPLICITLY scroll back down, click Save,
@@ -319,8 +347,10 @@ class EmployeePersonalPage:
         # Wait until the Save is truly enabled (handles aria-disabled / pointer-events)
         WebDriverWait(self.driver, 10).until(lambda d: self._is_button_enabled(save_btn))
 
-        # Click Save (robust helper still handles overlays & re-render edge cases)
-        self._click_attachments_save()
+        # Click Save (robust helper still handles overlays & re-render edge cases).
+        # Only the click is retried — once it lands, a second Save would add a duplicate row.
+        self._step("add_attachment/Save", self._click_attachments_save,
+                   retry_on=(AssertionError,) + RETRYABLE)
 
         # Verify toast and row in table
         self.wait.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
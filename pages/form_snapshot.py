@@ -0,0 +1,111 @@
+# pages/form_snapshot.py
+"""
+Read every labelled field of an OrangeHRM card with ONE execute_script call.
+
+    snap = read_card(driver, "Personal Details")
+    # {"Nationality": "South African", "Marital Status": "Single",
+    #  "Date of Birth": "1995-05-05", "Gender": "Female",
+    #  "Employee Full Name": {"firstName": "Jane1234", "middleName": "QA", "lastName": "Tester"}, ...}
+
+Values: text inputs/textarea → value; OrangeHRM selects → the shown option
+("" for "-- Select --"); radio groups → label of the checked radio; checkboxes → bool;
+a group with several text inputs → {input name: value}.
+
+Date inputs show the instance's localization format (yyyy-mm-dd, dd-mm-yyyy,
+yyyy-dd-mm, ...), given by their placeholder. Test data keeps ISO dates, like the
+API; `to_display` formats one for typing and `to_iso` reads a shown one back.
+"""
+import datetime
+import re
+
+_DATE_TOKENS = {"yyyy": "%Y", "mm": "%m", "dd": "%d"}
+
+_READ_CARD_JS = """
+const titles = arguments[0];
+const header = [...document.querySelectorAll('h6')]
+    .find(h => titles.includes(h.textContent.trim()));
+if (!header) return null;
+const card = header.closest('.orangehrm-card-container') || header.closest('form') || header.parentElement;
+const clean = s => (s || '').replace(/\\s+/g, ' ').trim();
+const out = {};
+for (const group of card.querySelectorAll('.oxd-input-group')) {
+    const labelEl = group.querySelector('.oxd-input-group__label-wrapper label') || group.querySelector('label');
+    const label = clean(labelEl && labelEl.textContent).replace(/\\*$/, '').trim();
+    if (!label) continue;
+    const select = group.querySelector('.oxd-select-text-input');
+    const radios = [...group.querySelectorAll('input[type=radio]')];
+    const checkbox = group.querySelector('input[type=checkbox]');
+    const inputs = [...group.querySelectorAll('input:not([type=radio]):not([type=checkbox]):not([type=file]), textarea')];
+    let value;
+    if (select) {
+        value = clean(select.textContent);
+        if (value === '-- Select --') value = '';
+    } else if (radios.length) {
+        const checked = radios.find(r => r.checked);
+        value = checked ? clean((checked.closest('label') || {}).textContent) : '';
+    } else if (checkbox) {
+        value = checkbox.checked;
+    } else if (inputs.length > 1) {
+        value = {};
+        inputs.forEach((el, i) => { value[el.name || String(i)] = el.value; });
+    } else if (inputs.length === 1) {
+        value = inputs[0].value;
+    } else {
+        continue;
+    }
+    out[label] = value;
+}
+return out;
+"""
+
+
+def read_card(driver, *titles: str) -> dict:
+    """Snapshot the fields of the card whose <h6> header is one of `titles`; {} if not found."""
+    return driver.execute_script(_READ_CARD_JS, list(titles)) or {}
+
+
+def _normalized(value):
+    # text inputs come back raw, selects and radios already whitespace-collapsed (clean() above)
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {k: _normalized(v) for k, v in value.items()}
+    return value
+
+
+def _date_pattern(placeholder: str | None) -> str:
+    """strftime pattern for a date input placeholder such as "dd-mm-yyyy" (none: ISO)."""
+    text = (placeholder or "yyyy-mm-dd").strip().lower()
+    parts = re.findall(r"yyyy|mm|dd|[^ymd]+", text)
+    if "".join(parts) != text or sorted(p for p in parts if p in _DATE_TOKENS) != ["dd", "mm", "yyyy"]:
+        raise ValueError(f"Unsupported date format {placeholder!r}; expected yyyy, mm and dd with separators")
+    return "".join(_DATE_TOKENS.get(p, p.replace("%", "%%")) for p in parts)
+
+
+def to_display(iso_date: str, placeholder: str | None) -> str:
+    """ISO date ("1995-03-17") as typed into an input with this placeholder ("17-03-1995")."""
+    return datetime.date.fromisoformat(iso_date).strftime(_date_pattern(placeholder))
+
+
+def to_iso(shown: str, placeholder: str | None) -> str:
+    """A date input's value back in ISO form; "" stays "", anything unparsable is returned as is."""
+    shown = shown.strip()
+    if not shown:
+        return ""
+    try:
+        return datetime.datetime.strptime(shown, _date_pattern(placeholder)).date().isoformat()
+    except ValueError:
+        return shown
+
+
+def snapshot_mismatches(snapshot: dict, expected: dict) -> dict:
+    """
+    {label: (expected, actual)} for every expected label whose value differs; a label
+    missing from the snapshot is reported with actual None. Strings are compared with
+    runs of whitespace collapsed and the ends stripped, as the page displays them.
+    """
+    return {
+        label: (want, snapshot.get(label))
+        for label, want in expected.items()
+        if label not in snapshot or _normalized(snapshot[label]) != _normalized(want)
+    }
@@ -5,7 +5,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import ActionChains
+from selenium.webdriver.common.keys import Keys
+from pages.form_snapshot import read_card, to_display, to_iso
 from utils import config
+from utils.steps import run_step
 
 
 class JobDetailsPage:
@@ -62,6 +65,18 @@ class JobDetailsPage:
         except TimeoutException:
             pass
 
+    def _reset_ready(self):
+        """Readiness reset between step retries: close any open dropdown, let overlays settle."""
+        try:
+            ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+        except Exception:
+            pass
+        self._wait_loader_gone()
+        self._wait_toast_gone()
+
+    def _step(self, name: str, action):
+        return run_step(f"JobDetailsPage.set_job_details/{name}", action, reset=self._reset_ready)
+
     def _open_job_tab(self):
         self.wait.until(EC.element_to_be_clickable(self.JOB_TAB)).click()
         self._wait_loader_gone()
@@ -142,27 +157,39 @@ class JobDetailsPage:
         """
         Fill the Job tab and save. Any dropdown param can be '*' to pick the first valid option.
         """
+        # Each numbered block is one retryable step (see utils/steps.py)
         # 1) Open Job tab
-        self._open_job_tab()
+        self._step("open tab", self._open_job_tab)
 
         # 2) Joined Date
-        date_el = self.wait.until(EC.visibility_of_element_located(self.JOINED_DATE_INPUT))
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", date_el)
-        date_el.clear()
-        date_el.send_keys(joined_date)
+        def _fill_joined_date():
+            date_el = self.wait.until(EC.visibility_of_element_located(self.JOINED_DATE_INPUT))
+            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", date_el)
+            date_el.clear()
+            date_el.send_keys(to_display(joined_date, date_el.get_attribute("placeholder")))
+        self._step("Joined Date", _fill_joined_date)
 
         # 3) Dropdowns
-        picked_title = self._select_dropdown_by_label("Job Title", job_title)
-        picked_cat   = self._select_dropdown_by_label("Job Category", job_category)
-        picked_unit  = self._select_dropdown_by_label("Sub Unit", sub_unit)
-        picked_loc   = self._select_dropdown_by_label("Location", location)
-        picked_stat  = self._select_dropdown_by_label("Employment Status", employment_status)
-
-        # 4) Save
-        self._robust_click_job_save()
-
-        # 5) Verify success toast
-        self.wait.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
+        picked_title = self._step("Job Title", lambda: self._select_dropdown_by_label("Job Title", job_title))
+        picked_cat   = self._step("Job Category", lambda: self._select_dropdown_by_label("Job Category", job_category))
+        picked_unit  = self._step("Sub Unit", lambda: self._select_dropdown_by_label("Sub Unit", sub_unit))
+        picked_loc   = self._step("Location", lambda: self._select_dropdown_by_label("Location", location))
+        picked_stat  = self._step("Employment Status",
+                                  lambda: self._select_dropdown_by_label("Employment Status", employment_status))
+
+        # 4) Save + 5) Verify success toast (a repeated Save is harmless: it re-submits the same values)
+        def _save():
+            self._robust_click_job_save()
+            self.wait.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
+        self._step("Save", _save)
         self._wait_toast_gone()
         self._wait_loader_gone()
         return True
+
+    def read_job_details(self) -> dict:
+        """Current values of every field in the Job card (one script call); dates as ISO."""
+        snap = read_card(self.driver, "Job", "Job Details")
+        if snap.get("Joined Date"):
+            placeholder = self.driver.find_element(*self.JOINED_DATE_INPUT).get_attribute("placeholder")
+            snap["Joined Date"] = to_iso(snap["Joined Date"], placeholder)
+        return snap
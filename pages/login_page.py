@@ -0,0 +1,28 @@
+# pages/login_page.py
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils import config
+
+
+class LoginPage:
+    USERNAME_INPUT   = (By.NAME, "username")
+    PASSWORD_INPUT   = (By.NAME, "password")
+    LOGIN_BTN        = (By.CSS_SELECTOR, "button[type='submit']")
+    DASHBOARD_HEADER = (By.XPATH, "//h6[normalize-space()='Dashboard']")
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.wait = WebDriverWait(driver, config.DEFAULT_WAIT)
+
+    def login(self, username: str | None = None, password: str | None = None) -> bool:
+        """Open the login screen, sign in and wait for the Dashboard."""
+        self.driver.get(config.BASE_URL)
+        self.wait.until(EC.visibility_of_element_located(self.USERNAME_INPUT)).send_keys(
+            username or config.USERNAME
+        )
+        self.driver.find_element(*self.PASSWORD_INPUT).send_keys(password or config.PASSWORD)
+        self.driver.find_element(*self.LOGIN_BTN).click()
+        self.wait.until(EC.visibility_of_element_located(self.DASHBOARD_HEADER))
+        return True
@@ -25,6 +25,7 @@ class PIMPage:
         "//h5[normalize-space()='Employee Information'] | //h6[normalize-space()='Employee Information']"
     )
     ADD_EMP_HEADER = (By.XPATH, "//h6[normalize-space()='Add Employee']")
+    PERSONAL_DETAILS_HEADER = (By.XPATH, "//h6[normalize-space()='Personal Details']")
 
     # Transient overlays
     LOADER = (By.CSS_SELECTOR, "div.oxd-form-loader")
@@ -95,3 +96,10 @@ class PIMPage:
 
         self.wait.until(EC.visibility_of_element_located(self.ADD_EMP_HEADER))
         return True
+
+    def open_employee(self, emp_number: int) -> bool:
+        """Deep-link to an existing employee's Personal Details screen."""
+        self.driver.get(f"{config.APP_URL}/pim/viewPersonalDetails/empNumber/{emp_number}")
+        self._wait_overlay_gone()
+        self.wait.until(EC.visibility_of_element_located(self.PERSONAL_DETAILS_HEADER))
+        return True
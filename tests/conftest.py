@@ -0,0 +1,34 @@
+# tests/conftest.py
+"""
+Fixtures for the unit tests that run against tools.stub_server.
+
+Kept here rather than in the project conftest: `pytest tests/` makes tests/ the
+rootdir (tests/pytest.ini), and the project conftest is not loaded then.
+"""
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def stub_server():
+    """An in-process OrangeHRM stand-in on a free port; yields (app_url, state)."""
+    from tools.stub_server import make_server
+
+    server, state = make_server(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/web/index.php", state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def stub_api(stub_server):
+    """An HrmApi logged in to the stub server."""
+    from utils.hrm_api import HrmApi
+
+    api = HrmApi(stub_server[0]).login("Admin", "admin123")
+    yield api
+    api.session.close()
@@ -0,0 +1,42 @@
+# tests/test_api_verify.py
+import pytest
+
+from utils.api_verify import EmployeeChecks
+
+
+@pytest.fixture
+def counted_api(stub_api):
+    calls = []
+    stub_api.session.hooks["response"].append(lambda r, *a, **k: calls.append(r.url))
+    return stub_api, calls
+
+
+def test_checks_are_batched_per_resource(counted_api):
+    api, calls = counted_api
+    emp = api.create_employee("Jane1234", "QA", "Tester")
+    api.update_job_details(emp["empNumber"], joinedDate="2025-01-11", jobTitleId=1, jobCategoryId=1,
+                           subunitId=1, locationId=1, empStatusId=1)
+    calls.clear()
+
+    checks = EmployeeChecks(api)
+    checks.exists(first="Jane1234", middle="QA", last="Tester")
+    checks.fields(emp["empNumber"], first_name="Jane1234", last_name="Tester",
+                  job_title="QA Engineer", sub_unit="Quality Assurance", employment_status="Full-Time Contract")
+    assert checks.assert_all()
+    # one search + personal-details + job-details, however many fields were checked
+    assert len(calls) == 3
+
+
+def test_failures_name_field_and_values(stub_api):
+    api = stub_api
+    emp = api.create_employee("Jane5678", "QA", "Tester")
+
+    failures = (EmployeeChecks(api)
+                .exists(first="Jane5678", last="Somebody-else")
+                .fields(emp["empNumber"], job_title="QA Engineer", attachment="cv.pdf")
+                .verify())
+    assert len(failures) == 3
+    assert any("job_title is None" in f for f in failures)
+
+    with pytest.raises(ValueError):
+        EmployeeChecks(api).fields(emp["empNumber"], shoe_size=42)
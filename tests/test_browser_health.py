@@ -0,0 +1,78 @@
+# tests/test_browser_health.py
+from utils.browser_health import BrowserPool, HealthLimits, format_health, _slope
+
+MB = 1024 * 1024
+
+
+class FakeExecutor:
+    def execute(self, command, params):
+        return {"value": None}
+
+
+class FakeDriver:
+    """Heap grows by 40 MB per test; every test sends 10 commands."""
+    created = 0
+
+    def __init__(self):
+        FakeDriver.created += 1
+        self.command_executor = FakeExecutor()
+        self.heap = 0
+        self.quit_called = False
+
+    def run_test(self):
+        for _ in range(10):
+            self.command_executor.execute("findElement", {})
+        self.heap += 40 * MB
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.command_executor.execute("executeCdpCommand", {"cmd": cmd})
+        return {"metrics": [{"name": "JSHeapUsedSize", "value": self.heap}, {"name": "Nodes", "value": 900}]}
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_reuses_browser_until_a_limit_is_passed():
+    resets = []
+    pool = BrowserPool(FakeDriver, HealthLimits(rss_mb=0, js_heap_mb=100, dom_nodes=0, commands=0),
+                       reset=resets.append)
+    first = pool.acquire()
+    outcomes = []
+    for i in range(4):
+        d = pool.acquire()
+        d.run_test()
+        outcomes.append((d is first, pool.release(f"t{i}")[1]))
+
+    # heap 40, 80 -> reused; 120 -> recycled; the 4th test gets a fresh browser
+    assert [o[0] for o in outcomes] == [True, True, True, False]
+    assert outcomes[2][1] == "120 MB JS heap >= 100"
+    assert first.quit_called and len(resets) == 3
+    assert [(r.browser, r.tests, r.test) for r in pool.recycles] == [(1, 3, "t2")]
+
+    trend = pool.trends()[0]
+    assert trend["commands"] == 30                      # sampling commands are not counted
+    assert trend["js_heap_mb"] == {"first": 40.0, "last": 120.0, "per_test": 40.0}
+
+
+def test_command_limit_and_failed_reset_recycle():
+    def broken_reset(driver):
+        raise RuntimeError("session deleted")
+
+    pool = BrowserPool(FakeDriver, HealthLimits(rss_mb=0, js_heap_mb=0, dom_nodes=0, commands=15),
+                       reset=lambda d: None)
+    pool.acquire().run_test()
+    assert pool.release("a")[1] is None
+    pool.acquire().run_test()
+    assert pool.release("b")[1] == "20 commands >= 15"
+
+    pool.reset = broken_reset
+    pool.acquire()
+    pool.release("c")
+    assert pool.recycles[-1].reason == "reset failed: RuntimeError"
+    lines = format_health({"gw0": {"trends": pool.trends(), "recycles": [vars(r) for r in pool.recycles]}})
+    assert any("recycled after 2 test(s) (b): 20 commands >= 15" in line for line in lines)
+
+
+def test_slope_is_growth_per_test():
+    assert _slope([100, 110, 120, 130]) == 10
+    assert _slope([5]) == 0.0
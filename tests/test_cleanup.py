@@ -0,0 +1,52 @@
+# tests/test_cleanup.py
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.cleanup import _to_b36, delete_employees, find_orphans, new_tag, tag_created_at
+
+
+def test_tag_fits_employee_id_and_encodes_creation_hour():
+    now = time.time()
+    tag = new_tag("QA", now)
+    assert len(tag) == 10 and tag.startswith("QA")
+    created = tag_created_at(tag, "QA")
+    assert 0 <= created.timestamp() - now < 3600     # rounded up: never older than it is
+    assert tag_created_at("0042", "QA") is None
+    legacy = "QA" + _to_b36(int(now // 60), 6) + "a7"      # minute + 2 random chars
+    assert abs(tag_created_at(legacy, "QA").timestamp() - now) < 60
+
+
+def test_tags_do_not_repeat_at_load_generator_rates():
+    now = time.time()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tags = list(pool.map(lambda _: new_tag("QA", now), range(20_000)))
+    assert len(set(tags)) == len(tags)
+
+
+def test_sweep_by_age_and_name_pattern_in_batches(stub_server, stub_api):
+    _, state = stub_server
+    api = stub_api
+    two_days_ago = time.time() - 2 * 86400
+    old = [api.create_employee(f"Jane{i}", "QA", "Tester", new_tag("QA", two_days_ago))["empNumber"]
+           for i in range(1000, 1005)]
+    fresh = api.create_employee("Jane2000", "QA", "Tester", new_tag("QA"))["empNumber"]
+    legacy = api.create_employee("Jane777", "QA", "Tester")["empNumber"]
+    real = api.create_employee("Thandi", "", "Mokoena")["empNumber"]
+
+    day = datetime.timedelta(days=1)
+    assert sorted(find_orphans(api, "QA", day)) == old
+    with_legacy = find_orphans(api, "QA", day, name_pattern=r"^Jane\d{3,5} QA Tester$")
+    assert sorted(with_legacy) == sorted(old + [legacy])
+
+    report = delete_employees(api, with_legacy, batch_size=2)
+    assert (report.found, report.removed, report.failed) == (6, 6, [])
+    assert sorted(state.employees) == sorted([fresh, real])
+
+
+def test_tag_prefix_longer_than_two_characters_is_rejected():
+    assert len(new_tag("Q")) == 9
+    with pytest.raises(ValueError, match="at most 2 characters"):
+        new_tag("QAX")
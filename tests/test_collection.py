@@ -0,0 +1,30 @@
+# tests/test_collection.py
+import os
+import subprocess
+import sys
+
+import pytest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_COLLECT = """
+import sys
+import pytest
+sys.path.insert(0, {root!r})
+code = pytest.main(["--collect-only", "-q", "-p", "no:cacheprovider", *{args!r}])
+browser = sorted(m for m in sys.modules if m.split(".")[0] == "selenium" or m.startswith("pages."))
+print("EXIT", int(code), "BROWSER", ",".join(browser))
+"""
+
+
+@pytest.mark.parametrize("args", [["tests"], []], ids=["tests-dir", "project-root"])
+def test_collection_does_not_import_the_browser_stack(args, tmp_path):
+    env = {k: v for k, v in os.environ.items() if k not in ("BASE_URL", "HRM_USERNAME", "HRM_PASSWORD")}
+    env["REPORTS_DIR"] = str(tmp_path)
+    proc = subprocess.run([sys.executable, "-c", _COLLECT.format(root=_ROOT, args=args)],
+                          cwd=_ROOT, env=env, capture_output=True, text=True)
+    last = proc.stdout.strip().splitlines()[-1]
+    assert last.startswith("EXIT 0 "), proc.stdout[-2000:] + proc.stderr[-2000:]
+    loaded = [m for m in last.split("BROWSER ", 1)[1].split(",") if m]
+    # pages.form_snapshot is plain data handling, the rest would drag in Selenium
+    assert [m for m in loaded if m != "pages.form_snapshot"] == []
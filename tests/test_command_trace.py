@@ -0,0 +1,104 @@
+# tests/test_command_trace.py
+import os
+
+from utils.command_trace import _ROOT, CommandTrace, _call_site, analyze, rank
+
+EL = "element-6066-11e4-a52f-4d8b9f0e6a1a"
+
+
+class FakeExecutor:
+    def execute(self, command, params):
+        if command == "findElement":
+            return {"value": {EL: f"el-{params['value']}"}}
+        return {"value": None}
+
+
+class FakeDriver:
+    def __init__(self):
+        self.command_executor = FakeExecutor()
+
+
+def find(seq, locator, ms=20.0, wait_id=None, wait=None, found=None):
+    rec = {"seq": seq, "cmd": "findElement", "ms": ms, "site": f"Page.m:{seq}", "locator": locator}
+    if wait_id is not None:
+        rec.update(wait_id=wait_id, wait=wait)
+    if found:
+        rec["found"] = found
+    return rec
+
+
+def test_trace_records_commands_and_detaches():
+    d = FakeDriver()
+    trace = CommandTrace("t::one").attach(d)
+    d.command_executor.execute("findElement", {"using": "xpath", "value": "//button"})
+    d.command_executor.execute("clickElement", {"id": "el-//button"})
+    trace.detach()
+    d.command_executor.execute("clickElement", {"id": "el-//button"})
+
+    assert [r["cmd"] for r in trace.records] == ["findElement", "clickElement"]
+    assert trace.records[0]["locator"] == "xpath=//button"
+    assert trace.records[0]["found"] == "el-//button"
+    assert trace.records[1]["element"] == "el-//button"
+    assert trace.records[0]["site"].startswith("test_trace_records_commands_and_detaches:")
+
+
+def test_analyze_finds_each_kind_of_waste():
+    records = [
+        # wait polls twice, then the page object finds the same locator again
+        find(0, "xpath=//h6", wait_id=1, wait="visibility_of_element_located"),
+        find(1, "xpath=//h6", wait_id=1, wait="visibility_of_element_located"),
+        find(2, "xpath=//h6", ms=30.0),
+        # presence_of then element_to_be_clickable on the Save button
+        find(3, "xpath=//button", wait_id=2, wait="presence_of_element_located"),
+        find(4, "xpath=//button", ms=40.0, wait_id=3, wait="element_to_be_clickable", found="b1"),
+        {"seq": 5, "cmd": "executeScript", "ms": 5.0, "site": "Page.a:5", "script": "arguments[0].scrollIntoView();"},
+        {"seq": 6, "cmd": "executeScript", "ms": 6.0, "site": "Page.b:6", "script": "arguments[0].scrollIntoView();"},
+        {"seq": 7, "cmd": "clickElement", "ms": 50.0, "site": "Page.c:7", "element": "b1"},
+        {"seq": 8, "cmd": "clickElement", "ms": 50.0, "site": "Page.c:8", "element": "b1"},
+    ]
+    kinds = {f["kind"]: f for f in analyze(records)}
+
+    assert set(kinds) == {"duplicate lookup", "back-to-back waits", "wasted scroll", "repeated click"}
+    assert kinds["duplicate lookup"]["ms"] == 30.0           # polls inside one wait are not duplicates
+    assert kinds["back-to-back waits"]["ms"] == 40.0
+    assert "presence_of_element_located then element_to_be_clickable" in kinds["back-to-back waits"]["detail"]
+    assert kinds["wasted scroll"]["site"] == "Page.a:5"
+    assert "xpath=//button" in kinds["repeated click"]["detail"]
+
+
+def test_lookup_after_input_is_not_a_duplicate_and_rank_sorts_by_time():
+    records = [
+        find(0, "xpath=//input"),
+        {"seq": 1, "cmd": "sendKeysToElement", "ms": 10.0, "site": "Page.t:1", "element": "x"},
+        find(2, "xpath=//input"),
+    ]
+    assert analyze(records) == []
+
+    ranked = rank([
+        {"kind": "duplicate lookup", "site": "A", "detail": "d", "ms": 5.0, "test": "t1"},
+        {"kind": "repeated click", "site": "B", "detail": "d", "ms": 30.0, "test": "t1"},
+        {"kind": "duplicate lookup", "site": "A", "detail": "d", "ms": 5.0, "test": "t2"},
+    ])
+    assert [(a["site"], a["count"], a["ms"]) for a in ranked] == [("B", 1, 30.0), ("A", 2, 10.0)]
+
+
+def _compiled(source, filename, **names):
+    namespace = dict(names)
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace
+
+
+def test_repo_helper_whose_path_contains_tests_does_not_stop_the_frame_walk():
+    # selenium's side of the call: execute() is what a traced command runs
+    selenium = _compiled("def execute():\n    return call_site()\n\ndef find():\n    return execute()\n",
+                         "/venv/selenium/webdriver/remote/webdriver.py", call_site=_call_site)
+    # a repo helper outside tests/ whose file name merely contains "tests"
+    helper = _compiled("def poll():\n    return find()\n",
+                       os.path.join(_ROOT, "tools", "latests.py"), find=selenium["find"])
+    wait = _compiled("def until(condition):\n    return condition()\n",
+                     "/venv/selenium/webdriver/support/wait.py")
+
+    site, _, wait_frame = wait["until"](helper["poll"])
+
+    assert site == "poll:2"
+    assert wait_frame is not None and wait_frame.f_code.co_name == "until"
@@ -0,0 +1,42 @@
+# tests/test_config.py
+import pytest
+
+from utils import config
+
+
+@pytest.fixture
+def fresh_config(monkeypatch):
+    config.reset()
+    yield monkeypatch
+    monkeypatch.undo()
+    config.reset()
+
+
+def test_optional_settings_do_not_need_credentials(fresh_config):
+    for name in ("BASE_URL", "HRM_USERNAME", "HRM_PASSWORD"):
+        fresh_config.delenv(name, raising=False)
+    fresh_config.delenv("REPORTS_DIR", raising=False)
+    fresh_config.setenv("DEFAULT_WAIT", "7")
+    assert config.DEFAULT_WAIT == 7
+    assert config.REPORTS_DIR == "reports"
+    with pytest.raises(RuntimeError, match="BASE_URL, HRM_USERNAME, HRM_PASSWORD"):
+        config.BASE_URL
+
+
+def test_credentials_are_resolved_together_and_cached(fresh_config):
+    fresh_config.setenv("BASE_URL", "https://hrm.example/")
+    fresh_config.setenv("HRM_USERNAME", "admin")
+    fresh_config.setenv("HRM_PASSWORD", "secret")
+    assert config.USERNAME == "admin"
+    assert vars(config)["BASE_URL"] == "https://hrm.example/web/index.php/auth/login"
+    assert config.APP_URL == "https://hrm.example/web/index.php"
+    fresh_config.setenv("HRM_USERNAME", "changed")
+    assert config.USERNAME == "admin"      # cached until reset()
+    config.validate()
+    assert "LOG_BACKUPS" in vars(config)
+
+
+def test_unknown_setting():
+    with pytest.raises(AttributeError):
+        config.NOT_A_SETTING
+    assert "DEFAULT_WAIT" in dir(config)
@@ -0,0 +1,51 @@
+# tests/test_data_generator.py
+from utils.test_data import Catalog, EmployeeDataGenerator, Permutation
+
+
+def test_permutation_is_a_bijection_and_invertible():
+    for size in (10, 1000, 12345):
+        perm = Permutation(size, seed=3)
+        values = [perm[i] for i in range(size)]
+        assert sorted(values) == list(range(size))
+        assert all(perm.index(v) == i for i, v in enumerate(values))
+
+
+def test_records_are_reproducible_unique_and_random_access():
+    gen = EmployeeDataGenerator(seed=42)
+    again = EmployeeDataGenerator(seed=42)
+    assert gen[123_456] == again[123_456]
+    assert gen[5] != EmployeeDataGenerator(seed=43)[5]
+
+    firsts = [r.first for r in gen.stream(0, 20_000)]
+    assert len(set(firsts)) == len(firsts)
+    assert gen.index_of(gen[9_999_999].first) == 9_999_999
+
+    rec = gen[7]
+    assert rec.joined_date > rec.dob
+    assert set(rec.personal_details()) == {"nationality", "marital_status", "dob", "gender"}
+    assert rec.job_form()["Job Title"] == rec.job_title
+
+
+def test_dates_cover_the_whole_day_range():
+    records = list(EmployeeDataGenerator(seed=5).stream(0, 2_000))
+    assert all(rec.joined_date > rec.dob for rec in records)
+    days = {int(rec.dob[8:]) for rec in records}
+    assert days == set(range(1, 32))        # days past 12 too: the pages format them per instance
+
+
+def test_worker_slices_do_not_overlap():
+    a = EmployeeDataGenerator(seed=1, offset=0, stride=2)
+    b = EmployeeDataGenerator(seed=1, offset=1, stride=2)
+    taken_a = {a.take().index for _ in range(50)}
+    taken_b = {b.take().index for _ in range(50)}
+    assert not taken_a & taken_b
+    assert taken_a == set(range(0, 100, 2))
+
+
+def test_catalog_from_api_uses_instance_options(stub_api):
+    catalog = Catalog.from_api(stub_api)
+    assert catalog.locations == ("New York Sales Office", "Texas R&D")
+    assert "Account Assistant" in catalog.job_titles
+    assert catalog.first_names == Catalog().first_names
+    gen = EmployeeDataGenerator(seed=9, catalog=catalog)
+    assert {r.location for r in gen.stream(0, 200)} == set(catalog.locations)
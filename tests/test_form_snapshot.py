@@ -0,0 +1,69 @@
+# tests/test_form_snapshot.py
+import pytest
+
+from pages.form_snapshot import snapshot_mismatches, to_display, to_iso
+
+SNAPSHOT = {
+    "Nationality": "South African",
+    "Marital Status": "Single",
+    "Date of Birth": "1995-05-05",
+    "Driver's License Number": "",
+    "Smoker": False,
+    "Employee Full Name": {"firstName": "Jane1234", "middleName": "QA", "lastName": "Tester"},
+}
+
+
+def test_equal_values_match():
+    expected = {"Nationality": "South African", "Smoker": False, "Driver's License Number": "",
+                "Employee Full Name": {"firstName": "Jane1234", "middleName": "QA", "lastName": "Tester"}}
+    assert snapshot_mismatches(SNAPSHOT, expected) == {}
+    assert snapshot_mismatches(SNAPSHOT, {}) == {}
+
+
+def test_differing_values_are_reported_expected_first():
+    expected = {"Marital Status": "Married", "Smoker": True, "Nationality": "South African",
+                "Employee Full Name": {"firstName": "Jane1234", "middleName": "", "lastName": "Tester"}}
+    assert snapshot_mismatches(SNAPSHOT, expected) == {
+        "Marital Status": ("Married", "Single"),
+        "Smoker": (True, False),
+        "Employee Full Name": (expected["Employee Full Name"], SNAPSHOT["Employee Full Name"]),
+    }
+
+
+def test_missing_labels_are_reported_even_when_empty_is_expected():
+    expected = {"Blood Type": "A+", "Military Service": "", "Nationality": "South African"}
+    assert snapshot_mismatches(SNAPSHOT, expected) == {
+        "Blood Type": ("A+", None),
+        "Military Service": ("", None),
+    }
+
+
+def test_whitespace_only_differences_are_ignored():
+    snapshot = {"Other Id": "  QA-42 ", "Job Title": "QA  Engineer",
+                "Employee Full Name": {"firstName": "Jane1234 ", "lastName": "Tester"}}
+    expected = {"Other Id": "QA-42", "Job Title": "QA Engineer",
+                "Employee Full Name": {"firstName": "Jane1234", "lastName": "Tester"}}
+    assert snapshot_mismatches(snapshot, expected) == {}
+    assert snapshot_mismatches(snapshot, {"Job Title": "QAEngineer"}) == {
+        "Job Title": ("QAEngineer", "QA  Engineer"),
+    }
+
+
+@pytest.mark.parametrize("placeholder, shown", [
+    ("yyyy-mm-dd", "1995-03-17"),
+    ("yyyy-dd-mm", "1995-17-03"),
+    ("dd-mm-yyyy", "17-03-1995"),
+    ("mm/dd/yyyy", "03/17/1995"),
+    ("yyyy mm dd", "1995 03 17"),
+    (None, "1995-03-17"),
+])
+def test_dates_follow_the_input_placeholder(placeholder, shown):
+    assert to_display("1995-03-17", placeholder) == shown
+    assert to_iso(f" {shown} ", placeholder) == "1995-03-17"
+
+
+def test_unreadable_dates_are_kept_for_the_mismatch_report():
+    assert to_iso("", "dd-mm-yyyy") == ""
+    assert to_iso("31-31-1995", "dd-mm-yyyy") == "31-31-1995"
+    with pytest.raises(ValueError, match="Unsupported date format"):
+        to_display("1995-03-17", "D, d M Y")
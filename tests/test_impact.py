@@ -0,0 +1,163 @@
+# tests/test_impact.py
+import os
+import textwrap
+
+from utils.impact import (Changes, CallRecorder, _read_test, changed_symbols, classify_changes, load_map,
+                          names_in_tests, parse_diff, select_tests, update_map)
+
+PAGE = textwrap.dedent('''\
+    from selenium.webdriver.common.by import By
+
+    _JS = "return 1;"
+
+
+    class JobPage:
+        """Job tab."""
+        SAVE_BTN = (By.XPATH, "//button")
+        TITLE = (By.NAME, "title")
+
+        def save(self):
+            self.driver.find_element(*self.SAVE_BTN).click()
+
+        def set_title(self, title):
+            self.driver.find_element(*self.TITLE).send_keys(title)
+            self.save()
+
+        def read(self):
+            return self.driver.execute_script(_JS)
+    ''')
+
+
+def _line(text: str) -> int:
+    return next(i for i, line in enumerate(PAGE.splitlines(), 1) if text in line)
+
+
+def test_parse_diff_collects_old_and_new_lines():
+    diff = textwrap.dedent("""\
+        diff --git a/pages/job.py b/pages/job.py
+        index 1..2 100644
+        --- a/pages/job.py
+        +++ b/pages/job.py
+        @@ -8 +8 @@ class JobPage:
+        @@ -20,0 +21,2 @@
+        @@ -30,3 +32,0 @@
+        diff --git a/conftest.py b/conftest.py
+        @@ -1,2 +1,2 @@
+        """)
+    files = parse_diff(diff)
+    assert files["pages/job.py"] == ({8, 30, 31, 32}, {8, 21, 22})
+    assert files["conftest.py"] == ({1, 2}, {1, 2})
+
+
+def test_changed_symbols_maps_methods_locators_and_constants():
+    assert changed_symbols(PAGE, {_line("def set_title") + 1}) == {"JobPage.set_title"}
+    assert changed_symbols(PAGE, {_line("SAVE_BTN =")}) == {"JobPage.save"}
+    assert changed_symbols(PAGE, {_line("_JS =")}) == {"JobPage.read"}
+    assert changed_symbols(PAGE, {_line('"""Job tab')}) == set()          # docstrings don't matter
+    assert changed_symbols(PAGE, {1}) == {"JobPage.save", "JobPage.set_title", "JobPage.read"}
+    assert changed_symbols("def broken(:\n", {1}) == {"*"}
+
+
+def test_classify_changes_falls_back_to_full_run_for_shared_code():
+    sources = {"pages/job.py": PAGE}
+    diff = {"pages/job.py": (set(), {_line("TITLE =")}), "README.md": (set(), {1}),
+            "tests/test_job_tab.py": (set(), {3})}
+    changes = classify_changes(diff, "main", sources.get, sources.get)
+    assert changes.full_run is None
+    assert changes.symbols == {"JobPage.set_title"}
+    assert changes.test_files == {"tests/test_job_tab.py"}
+
+    diff["utils/config.py"] = ({4}, {4})
+    assert "utils/config.py" in classify_changes(diff, "main", sources.get, sources.get).full_run
+
+
+def test_tools_changes_select_the_tests_that_import_them():
+    nodeids = ["tests/test_loadgen.py::test_http_mode_against_stub_server",
+               "tests/test_report_store.py::test_dashboard", "tests/test_login.py::test_login"]
+    impact = {base: set() for base in nodeids}
+    for path in ("tools/stub_server.py", "tools/loadgen.py", "tools/report_dashboard.py"):
+        changes = classify_changes({path: ({1}, {1})}, "main", lambda p: None, lambda p: None)
+        assert changes.full_run == f"shared code changed: {path}"
+        assert list(select_tests(nodeids, impact, changes)) == nodeids
+
+
+def test_select_tests():
+    nodeids = ["tests/test_login.py::test_job[emp-1]", "tests/test_login.py::test_pim",
+               "tests/test_job_tab.py::test_tab", "tests/test_new.py::test_x"]
+    impact = {"tests/test_login.py::test_job": {"LoginPage.login", "JobPage.set_title"},
+              "tests/test_login.py::test_pim": {"LoginPage.login", "PIMPage.go_to_pim"},
+              "tests/test_job_tab.py::test_tab": set()}
+    changes = Changes("main", symbols={"JobPage.set_title"}, test_files={"tests/test_job_tab.py"})
+    keep = select_tests(nodeids, impact, changes)
+    assert list(keep) == ["tests/test_login.py::test_job[emp-1]", "tests/test_job_tab.py::test_tab",
+                          "tests/test_new.py::test_x"]
+    assert keep["tests/test_new.py::test_x"] == "not recorded yet"
+    changes.full_run = "shared code changed: conftest.py"
+    assert list(select_tests(nodeids, impact, changes)) == nodeids
+
+
+LOCATOR_TESTS = textwrap.dedent('''\
+    from utils.locator_check import check_locators, page_locators
+
+    EXPECTED = ("SAVE_BTN", "TITLE")
+
+
+    def test_job_locators():
+        locators = [loc for loc in page_locators(["pages.job"]) if loc[0] == "JobPage"]
+        assert {loc[1] for loc in locators} >= set(EXPECTED)
+
+
+    def test_title_attribute():
+        from pages.job import JobPage
+        assert JobPage.TITLE[0] == "name"
+
+
+    def test_unrelated():
+        assert check_locators({}, []) == []
+    ''')
+
+
+def test_changed_locator_selects_tests_that_read_it_directly():
+    nodeids = ["tests/test_locators.py::test_job_locators", "tests/test_locators.py::test_title_attribute",
+               "tests/test_locators.py::test_unrelated", "tests/test_login.py::test_pim"]
+    impact = {base: set() for base in nodeids}      # recorded, but no page method is ever called
+    diff = {"pages/job.py": ({_line("TITLE =")}, {_line("TITLE =")})}
+    changes = classify_changes(diff, "main", lambda p: PAGE, lambda p: PAGE)
+    assert changes.locators == {"pages.job": {("JobPage", "TITLE")}}
+    sources = {"tests/test_locators.py": LOCATOR_TESTS}
+    keep = select_tests(nodeids, impact, changes, read_source=lambda p: sources.get(p, ""))
+    assert keep == {"tests/test_locators.py::test_job_locators": "reads JobPage.TITLE",
+                    "tests/test_locators.py::test_title_attribute": "reads JobPage.TITLE"}
+
+
+def test_locator_check_is_selected_by_an_add_employee_locator_change():
+    with open(os.path.join(os.path.dirname(__file__), "test_locator_check.py"), encoding="utf-8") as f:
+        refs = names_in_tests(f.read())
+    changes = Changes("main", locators={"pages.add_employee_page": {("AddEmployeePage", "SAVE_BTN")}})
+    nodeid = "tests/test_locator_check.py::test_add_employee_locators_resolve_against_snapshot"
+    keep = select_tests([nodeid], {nodeid: set()}, changes, read_source=_read_test)
+    assert keep == {nodeid: "reads AddEmployeePage.SAVE_BTN"}
+    assert "pages.add_employee_page" in refs["test_add_employee_locators_resolve_against_snapshot"]
+
+
+def test_recorder_collects_page_object_calls(tmp_path):
+    recorder = CallRecorder()
+    recorder.install()
+    from pages import job_details_page
+    from pages.login_page import LoginPage
+
+    page = LoginPage.__new__(LoginPage)
+    recorder.begin()
+    try:
+        LoginPage.__init__(page, driver=None)
+    except Exception:
+        pass
+    recorder.end("tests/test_login.py::test_login[seed-1]")
+    assert recorder.tests == {"tests/test_login.py::test_login": {"LoginPage.__init__"}}
+    assert job_details_page.read_card.__wrapped__   # imported names point at the wrapper too
+
+    path = str(tmp_path / "map.json")
+    recorder.dump(str(tmp_path / "gw0.json"))
+    update_map(path, [str(tmp_path / "gw0.json")])
+    assert load_map(path) == recorder.tests
+
@@ -1,16 +1,15 @@
 # tests/test_job_tab.py
 import logging
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
-from pages.pim_page import PIMPage
-from pages.employee_list_page import EmployeeListPage
 from utils import config
 
 logger = logging.getLogger(__name__)
 
 def _quick_login(driver):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     driver.get(config.BASE_URL)
     WebDriverWait(driver, config.DEFAULT_WAIT).until(
         EC.visibility_of_element_located((By.NAME, "username"))
@@ -23,6 +22,9 @@ def _quick_login(driver):
 
 def test_open_employee_list(driver):
     """Step 10: Click Employee List and verify Employee Information page."""
+    from pages.employee_list_page import EmployeeListPage
+    from pages.pim_page import PIMPage
+
     logger.info("Navigating to Employee List")
     _quick_login(driver)
 
@@ -0,0 +1,49 @@
+# tests/test_loadgen.py
+import argparse
+import random
+
+from tools.loadgen import HttpUser, _EmployeePool, arrival_times, percentile, run_load
+
+
+def test_ramp_then_constant_rate():
+    times = list(arrival_times(rate=10, ramp=4, duration=6))
+    # 20 arrivals under the ramp (area 10*4/2), then 10/s for the last 2 s
+    assert len(times) == 40
+    assert sum(t <= 4 for t in times) == 20
+    assert times == sorted(times) and times[-1] <= 6
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 95) == 0.0
+    assert percentile(list(range(1, 101)), 95) == 95
+    assert percentile([3.0], 50) == 3.0
+
+
+def test_http_mode_against_stub_server(stub_server):
+    app_url, state = stub_server
+    opts = argparse.Namespace(
+        mode="http", users=3, rate=40, ramp=0, duration=1, seed=7,
+        mix="login=1,search=3,add_employee=2,job_details=1",
+        app_url=app_url, username="Admin", password="admin123", tag_prefix="QA",
+    )
+    summary = run_load(opts)
+
+    scenarios = summary["scenarios"]
+    assert sum(s["count"] for s in scenarios.values()) + summary["dropped"] == 40
+    assert all(s["errors"] == 0 for s in scenarios.values())
+    assert scenarios["search"]["server_samples"] >= scenarios["search"]["count"]
+    assert state.employees  # add_employee / job_details really created records
+
+
+def test_login_arrivals_close_the_previous_session(stub_server):
+    app_url, _ = stub_server
+    opts = argparse.Namespace(app_url=app_url, username="Admin", password="admin123", seed=1, tag_prefix="QA")
+    user = HttpUser(opts, _EmployeePool(), random.Random(1))
+    apis = []
+    for scenario in ("login", "search", "login", "login"):
+        user.run(scenario)
+        apis.append(user.api)
+    user.close()
+
+    assert apis[0] is apis[1] and len({id(a) for a in apis}) == 3
+    assert all(not api.session.get_adapter(app_url).poolmanager.pools for api in apis)
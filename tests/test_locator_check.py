@@ -0,0 +1,60 @@
+# tests/test_locator_check.py
+from lxml import html
+
+from utils.locator_check import check_locators, page_locators
+
+ADD_EMPLOYEE_HTML = """
+<html><body>
+<h6 class="oxd-text oxd-text--h6">Add Employee</h6>
+<form>
+  <input name="firstName"><input name="middleName"><input name="lastName">
+  <div class="oxd-input-group">
+    <div><label>Employee Id</label></div>
+    <div><input class="oxd-input" value="0042"></div>
+  </div>
+  <button type="button">Cancel</button>
+  <button type="submit"> Save </button>
+</form>
+</body></html>
+"""
+
+
+def test_add_employee_locators_resolve_against_snapshot():
+    snapshots = {"add_employee": html.fromstring(ADD_EMPLOYEE_HTML)}
+    locators = [loc for loc in page_locators(["pages.add_employee_page"]) if loc[0] == "AddEmployeePage"]
+    results = {r.name: r for r in check_locators(snapshots, locators)}
+
+    assert results["SUCCESS_TOAST"].status == "transient"
+    for name in ("HEADER", "FIRST_NAME", "MIDDLE_NAME", "LAST_NAME", "EMPLOYEE_ID", "SAVE_BTN"):
+        assert results[name].status == "ok", (name, results[name])
+        assert results[name].counts == {"add_employee": 1}
+
+
+def test_missing_ambiguous_and_invalid_are_reported():
+    snapshots = {"add_employee": html.fromstring(ADD_EMPLOYEE_HTML)}
+    locators = [
+        ("AddEmployeePage", "GONE", "xpath", "//h6[normalize-space()='Add Person']"),
+        ("AddEmployeePage", "ANY_BUTTON", "xpath", "//button"),
+        ("AddEmployeePage", "BROKEN", "xpath", "//div[@class='x'"),
+        ("AddEmployeePage", "BY_CSS", "css selector", "button[type='submit']"),
+    ]
+    status = {r.name: r.status for r in check_locators(snapshots, locators)}
+    assert status == {"GONE": "missing", "ANY_BUTTON": "ambiguous", "BROKEN": "invalid", "BY_CSS": "ok"}
+
+
+def test_locator_ambiguous_on_one_of_its_screens_is_reported():
+    snapshots = {
+        "personal_details": html.fromstring("<html><body><button type='submit'>Save</button></body></html>"),
+        "job": html.fromstring("<html><body><form><button type='submit'>Save</button></form>"
+                               "<form><button type='submit'>Save</button></form></body></html>"),
+    }
+    locators = [
+        ("JobDetailsPage", "SAVE", "xpath", "//button[@type='submit']"),
+        ("JobDetailsPage", "FIRST_FORM_SAVE", "xpath", "(//form)[1]//button"),
+    ]
+    results = {r.name: r for r in check_locators(snapshots, locators)}
+
+    assert results["SAVE"].status == "ambiguous"
+    assert results["SAVE"].detail == "2 matches on job"
+    # absent from personal_details (not expected there) and unique on job
+    assert results["FIRST_FORM_SAVE"].status == "ok"
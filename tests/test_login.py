@@ -1,26 +1,23 @@
 # tests/test_login.py
-import logging, random
+# Selenium and the page objects are imported inside the tests, so collecting this
+# module (or running a single test elsewhere) doesn't pay for them.
+import logging
 from utils import config
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from pages.pim_page import PIMPage
-from pages.add_employee_page import AddEmployeePage
-from pages.employee_personal_page import EmployeePersonalPage
 import pytest
 # from pages.employee_job_page import EmployeeJobPage
-from pages.job_details_page import JobDetailsPage
-from pages.employee_list_page import EmployeeListPage
 
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
 def test_can_login(driver):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     logger.info("Navigating to login page")
     driver.get(config.BASE_URL)
 
-    logger.info(f"Logging in with {config.USERNAME}/{config.PASSWORD}")
+    logger.info("Logging in as %s", config.USERNAME)
     WebDriverWait(driver, config.DEFAULT_WAIT).until(
         EC.visibility_of_element_located((By.NAME, "username"))
     ).send_keys(config.USERNAME)
@@ -35,6 +32,10 @@ def test_can_login(driver):
 
 
 def login_quick(driver):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     driver.get(config.BASE_URL)
     WebDriverWait(driver, config.DEFAULT_WAIT).until(
         EC.visibility_of_element_located((By.NAME, "username"))
@@ -46,6 +47,8 @@ def login_quick(driver):
     )
 
 def test_can_navigate_to_pim(driver):
+    from pages.pim_page import PIMPage
+
     logger.info("Step 1–3: Logging in and landing on Dashboard")
     login_quick(driver)
 
@@ -54,7 +57,10 @@ def test_can_navigate_to_pim(driver):
     assert pim.go_to_pim()
     logger.info("✅ Navigated to the PIM page (Employee Information visible)")
 
-def test_can_add_employee(driver):
+def test_can_add_employee(driver, employee_data, employee_tag, track_employee):
+    from pages.add_employee_page import AddEmployeePage
+    from pages.pim_page import PIMPage
+
     logger.info("Login and navigate to Add Employee page")
     login_quick(driver)
 
@@ -65,93 +71,82 @@ def test_can_add_employee(driver):
     add = AddEmployeePage(driver)
     assert add.is_loaded()
 
-    first  = f"Jane{random.randint(100,999)}"
-    middle = "QA"
-    last   = "Tester"
+    first  = employee_data.first
+    middle = employee_data.middle
+    last   = employee_data.last
 
-    logger.info(f"Filling employee details: {first} {middle} {last}")
-    add.fill_employee_details(first, middle, last)
+    logger.info("Filling employee details: %s %s %s", first, middle, last)
+    add.fill_employee_details(first, middle, last, employee_id=employee_tag)
 
     logger.info("Saving new employee record")
     assert add.save_employee()
-    logger.info("✅ Employee successfully saved")
+    emp_number = track_employee(add.get_emp_number())
+    logger.info("✅ Employee successfully saved (empNumber=%s, id=%s)", emp_number, employee_tag)
 
 
-def test_set_personal_details_and_attachments(driver, tmp_path):
-    logger.info("Login → PIM → Add Employee")
-    login_quick(driver)
-    pim = PIMPage(driver)
-    assert pim.go_to_pim()
-    assert pim.open_add_employee()
+def test_set_personal_details_and_attachments(employee_driver, created_employee, hrm_api, tmp_path):
+    from pages.employee_personal_page import EmployeePersonalPage
+    from pages.form_snapshot import snapshot_mismatches
+    from utils.api_verify import EmployeeChecks
 
-    add = AddEmployeePage(driver)
-    assert add.is_loaded()
-
-    # Step 6: create the employee
-    first  = f"Jane{random.randint(1000,9999)}"
-    middle = "QA"
-    last   = "Tester"
-    logger.info(f"Filling employee details: {first} {middle} {last}")
-    add.fill_employee_details(first, middle, last)
-    logger.info("Saving new employee record")
-    assert add.save_employee()
-    logger.info("✅ Employee saved; now on Personal Details screen")
+    driver = employee_driver
+    logger.info("Reusing employee %s %s (empNumber=%s) on Personal Details",
+                created_employee.first, created_employee.last, created_employee.emp_number)
 
     # Step 7: Employment/Personal details
+    data = created_employee.data
     personal = EmployeePersonalPage(driver)
-    logger.info("Setting Personal Details: Nationality=South African, Marital=Single, DOB=1995-05-05, Gender=Female")
-    assert personal.set_personal_details(
-        nationality="South African",
-        marital_status="Single",
-        dob="1995-05-05",
-        gender="Female"
-    )
+    logger.info("Setting Personal Details: %s", data.personal_details())
+    assert personal.set_personal_details(**data.personal_details())
     logger.info("✅ Personal details saved (success toast shown)")
 
+    mismatches = snapshot_mismatches(personal.read_personal_details(), data.personal_form())
+    assert not mismatches, f"Personal Details form differs after save: {mismatches}"
+
     # Step 8: Attachments
     dummy = tmp_path / "attachment.txt"
     dummy.write_text("Demo file for OrangeHRM attachment test (no real info).")
-    logger.info(f"Uploading attachment: {dummy}")
+    logger.info("Uploading attachment: %s", dummy)
     assert personal.add_attachment(str(dummy))
     logger.info("✅ Attachment uploaded and listed in the table")
 
+    # Confirm what was saved with one batched API round (not field-by-field UI reads)
+    assert EmployeeChecks(hrm_api).fields(
+        created_employee.emp_number,
+        **data.personal_details(),
+        attachment=dummy.name,
+    ).assert_all()
 
-def test_set_job_details(driver):
+
+def test_set_job_details(employee_driver, created_employee, hrm_api):
     """
     Step 9: Job tab — fill and save job details, verify success.
     """
-    logger.info("Login → PIM → Add Employee → Save → Job tab")
-    login_quick(driver)
-
-    pim = PIMPage(driver)
-    assert pim.go_to_pim()
-    assert pim.open_add_employee()
-
-    add = AddEmployeePage(driver)
-    assert add.is_loaded()
+    from pages.form_snapshot import snapshot_mismatches
+    from pages.job_details_page import JobDetailsPage
+    from utils.api_verify import EmployeeChecks
 
-    # Create an employee quickly
-    first = f"Jane{random.randint(1000,9999)}"
-    middle = "QA"
-    last = "Tester"
-    logger.info(f"Creating employee for job details: {first} {middle} {last}")
-    add.fill_employee_details(first, middle, last)
-    assert add.save_employee()
-    logger.info("Employee saved; now setting Job details")
+    driver = employee_driver
+    logger.info("Reusing employee %s %s (empNumber=%s); now setting Job details",
+                created_employee.first, created_employee.last, created_employee.emp_number)
 
+    # Values come from the generated record (--data-catalog api to use the instance's own options);
+    # location "*" picks the first available option.
+    data = created_employee.data
     job = JobDetailsPage(driver)
-    assert job.set_job_details(
-        joined_date="2025-01-11",
-        job_title="QA Engineer",
-        job_category="Professionals",
-        sub_unit="Quality Assurance",
-        location="*",                 # use '*' to pick the first available, or put an exact visible option
-        employment_status="Full-Time Contract",  # match exact visible text in your instance
-    )
+    assert job.set_job_details(location=data.location, **data.job_details())
     logger.info("✅ Job details saved (success toast shown)")
 
+    mismatches = snapshot_mismatches(job.read_job_details(), data.job_form())
+    assert not mismatches, f"Job form differs after save: {mismatches}"
+
+    assert EmployeeChecks(hrm_api).fields(created_employee.emp_number, **data.job_details()).assert_all()
+
     def test_open_employee_list(driver):
         """Step 10: Click Employee List and verify Employee Information page."""
+        from pages.employee_list_page import EmployeeListPage
+        from pages.pim_page import PIMPage
+
         logger.info("Navigating to Employee List")
         login_quick(driver)  # this is the helper you already have
         pim = PIMPage(driver)
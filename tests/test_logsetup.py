@@ -0,0 +1,81 @@
+# tests/test_logsetup.py
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.logsetup import in_context, read_log, set_test, start_logging, step
+from utils.step_stats import STATS
+from utils.steps import run_step
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    p = start_logging(str(tmp_path), "gw3", "INFO", max_bytes=2000, backups=5)
+    yield p
+    p.stop()
+    set_test("")
+
+
+def test_records_carry_test_worker_and_step(pipeline):
+    log = logging.getLogger("tests.sample")
+    set_test("tests/test_login.py::test_can_add_employee")
+    log.info("outside %s", "steps")
+    with step("add.fill"):
+        log.info("filling %s %s", "Jane", "Tester")
+        run_step("add.save", lambda: log.warning("saving"))
+    log.debug("below the level %s", object())
+    pipeline.stop()
+    STATS.clear()
+
+    records = read_log(pipeline.path)
+    assert [r["msg"] for r in records] == ["outside steps", "filling Jane Tester", "saving"]
+    assert {r["test"] for r in records} == {"tests/test_login.py::test_can_add_employee"}
+    assert {r["worker"] for r in records} == {"gw3"}
+    assert records[0]["step"] == ""
+    assert records[1]["step"].endswith(":add.fill")
+    assert records[2]["step"].endswith(":add.save") and records[2]["level"] == "WARNING"
+
+
+def test_worker_threads_keep_the_callers_test_and_step(pipeline):
+    log = logging.getLogger("tests.threads")
+    set_test("tests/test_multitab.py::test_flows")
+    with step("bench.flows"):
+        thread = threading.Thread(target=in_context(log.info), args=("from a thread",))
+        thread.start()
+        thread.join()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(in_context(lambda i: log.info("task %d", i)), range(8)))
+    pipeline.stop()
+
+    records = read_log(pipeline.path)
+    assert len(records) == 9
+    assert {r["test"] for r in records} == {"tests/test_multitab.py::test_flows"}
+    assert {r["worker"] for r in records} == {"gw3"}
+    assert len({r["step"] for r in records}) == 1 and records[0]["step"].endswith(":bench.flows")
+
+
+def test_formatting_is_skipped_below_level(pipeline):
+    calls = []
+
+    class Expensive:
+        def __str__(self):
+            calls.append(1)
+            return "expensive"
+
+    log = logging.getLogger("tests.lazy")
+    log.debug("never %s", Expensive())
+    assert calls == []
+    log.info("later %s", Expensive())
+    pipeline.stop()
+    assert read_log(pipeline.path)[-1]["msg"] == "later expensive"
+
+
+def test_rotated_files_are_read_in_order(pipeline):
+    log = logging.getLogger("tests.rotate")
+    for i in range(60):
+        log.info("record %03d", i)
+    pipeline.stop()
+    msgs = [r["msg"] for r in read_log(pipeline.path)]
+    assert msgs == sorted(msgs) and msgs[-1] == "record 059"
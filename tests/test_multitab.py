@@ -0,0 +1,136 @@
+# tests/test_multitab.py
+from utils.multitab import run_interleaved
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        assert handle in self.driver.window_handles, f"no such window: {handle}"
+        self.driver.current_window_handle = handle
+
+    def new_window(self, kind):
+        self.driver.opened += 1
+        handle = f"tab-{self.driver.opened}"
+        self.driver.window_handles.append(handle)
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """Tabs and CDP browser contexts as plain lists; nothing is ever loaded."""
+
+    def __init__(self):
+        self.window_handles = ["home"]
+        self.current_window_handle = "home"
+        self.switch_to = FakeSwitchTo(self)
+        self.opened = 0
+        self.contexts: dict[str, list[str]] = {}
+        self.cdp: list[str] = []
+
+    def get(self, url):
+        pass
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append(cmd)
+        if cmd == "Target.createBrowserContext":
+            context_id = f"ctx-{len(self.contexts) + 1}"
+            self.contexts[context_id] = []
+            return {"browserContextId": context_id}
+        if cmd == "Target.createTarget":
+            self.opened += 1
+            handle = f"target-{self.opened}"
+            self.contexts[params["browserContextId"]].append(handle)
+            self.window_handles.append(handle)
+            return {"targetId": handle}
+        if cmd == "Target.disposeBrowserContext":
+            for handle in self.contexts.pop(params["browserContextId"]):
+                self.window_handles.remove(handle)
+        return {}
+
+
+def ready_after(polls: int):
+    """A wait condition that is falsy for its first `polls` checks, then returns "ready"."""
+    left = [polls]
+
+    def condition(driver):
+        left[0] -= 1
+        return "ready" if left[0] < 0 else False
+    return condition
+
+
+def recording_flow(events, waits):
+    def flow(driver):
+        name = driver.current_window_handle
+        for polls in waits:
+            events.append((name, "wait"))
+            value = yield ready_after(polls)
+            assert value == "ready"
+        events.append((name, "done"))
+    return flow
+
+
+def test_flows_are_interleaved_and_their_tabs_closed():
+    driver = FakeDriver()
+    events = []
+    flows = {"slow": recording_flow(events, [3, 0]), "fast": recording_flow(events, [0, 0])}
+    results = run_interleaved(driver, flows, isolation="tab", timeout=5, poll=0)
+
+    assert [r.name for r in results] == ["fast", "slow"]
+    assert all(r.passed for r in results)
+    # both flows start before either finishes: the slow wait does not block the fast flow
+    assert events.index(("tab-2", "done")) < events.index(("tab-1", "done"))
+    assert events[:2] == [("tab-1", "wait"), ("tab-2", "wait")]
+    assert driver.window_handles == ["home"] and driver.current_window_handle == "home"
+
+
+def test_each_tab_is_closed_when_its_flow_finishes():
+    driver = FakeDriver()
+    open_tabs = []
+
+    def flow(driver):
+        yield None
+        open_tabs.append(len(driver.window_handles))
+
+    results = run_interleaved(driver, {f"f{i}": flow for i in range(3)}, isolation="tab", poll=0)
+    assert [r.passed for r in results] == [True] * 3
+    assert open_tabs == [4, 3, 2]        # home plus the tabs still running
+    assert driver.window_handles == ["home"]
+
+
+def test_timeout_is_thrown_into_the_flow():
+    driver = FakeDriver()
+    caught = []
+
+    def stuck(driver):
+        try:
+            yield lambda d: False
+        except Exception as e:
+            caught.append(type(e).__name__)
+            raise
+
+    results = run_interleaved(driver, {"stuck": stuck, "ok": recording_flow([], [1])},
+                              isolation="context", timeout=0.05, poll=0.01)
+    by_name = {r.name: r for r in results}
+    assert caught == ["TimeoutException"]
+    assert not by_name["stuck"].passed and "TimeoutException" in by_name["stuck"].error
+    assert by_name["ok"].passed
+    assert driver.cdp.count("Target.disposeBrowserContext") == 2
+    assert driver.contexts == {} and driver.window_handles == ["home"]
+
+
+def test_a_failing_flow_does_not_stop_the_others():
+    driver = FakeDriver()
+
+    def broken(driver):
+        yield ready_after(1)
+        raise ValueError("save button missing")
+
+    results = run_interleaved(driver, {"broken": broken, "ok": recording_flow([], [2, 1])},
+                              isolation="tab", timeout=5, poll=0)
+    assert [(r.name, r.passed) for r in results] == [("broken", False), ("ok", True)]
+    assert "save button missing" in results[0].error
+    assert driver.window_handles == ["home"]
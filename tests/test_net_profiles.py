@@ -0,0 +1,68 @@
+# tests/test_net_profiles.py
+import pytest
+
+from utils.netprofile import PROFILES, apply_profile, parse_profile
+from utils.wait_stats import WaitRecorder, WaitStat, format_waits
+
+
+class CdpDriver:
+    def __init__(self, reject_loss=False):
+        self.calls = []
+        self.reject_loss = reject_loss
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.reject_loss and "packetLoss" in params:
+            raise RuntimeError("Invalid parameters")
+        self.calls.append((cmd, dict(params)))
+        return {}
+
+
+def test_profiles_translate_to_cdp_parameters():
+    params = PROFILES["3g"].cdp_params()
+    assert params == {"offline": False, "latency": 300, "downloadThroughput": 200000.0,
+                      "uploadThroughput": 93750.0}
+    custom = parse_profile("latency=250,down=-1,loss=2")
+    assert (custom.latency_ms, custom.down_kbps, custom.up_kbps, custom.loss_pct) == (250, -1, -1, 2)
+    assert custom.cdp_params()["packetLoss"] == 2
+    with pytest.raises(ValueError):
+        parse_profile("dialup")
+
+
+def test_packet_loss_is_dropped_when_chrome_rejects_it():
+    d = CdpDriver(reject_loss=True)
+    apply_profile(d, PROFILES["satellite"])
+    assert d.calls[0][0] == "Network.enable"
+    assert d.calls[1] == ("Network.emulateNetworkConditions",
+                          {"offline": False, "latency": 700, "downloadThroughput": 125000.0,
+                           "uploadThroughput": 32000.0})
+    apply_profile(d, PROFILES["none"])
+    assert len(d.calls) == 2
+
+
+def test_waits_are_recorded_per_site_with_timeouts():
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    original = WebDriverWait.until
+    rec = WaitRecorder()
+    rec.install()
+    try:
+        WebDriverWait(object(), 1, poll_frequency=0.01).until(lambda d: True)
+        with pytest.raises(TimeoutException):
+            WebDriverWait(object(), 0.05, poll_frequency=0.01).until(lambda d: False)
+    finally:
+        rec.uninstall()
+    assert WebDriverWait.until is original
+
+    (ok_site, ok), (to_site, to) = sorted(rec.stats.items(), key=lambda kv: kv[1].timeouts)
+    assert ok_site.startswith("test_net_profiles.py:test_waits_are_recorded_per_site_with_timeouts:")
+    assert (ok.calls, ok.timeouts, ok.timeout) == (1, 0, 1.0)
+    assert (to.calls, to.timeouts) == (1, 1) and to.headroom == 0.0
+    lines = format_waits(rec.stats)
+    assert lines[1].startswith(to_site)          # least headroom first
+
+
+def test_headroom_uses_p95_against_timeout():
+    st = WaitStat(timeout=8.0, calls=20, durations=[1.0] * 18 + [6.0, 7.0])
+    assert st.percentile(0.95) == 7.0
+    assert st.headroom == pytest.approx(0.125)
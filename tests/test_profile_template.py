@@ -0,0 +1,120 @@
+# tests/test_profile_template.py
+import os
+import stat
+
+import pytest
+
+from utils.profile_template import (ProfileClones, build_template, clone_template, ensure_template,
+                                    strip_session_state, template_info)
+
+
+def _write(path, text="x"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+class FakeDriver:
+    """Stands in for Chrome: 'browsing' fills the user-data-dir like a real profile would."""
+
+    def __init__(self, user_data_dir):
+        self.dir = user_data_dir
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _browse(driver):
+    d = driver.dir
+    _write(os.path.join(d, "Local State"), "{}")
+    _write(os.path.join(d, "SingletonLock"))
+    _write(os.path.join(d, "Default", "Preferences"), "{}")
+    _write(os.path.join(d, "Default", "Cache", "Cache_Data", "f_000001"), "bundle.js")
+    _write(os.path.join(d, "Default", "Code Cache", "js", "abc"), "bytecode")
+    _write(os.path.join(d, "Default", "Network", "Cookies"), "orangehrm=session")
+    _write(os.path.join(d, "Default", "Local Storage", "leveldb", "000003.log"))
+    _write(os.path.join(d, "Default", "Sessions", "Session_1"))
+    _write(os.path.join(d, "Default", "Current Session"))
+
+
+@pytest.fixture
+def template(tmp_path, monkeypatch):
+    monkeypatch.setattr("utils.profile_template.time.sleep", lambda s: None)
+    path = str(tmp_path / "template")
+    build_template(path, FakeDriver, _browse, key="http://hrm")
+    return path
+
+
+def test_build_strips_session_state_and_freezes_caches(template):
+    assert template_info(template)["key"] == "http://hrm"
+    for gone in ("SingletonLock", "Default/Network/Cookies", "Default/Local Storage",
+                 "Default/Sessions", "Default/Current Session"):
+        assert not os.path.exists(os.path.join(template, gone)), gone
+    cached = os.path.join(template, "Default", "Cache", "Cache_Data", "f_000001")
+    assert not os.stat(cached).st_mode & stat.S_IWUSR
+    assert os.stat(os.path.join(template, "Default", "Preferences")).st_mode & stat.S_IWUSR
+
+
+def test_strip_ignores_non_profile_dirs(tmp_path):
+    _write(str(tmp_path / "Default" / "Cookies"))
+    _write(str(tmp_path / "ShaderCache" / "Cookies"))
+    assert strip_session_state(str(tmp_path)) == 1
+    assert os.path.exists(tmp_path / "ShaderCache" / "Cookies")
+
+
+def test_hardlink_clone_shares_caches_and_copies_state(template, tmp_path, monkeypatch):
+    monkeypatch.setattr("utils.profile_template._read_only_enforced", lambda: True)
+    dest = str(tmp_path / "clone")
+    assert clone_template(template, dest, "hardlink") == "hardlink"
+    src_cache = os.path.join(template, "Default", "Code Cache", "js", "abc")
+    dst_cache = os.path.join(dest, "Default", "Code Cache", "js", "abc")
+    assert os.path.samefile(src_cache, dst_cache)
+    prefs = os.path.join(dest, "Default", "Preferences")
+    assert not os.path.samefile(prefs, os.path.join(template, "Default", "Preferences"))
+    with open(prefs, "w") as f:      # a clone's state never reaches the template
+        f.write('{"changed": true}')
+    with open(os.path.join(template, "Default", "Preferences")) as f:
+        assert f.read() == "{}"
+
+
+def test_writing_a_cloned_cache_file_leaves_the_template_alone(template, tmp_path):
+    dest = str(tmp_path / "clone")
+    used = clone_template(template, dest, "hardlink")
+    original = os.path.join(template, "Default", "Cache", "Cache_Data", "f_000001")
+    cloned = os.path.join(dest, "Default", "Cache", "Cache_Data", "f_000001")
+    assert used == ("hardlink" if os.geteuid() else "copy")
+    try:
+        with open(cloned, "r+") as f:      # what Chrome's disk cache does to an existing entry
+            f.write("patched!")
+    except PermissionError:
+        assert used == "hardlink"
+    with open(original) as f:
+        assert f.read() == "bundle.js"
+
+
+def test_copy_clone_is_independent(template, tmp_path):
+    dest = str(tmp_path / "clone")
+    assert clone_template(template, dest, "copy") == "copy"
+    cached = os.path.join(dest, "Default", "Cache", "Cache_Data", "f_000001")
+    assert not os.path.samefile(cached, os.path.join(template, "Default", "Cache", "Cache_Data", "f_000001"))
+    assert os.stat(cached).st_mode & stat.S_IWUSR
+
+
+def test_ensure_template_reuses_fresh_template(template, monkeypatch):
+    def fail(_):
+        raise AssertionError("template rebuilt")
+    assert ensure_template(template, fail, _browse, key="http://hrm")["key"] == "http://hrm"
+    built = []
+    monkeypatch.setattr("utils.profile_template.time.sleep", lambda s: None)
+    ensure_template(template, lambda d: built.append(d) or FakeDriver(d), _browse, key="http://other")
+    assert len(built) == 1 and template_info(template)["key"] == "http://other"
+
+
+def test_profile_clones_cleanup(template):
+    clones = ProfileClones(template, "auto")
+    first, second = clones.new(), clones.new()
+    assert first != second and os.path.isfile(os.path.join(second, "Local State"))
+    assert sum(clones.modes.values()) == 2
+    clones.cleanup()
+    assert not os.path.exists(clones.root)
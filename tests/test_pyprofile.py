@@ -0,0 +1,42 @@
+# tests/test_pyprofile.py
+import os
+import time
+
+from utils.pyprofile import Profiler, area_totals, classify, format_report, merge_profiles, per_test
+
+
+def _busy():
+    return sum(i * i for i in range(200_000))
+
+
+def test_classify_separates_io_from_python():
+    assert classify(("~", 0, "<built-in method time.sleep>")) == "io"
+    assert classify(("~", 0, "<method 'recv_into' of '_socket.socket' objects>")) == "io"
+    assert classify(("~", 0, "<method 'acquire' of '_thread.lock' objects>")) == "io"
+    assert classify(("~", 0, "<built-in method builtins.sum>")) == "other"
+    here = os.path.dirname(os.path.abspath(__file__))
+    root = os.path.dirname(here)
+    assert classify((os.path.join(root, "pages", "pim_page.py"), 10, "go_to_pim")) == "pages"
+    assert classify((os.path.join(here, "test_login.py"), 1, "test_can_login")) == "tests"
+    assert classify(("/venv/site-packages/selenium/webdriver/support/wait.py", 80, "until")) == "selenium"
+
+
+def test_profiles_merge_and_split_python_from_waiting(tmp_path):
+    paths = []
+    for name in ("a", "b"):
+        with Profiler() as prof:
+            _busy()
+            time.sleep(0.05)
+        path = str(tmp_path / "gw0" / f"{name}.pstats")
+        prof.dump(path)
+        paths.append(path)
+
+    stats = merge_profiles(paths)
+    totals = area_totals(stats)
+    assert totals["io"] >= 0.09
+    assert totals["tests"] > 0          # _busy's generator lives in this file
+
+    report = format_report(stats, top=5)
+    assert "waiting on I/O" in report[0]
+    assert not any("time.sleep" in line for line in report[3:])   # hotspots exclude I/O
+    assert [name for name, _, _ in per_test(paths)] and all(io >= 0.04 for _, _, io in per_test(paths))
@@ -0,0 +1,47 @@
+# tests/test_report_store.py
+import json
+
+from utils.report_store import ReportStore, history_by_test, iter_records, merge
+from tools.report_dashboard import render
+
+
+def _write_run(directory, run_id, worker, results):
+    store = ReportStore(str(directory), run_id, worker)
+    for nodeid, outcome, duration in results:
+        store.append("test", nodeid=nodeid, outcome=outcome, duration=duration,
+                     steps=[{"name": "JobDetailsPage.set_job_details/Save", "seconds": 1.5, "retries": 0}])
+    store.close()
+
+
+def test_shards_from_several_workers_merge_into_one_history(tmp_path):
+    _write_run(tmp_path, "run-1", "gw0", [("t::a", "passed", 10.0)])
+    _write_run(tmp_path, "run-1", "gw1", [("t::b", "failed", 20.0)])
+    _write_run(tmp_path, "run-2", "gw0", [("t::a", "passed", 12.0), ("t::b", "passed", 18.0)])
+
+    runs, tests = history_by_test(iter_records([str(tmp_path)]))
+    assert runs == ["run-1", "run-2"]
+    assert tests["t::b"]["run-1"]["outcome"] == "failed"
+    assert tests["t::a"]["run-2"]["duration"] == 12.0
+
+    out = tmp_path / "merged" / "all.jsonl"
+    assert merge([str(tmp_path)], str(out)) == 4
+    assert all(json.loads(line)["type"] == "test" for line in out.read_text().splitlines())
+
+
+def test_partial_trailing_line_is_ignored(tmp_path):
+    _write_run(tmp_path, "run-1", "gw0", [("t::a", "passed", 1.0)])
+    shard = next(tmp_path.glob("*.jsonl"))
+    with open(shard, "a", encoding="utf-8") as f:
+        f.write('{"type": "test", "nodeid": "t::b"')   # writer still mid-line
+
+    assert [r["nodeid"] for r in iter_records([str(tmp_path)])] == ["t::a"]
+
+
+def test_dashboard_shows_last_n_runs(tmp_path):
+    for i in range(5):
+        _write_run(tmp_path, f"run-{i}", "master", [("tests/test_x.py::test_y", "passed", 10.0 + i)])
+
+    page = render([str(tmp_path)], last_runs=3)
+    assert "3 run(s), 1 test(s)" in page
+    assert "tests/test_x.py::test_y" in page
+    assert "<svg" in page and "14.0s" in page
@@ -0,0 +1,76 @@
+# tests/test_sharding.py
+import os
+
+import pytest
+
+from tools.merge_shards import main as merge_main, shard_summary
+from utils.report_store import ReportStore
+from utils.sharding import estimate, parse_shard, plan_shards, recorded_durations
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("0/3", "4/3", "1-3", "x"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_lpt_balances_by_duration_and_keeps_order():
+    costs = estimate(["a", "b", "c", "d", "e", "new"], {"a": 60, "b": 10, "c": 30, "d": 30, "e": 20})
+    assert costs["new"] == 30                      # median of the known durations
+    shards = plan_shards(costs, 2)
+    assert sorted(sum(shards, [])) == sorted(costs)
+    loads = [sum(costs[n] for n in s) for s in shards]
+    assert max(loads) - min(loads) <= 10
+    for s in shards:
+        assert s == [n for n in costs if n in s]   # collection order preserved
+    assert plan_shards(costs, 2) == shards         # same plan on every runner
+
+
+def test_recorded_durations_use_median_of_recent_runs(tmp_path):
+    for run, seconds in (("r1", 10.0), ("r2", 40.0), ("r3", 12.0)):
+        store = ReportStore(str(tmp_path), run, "master")
+        store.append("test", nodeid="t::slow", outcome="passed", duration=seconds)
+        store.append("test", nodeid="t::skipped", outcome="skipped", duration=0.0)
+        store.close()
+    assert recorded_durations(str(tmp_path)) == {"t::slow": 12.0}
+    assert recorded_durations(str(tmp_path / "missing")) == {}
+
+
+def test_recorded_durations_window_per_test(tmp_path):
+    # full runs r1, r2 interleaved with narrow runs that only ran t::fast
+    runs = [("r1", True), ("n1", False), ("n2", False), ("r2", True), ("n3", False)]
+    for i, (run, full) in enumerate(runs):
+        store = ReportStore(str(tmp_path), run, "master")
+        store.append("test", nodeid="t::fast", outcome="passed", duration=1.0 + i)
+        if full:
+            store.append("test", nodeid="t::slow", outcome="passed", duration=100.0 + i)
+        store.close()
+    durations = recorded_durations(str(tmp_path), last_runs=2)
+    assert durations["t::slow"] == 101.5     # r1 and r2, however many narrow runs came between
+    assert durations["t::fast"] == 4.5       # its own last two: r2 and n3
+
+
+def test_merge_combines_histories_and_artifacts(tmp_path, capsys):
+    sources = []
+    for i, (n_tests, seconds) in enumerate(((2, 50.0), (3, 40.0)), 1):
+        src = tmp_path / f"runner{i}"
+        store = ReportStore(str(src / "history"), "nightly", "master")
+        store.append("session_start", args=[], shard=f"{i}/2")
+        for t in range(n_tests):
+            store.append("test", nodeid=f"t{i}{t}", outcome="passed", duration=seconds / n_tests)
+        store.append("session_finish", exitstatus=0)
+        store.close()
+        (src / "steps").mkdir()
+        (src / "steps" / "master.json").write_text("{}")
+        sources.append(str(src))
+
+    out = tmp_path / "merged"
+    assert merge_main([*sources, "--out", str(out), "--run-id", "nightly"]) == 0
+    assert sorted(os.listdir(out / "steps")) == ["shard1-master.json", "shard2-master.json"]
+    assert len((out / "history" / "merged.jsonl").read_text().splitlines()) == 9
+
+    lines = shard_summary(sources, "nightly")
+    assert lines[0] == "5 tests: 5 passed"
+    assert lines[1].startswith("shard1 (1/2): 2 tests, 50s in tests")
+    assert "runners" in capsys.readouterr().out
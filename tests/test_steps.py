@@ -0,0 +1,73 @@
+# tests/test_steps.py
+import pytest
+
+from utils.step_stats import STATS
+from utils.steps import run_step
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    STATS.clear()
+    yield
+    STATS.clear()
+
+
+@pytest.fixture
+def errors():
+    from selenium.common import exceptions
+    return exceptions
+
+
+def flaky(failures: int, error):
+    """An action that raises `error` on its first `failures` calls, then returns the call count."""
+    calls = []
+
+    def action():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error("not ready")
+        return len(calls)
+    return action, calls
+
+
+def test_step_is_retried_after_a_reset(errors):
+    action, calls = flaky(2, errors.StaleElementReferenceException)
+    resets = []
+    assert run_step("pim.save", action, reset=lambda: resets.append(1), retries=2) == 3
+    assert len(calls) == 3 and len(resets) == 2
+    st = STATS.stats["pim.save"]
+    assert (st.runs, st.retries, st.flaky_runs, st.failures) == (1, 2, 1, 0)
+    assert [s["retries"] for s in STATS.take_timeline()] == [2]
+    assert STATS.take_timeline() == []
+
+
+def test_error_propagates_once_the_budget_is_used_up(errors):
+    action, calls = flaky(5, errors.TimeoutException)
+    resets = []
+    with pytest.raises(errors.TimeoutException):
+        run_step("pim.save", action, reset=lambda: resets.append(1), retries=2)
+    assert len(calls) == 3 and len(resets) == 2
+    st = STATS.stats["pim.save"]
+    assert (st.runs, st.retries, st.flaky_runs, st.failures) == (1, 2, 0, 1)
+    assert STATS.take_timeline()[0]["passed"] is False
+
+
+def test_clean_run_and_non_retryable_errors(errors):
+    action, calls = flaky(0, errors.TimeoutException)
+    run_step("pim.open", action, retries=2)
+    run_step("pim.open", action, retries=2)
+    assert (STATS.stats["pim.open"].runs, STATS.stats["pim.open"].retries) == (2, 0)
+
+    action, calls = flaky(1, errors.NoSuchElementException)
+    with pytest.raises(errors.NoSuchElementException):
+        run_step("pim.find", action, reset=pytest.fail, retries=2)
+    assert len(calls) == 1
+
+
+def test_failing_reset_does_not_hide_the_retry(errors):
+    def reset():
+        raise RuntimeError("spinner never went away")
+
+    action, calls = flaky(1, errors.TimeoutException)
+    assert run_step("pim.save", action, reset=reset, retries=1) == 2
+    assert STATS.stats["pim.save"].flaky_runs == 1
@@ -0,0 +1,112 @@
+# tools/bench_logging.py
+"""
+Caller-side cost of logging: the old synchronous setup vs. the queue pipeline.
+
+    python -m tools.bench_logging [--n 20000]
+
+before: `logging.basicConfig`-style FileHandler on the root logger, messages built
+        with f-strings (formatted on the calling thread even when the level is off)
+after:  utils.logsetup.start_logging (QueueHandler -> listener thread -> rotating
+        JSON-lines file), messages with lazy %-args
+
+Measured per call on the calling thread: an INFO record, a DEBUG record below the
+level, and the logging overhead of one page-object step (`run_step` around two INFO
+records and a short sleep standing in for the browser round trip, minus the same step
+without logging) — the number the test thread actually pays. Back-to-back INFO calls
+gain little, as the listener competes for the GIL; the win is in steps that wait on
+the browser, where the listener formats and writes during the wait. For the pipeline
+it also reports how long the listener took to drain the queue afterwards.
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from utils.logsetup import start_logging
+from utils.step_stats import STATS
+from utils.steps import run_step
+
+log = logging.getLogger("bench")
+EMP = {"first": "Jane1234", "middle": "QA", "last": "Tester", "emp_number": 1234}
+
+
+def _per_call(fn, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+IO_WAIT = 0.0005   # each step also "waits on the browser", as real steps do
+
+
+def _bare_step(i):
+    run_step("bench.step", lambda: time.sleep(IO_WAIT))
+
+
+def _eager_step(i):
+    def action():
+        log.info(f"Filling employee details: {EMP['first']} {EMP['middle']} {EMP['last']} #{i}")
+        time.sleep(IO_WAIT)
+        log.info(f"Saved {EMP}")
+    run_step("bench.step", action)
+
+
+def _lazy_step(i):
+    def action():
+        log.info("Filling employee details: %s %s %s #%d", EMP["first"], EMP["middle"], EMP["last"], i)
+        time.sleep(IO_WAIT)
+        log.info("Saved %s", EMP)
+    run_step("bench.step", action)
+
+
+def _measure(n: int, eager: bool) -> dict:
+    steps = max(n // 10, 100)
+    return {
+        "info": _per_call((lambda i: log.info(f"Saved {EMP} #{i}")) if eager
+                          else (lambda i: log.info("Saved %s #%d", EMP, i)), n),
+        "debug (off)": _per_call((lambda i: log.debug(f"Row {EMP} #{i}")) if eager
+                                 else (lambda i: log.debug("Row %s #%d", EMP, i)), n),
+        "step + 2 info": _per_call(_eager_step if eager else _lazy_step, steps) - _per_call(_bare_step, steps),
+    }
+
+
+def _reset_root() -> logging.Logger:
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        root.removeHandler(h)
+        h.close()
+    return root
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--n", type=int, default=20000)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = _reset_root()
+        handler = logging.FileHandler(os.path.join(tmp, "before.log"), encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        before = _measure(args.n, eager=True)
+        _reset_root()
+
+        pipeline = start_logging(os.path.join(tmp, "logs"), "bench", "INFO", max_bytes=20 * 2 ** 20)
+        after = _measure(args.n, eager=False)
+        drain = time.perf_counter()
+        pipeline.stop()
+        drain = time.perf_counter() - drain
+    STATS.clear()
+
+    print(f"{'per call (us)':<16} {'before':>9} {'after':>9} {'saved':>7}")
+    for key in before:
+        print(f"{key:<16} {before[key]:9.2f} {after[key]:9.2f} {1 - after[key] / before[key]:7.0%}")
+    print(f"listener drained the rest of the queue in {drain * 1000:.0f} ms after the run")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
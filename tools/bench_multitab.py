@@ -0,0 +1,112 @@
+# tools/bench_multitab.py
+"""
+Compare multi-tab execution with one browser per flow.
+
+    python -m tools.bench_multitab --flows 12 --parallel 4
+
+Both modes run the same Add Employee flow `--flows` times with `--parallel` flows in
+flight: as tabs of one Chrome, or as a fresh Chrome per flow (started and quit inside
+the measured time) driven from threads; the multi-tab total includes its one Chrome
+start too. Prints throughput, peak browser RSS and throughput per GB for each mode,
+plus `startup=`, the part of the time spent starting browsers (summed over browsers,
+so with --parallel it can exceed the wall time). The employees it creates are tagged
+like the suite's own (utils/cleanup.py) and deleted again at the end.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import config
+from utils.browser import new_driver
+from utils.cleanup import CREATED, new_tag
+from utils.hrm_api import HrmApi
+from utils.logsetup import in_context
+from utils.multitab import PeakRss, ThroughputReport, add_employee_flow, run_interleaved
+
+
+def _flows(count: int) -> dict:
+    flows = {}
+    for i in range(count):
+        tag = new_tag(config.EMPLOYEE_TAG_PREFIX)
+        flows[f"add-{i}"] = add_employee_flow(f"Jane{tag}", "QA", "Bench", employee_id=tag)
+    return flows
+
+
+def bench_multitab(flows: int, parallel: int, isolation: str) -> ThroughputReport:
+    pending = list(_flows(flows).items())
+    results = []
+    start = time.perf_counter()   # the browser start counts, as it does in browser-per-flow
+    driver = new_driver()
+    startup = time.perf_counter() - start
+    try:
+        with PeakRss([driver]) as rss:
+            while pending:
+                batch, pending = dict(pending[:parallel]), pending[parallel:]
+                results += run_interleaved(driver, batch, isolation=isolation)
+            elapsed = time.perf_counter() - start
+    finally:
+        driver.quit()
+    return ThroughputReport(f"multitab[{isolation}]x{parallel}", flows,
+                            sum(r.passed for r in results), elapsed, rss.peak, results, startup)
+
+
+def bench_browser_per_flow(flows: int, parallel: int) -> ThroughputReport:
+    drivers = []
+    results = []
+    startups = []
+
+    def worker(items):
+        out = []
+        for name, flow in items:   # a fresh browser per flow: no session carried over
+            started = time.perf_counter()
+            d = new_driver()
+            startups.append(time.perf_counter() - started)
+            drivers.append(d)
+            try:
+                out += run_interleaved(d, {name: flow}, isolation="tab")
+            finally:
+                drivers.remove(d)
+                d.quit()
+        return out
+
+    items = list(_flows(flows).items())
+    chunks = [items[i::parallel] for i in range(parallel)]
+    with PeakRss(drivers) as rss:
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                for out in pool.map(in_context(worker), chunks):
+                    results += out
+        finally:
+            elapsed = time.perf_counter() - start
+    return ThroughputReport(f"browser-per-flow x{parallel}", flows,
+                            sum(r.passed for r in results), elapsed, rss.peak, results, sum(startups))
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--flows", type=int, default=8, help="total flows per mode")
+    ap.add_argument("--parallel", type=int, default=4, help="flows in flight at once")
+    ap.add_argument("--isolation", choices=("context", "tab"), default="context")
+    args = ap.parse_args(argv)
+
+    try:
+        reports = [
+            bench_multitab(args.flows, args.parallel, args.isolation),
+            bench_browser_per_flow(args.flows, args.parallel),
+        ]
+    finally:
+        if CREATED.emp_numbers:
+            api = HrmApi(config.APP_URL).login(config.USERNAME, config.PASSWORD)
+            print(CREATED.delete_all(api).line())
+            api.session.close()
+    for rep in reports:
+        print(rep.line())
+        for r in rep.results:
+            if not r.passed:
+                print(f"    {r.name}: {r.error}")
+    return 0 if all(rep.passed == rep.flows for rep in reports) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+# tools/bench_profile.py
+"""
+Cold vs. warm browser profiles: time to the first Dashboard paint.
+
+    python -m tools.bench_profile --runs 5 [--rebuild] [--mode auto|reflink|hardlink|copy]
+
+cold: a fresh incognito Chrome, as the `driver` fixture starts it by default.
+warm: a clone of the pre-warmed template (`pytest --warm-profile`).
+
+For each run it records how long Chrome took to start (including the clone), the
+login page's first contentful paint, and the time from submitting the login until
+the Dashboard header is visible, plus that document's FCP and how many of its
+resources came from the cache. Prints the median of each per mode.
+"""
+import argparse
+import os
+import statistics
+import time
+
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.login_page import LoginPage
+from utils import config
+from utils.browser import chrome_options, new_driver
+from utils.profile_template import ProfileClones, build_template, ensure_template, paint_timing
+
+
+def _measure(driver, started: float) -> dict:
+    out = {"start": time.perf_counter() - started}
+    login = LoginPage(driver)
+    driver.get(config.BASE_URL)
+    login.wait.until(EC.visibility_of_element_located(LoginPage.USERNAME_INPUT))
+    out["login_fcp"] = (paint_timing(driver).get("fcp") or 0) / 1000
+    driver.find_element(*LoginPage.USERNAME_INPUT).send_keys(config.USERNAME)
+    driver.find_element(*LoginPage.PASSWORD_INPUT).send_keys(config.PASSWORD)
+    submitted = time.perf_counter()
+    driver.find_element(*LoginPage.LOGIN_BTN).click()
+    login.wait.until(EC.visibility_of_element_located(LoginPage.DASHBOARD_HEADER))
+    out["dashboard"] = time.perf_counter() - submitted
+    paint = paint_timing(driver)
+    out["dashboard_fcp"] = (paint.get("fcp") or 0) / 1000
+    res = paint.get("resources") or {}
+    out["cached"] = f"{res.get('cached', 0)}/{res.get('n', 0)}"
+    out["first_paint_total"] = out["start"] + out["dashboard"]
+    return out
+
+
+def bench(mode: str, runs: int, clones: ProfileClones | None) -> list[dict]:
+    results = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        opts = chrome_options(user_data_dir=clones.new()) if clones is not None else chrome_options()
+        driver = new_driver(opts)
+        try:
+            results.append(_measure(driver, started))
+        finally:
+            driver.quit()
+        print(f"  {mode}: " + "  ".join(f"{k} {v:.2f}" if isinstance(v, float) else f"{k} {v}"
+                                          for k, v in results[-1].items()), flush=True)
+    return results
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--mode", default="auto", choices=("auto", "reflink", "hardlink", "copy"))
+    ap.add_argument("--template", default=os.path.join(config.REPORTS_DIR, "chrome_template"))
+    ap.add_argument("--rebuild", action="store_true", help="rebuild the template even if it is fresh")
+    args = ap.parse_args(argv)
+
+    factory = lambda user_data_dir: new_driver(chrome_options(user_data_dir=user_data_dir))  # noqa: E731
+    if args.rebuild:
+        info = build_template(args.template, factory, key=config.BASE_URL)
+    else:
+        info = ensure_template(args.template, factory, key=config.BASE_URL)
+    print(f"template {args.template}: {info['bytes'] / 2 ** 20:.0f} MB, built in {info['seconds']:.0f}s")
+
+    clones = ProfileClones(args.template, args.mode)
+    try:
+        cold = bench("cold", args.runs, None)
+        warm = bench("warm", args.runs, clones)
+    finally:
+        clones.cleanup()
+
+    print(f"\n{'median (s)':<20} {'cold':>8} {'warm':>8} {'saved':>8}")
+    for key in ("start", "login_fcp", "dashboard", "dashboard_fcp", "first_paint_total"):
+        c = statistics.median(r[key] for r in cold)
+        w = statistics.median(r[key] for r in warm)
+        print(f"{key:<20} {c:8.2f} {w:8.2f} {c - w:8.2f}")
+    print(f"{'cached resources':<20} {cold[-1]['cached']:>8} {warm[-1]['cached']:>8}")
+    print(f"clone modes: {clones.modes}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
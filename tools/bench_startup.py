@@ -0,0 +1,88 @@
+# tools/bench_startup.py
+"""
+Import time of every project module, and how long `pytest --collect-only` takes.
+
+    python -m tools.bench_startup [--runs 5] [--budget-ms 1500]
+
+Each module is imported in a fresh interpreter with `-X importtime`; the table shows
+its cumulative import time and whether it drags in Selenium. Test modules should
+stay cheap — they import Selenium and the page objects inside the tests — so the
+numbers to watch as pages/ grows are the page objects themselves and collection.
+Collection runs without BASE_URL / HRM_USERNAME / HRM_PASSWORD to show that it
+doesn't need the environment. `--budget-ms` fails (exit 1) when the median collection
+time goes over the budget.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CREDENTIALS = ("BASE_URL", "HRM_USERNAME", "HRM_PASSWORD")
+
+
+def project_modules() -> list[str]:
+    out = ["utils.config"]
+    for package in ("pages", "tests"):
+        out += [f"{package}.{n[:-3]}" for n in sorted(os.listdir(os.path.join(_ROOT, package)))
+                if n.endswith(".py") and not n.startswith("_")]
+    return out + ["selenium.webdriver.support.ui"]   # reference: what a browser test needs
+
+
+def import_time(module: str, env: dict) -> tuple[float, bool]:
+    """(cumulative ms, imports selenium) for `import module` in a fresh interpreter."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=_ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode:
+        return float("nan"), False
+    cumulative = 0.0
+    selenium = False
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) != 3 or not parts[1].isdigit():
+            continue
+        selenium |= parts[2].startswith("selenium")
+        if parts[2] == module:
+            cumulative = int(parts[1]) / 1000
+    return cumulative, selenium
+
+
+def collect_time(env: dict, args: list[str]) -> tuple[float, int, str]:
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *args],
+                          cwd=_ROOT, env=env, capture_output=True, text=True)
+    summary = next((line for line in reversed(proc.stdout.splitlines()) if line.strip()), "")
+    return (time.perf_counter() - start) * 1000, proc.returncode, summary
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5, help="collection runs (median is reported)")
+    ap.add_argument("--budget-ms", type=float, default=None, help="fail if median collection time exceeds this")
+    ap.add_argument("pytest_args", nargs="*", help="passed to pytest --collect-only after --")
+    args = ap.parse_args(argv)
+
+    env = {k: v for k, v in os.environ.items() if k not in _CREDENTIALS}
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    print(f"{'module':<36} {'import ms':>9}  selenium")
+    for module in project_modules():
+        ms, selenium = import_time(module, env)
+        print(f"{module:<36} {ms:9.1f}  {'yes' if selenium else ''}")
+
+    runs = [collect_time(env, args.pytest_args) for _ in range(args.runs)]
+    median = statistics.median(ms for ms, _, _ in runs)
+    code, summary = runs[-1][1], runs[-1][2]
+    print(f"\npytest --collect-only (no credentials in env): median {median:.0f} ms over {args.runs} runs, "
+          f"exit {code}: {summary}")
+    if code:
+        return code
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"collection is over the {args.budget_ms:.0f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+# tools/capture_dom.py
+"""
+Record DOM snapshots of every OrangeHRM screen the page objects touch.
+
+    python -m tools.capture_dom [--out snapshots/dom]
+
+Walks login → Dashboard → Employee List → Add Employee →
+Personal Details (+ open attachment form) → Job with a real browser and writes the
+live DOM of each screen to `<out>/<screen>.html` for `tools.locator_check`.
+Re-capture after an OrangeHRM upgrade. The employee it creates is deleted again.
+"""
+import argparse
+import os
+
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.add_employee_page import AddEmployeePage
+from pages.employee_list_page import EmployeeListPage
+from pages.employee_personal_page import EmployeePersonalPage
+from pages.job_details_page import JobDetailsPage
+from pages.login_page import LoginPage
+from pages.pim_page import PIMPage
+from utils import config
+from utils.browser import new_driver
+from utils.cleanup import delete_employees, new_tag
+from utils.hrm_api import HrmApi
+
+DEFAULT_DIR = os.path.join("snapshots", "dom")
+
+
+def _save(driver, out_dir: str, screen: str) -> None:
+    path = os.path.join(out_dir, f"{screen}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(driver.execute_script("return document.documentElement.outerHTML;"))
+    print(f"captured {screen:<30} -> {path}")
+
+
+def capture(out_dir: str) -> None:
+    os.makedirs(out_dir, exist_ok=True)
+    d = new_driver()
+    emp_number = None
+    try:
+        login = LoginPage(d)
+        d.get(config.BASE_URL)
+        login.wait.until(EC.visibility_of_element_located(LoginPage.USERNAME_INPUT))
+        _save(d, out_dir, "login")
+        login.login()
+        _save(d, out_dir, "dashboard")
+
+        pim = PIMPage(d)
+        pim.open_employee_list()
+        emp_list = EmployeeListPage(d)
+        emp_list.wait.until(EC.presence_of_element_located(EmployeeListPage.TABLE_ROWS))
+        _save(d, out_dir, "employee_list")  # the list opens with the first page of results
+
+        pim.open_add_employee()
+        add = AddEmployeePage(d)
+        add.is_loaded()
+        _save(d, out_dir, "add_employee")
+
+        tag = new_tag(config.EMPLOYEE_TAG_PREFIX)
+        add.fill_employee_details(f"Jane{tag}", "QA", "Snapshot", employee_id=tag)
+        add.save_employee()
+        emp_number = add.get_emp_number()
+        pim.open_employee(emp_number)
+        _save(d, out_dir, "personal_details")
+
+        personal = EmployeePersonalPage(d)
+        personal.wait.until(EC.element_to_be_clickable(EmployeePersonalPage.ATTACH_ADD_BTN)).click()
+        personal.wait.until(EC.presence_of_element_located(EmployeePersonalPage.FILE_INPUT))
+        _save(d, out_dir, "personal_details_attach_form")
+
+        JobDetailsPage(d)._open_job_tab()
+        _save(d, out_dir, "job")
+    finally:
+        if emp_number is not None:
+            api = HrmApi.from_driver(d, config.APP_URL)
+            delete_employees(api, [emp_number])
+        d.quit()
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--out", default=DEFAULT_DIR)
+    args = ap.parse_args(argv)
+    capture(args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
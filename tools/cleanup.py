@@ -0,0 +1,69 @@
+# tools/cleanup.py
+"""
+Sweep employee records left behind by crashed or aborted runs.
+
+    python -m tools.cleanup --max-age 24h              # tagged suite records older than a day
+    python -m tools.cleanup --max-age 0m --dry-run     # just list every tagged record
+    python -m tools.cleanup --include-untagged         # + legacy "Jane#### QA Tester" records
+
+Suite records are recognised by their Employee Id tag (see utils/cleanup.py), which
+also encodes when they were created. Safe to schedule (cron / CI) — it only ever
+deletes records that carry the tag, plus name-pattern matches when asked to.
+"""
+import argparse
+import datetime
+import re
+import time
+
+from utils.cleanup import DEFAULT_NAME_PATTERN, delete_employees, find_orphans
+from utils.hrm_api import HrmApi
+
+_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+
+def parse_age(text: str) -> datetime.timedelta:
+    m = re.fullmatch(r"(\d+)([mhd])", text.strip())
+    if not m:
+        raise argparse.ArgumentTypeError(f"age must look like 30m, 12h or 7d, got {text!r}")
+    return datetime.timedelta(**{_UNITS[m.group(2)]: int(m.group(1))})
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--max-age", type=parse_age, default=parse_age("24h"),
+                    help="only delete tagged records at least this old (default 24h)")
+    ap.add_argument("--prefix", help="Employee Id tag prefix (default EMPLOYEE_TAG_PREFIX from .env)")
+    ap.add_argument("--include-untagged", nargs="?", const=DEFAULT_NAME_PATTERN, metavar="REGEX",
+                    help=f"also delete untagged records whose full name matches (default {DEFAULT_NAME_PATTERN!r})")
+    ap.add_argument("--dry-run", action="store_true", help="list what would be deleted")
+    ap.add_argument("--batch-size", type=int, default=100)
+    ap.add_argument("--base-url", help="host (default: BASE_URL from .env)")
+    ap.add_argument("--username")
+    ap.add_argument("--password")
+    args = ap.parse_args(argv)
+
+    if not (args.base_url and args.username and args.password and args.prefix):
+        from utils import config
+        args.base_url = args.base_url or config.APP_URL[: -len("/web/index.php")]
+        args.username = args.username or config.USERNAME
+        args.password = args.password or config.PASSWORD
+        args.prefix = args.prefix or config.EMPLOYEE_TAG_PREFIX
+
+    api = HrmApi(f"{args.base_url.rstrip('/')}/web/index.php").login(args.username, args.password)
+    start = time.perf_counter()
+    orphans = find_orphans(api, args.prefix, args.max_age, args.include_untagged)
+    scan = time.perf_counter() - start
+    print(f"found {len(orphans)} record(s) to remove (scan took {scan:.1f}s)")
+    if args.dry_run or not orphans:
+        if orphans:
+            print("empNumbers:", " ".join(map(str, orphans)))
+        return 0
+    report = delete_employees(api, orphans, args.batch_size)
+    print(report.line())
+    if report.failed:
+        print("could not delete:", " ".join(map(str, report.failed)))
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+# tools/gen_data.py
+"""
+Stream seeded employee records (utils/test_data.py) as JSON lines or CSV.
+
+    python -m tools.gen_data --seed 42 --count 1000000 > employees.jsonl
+    python -m tools.gen_data --seed 42 --start 500 --count 10 --format csv
+    python -m tools.gen_data --seed 42 --from-api --count 100   # instance's own job titles, sub-units, ...
+
+The same seed and index always give the same record, so a bulk run can be
+resumed or split across machines with --start / --count.
+"""
+import argparse
+import csv
+import dataclasses
+import json
+import sys
+
+from utils.test_data import Catalog, EmployeeData, EmployeeDataGenerator
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--seed", type=int, required=True)
+    ap.add_argument("--start", type=int, default=0, help="first record index")
+    ap.add_argument("--count", type=int, default=100)
+    ap.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    ap.add_argument("--from-api", action="store_true", help="read lookup values from the instance in .env")
+    args = ap.parse_args(argv)
+
+    catalog = None
+    if args.from_api:
+        from utils import config
+        from utils.hrm_api import HrmApi
+
+        catalog = Catalog.from_api(HrmApi(config.APP_URL).login(config.USERNAME, config.PASSWORD))
+    gen = EmployeeDataGenerator(args.seed, catalog)
+
+    if args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, [f.name for f in dataclasses.fields(EmployeeData)])
+        writer.writeheader()
+        for rec in gen.stream(args.start, args.count):
+            writer.writerow(dataclasses.asdict(rec))
+    else:
+        for rec in gen.stream(args.start, args.count):
+            sys.stdout.write(json.dumps(dataclasses.asdict(rec)) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
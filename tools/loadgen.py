@@ -0,0 +1,383 @@
+# tools/loadgen.py
+"""
+Capacity testing for an OrangeHRM deployment, re-using the page objects.
+
+    # browser mode: every virtual user drives its own Chrome through pages/
+    python -m tools.loadgen --mode browser --users 4 --rate 0.5 --ramp 60 --duration 300
+
+    # HTTP-only mode: same scenarios through the REST API, for much higher concurrency
+    python -m tools.loadgen --mode http --users 50 --rate 20 --ramp 30 --duration 120
+
+    # against the local stand-in (python -m tools.stub_server --port 8089)
+    python -m tools.loadgen --mode http --base-url http://127.0.0.1:8089 \\
+        --username Admin --password admin123 --rate 50 --duration 30
+
+Arrivals follow an open model: the target rate ramps linearly from 0 over `--ramp`
+seconds and then holds; each arrival picks a scenario from the weighted `--mix` and is
+handed to the next free virtual user. Arrivals that find every user busy (queue full)
+are counted as dropped, which means the deployment — or the generator — is saturated.
+
+Reported per scenario: count, errors, end-to-end duration percentiles and server-side
+latency percentiles (time from request sent to response headers for each /api/v2 call;
+in browser mode taken from Chrome's network events).
+
+Created employees are tagged like the suite's own (utils/cleanup.py); remove them
+afterwards with `python -m tools.cleanup --max-age 0m`.
+"""
+import argparse
+import collections
+import datetime
+import json
+import math
+import queue
+import random
+import threading
+import time
+
+from utils.cleanup import new_tag
+from utils.logsetup import in_context
+from utils.test_data import EmployeeDataGenerator
+
+DEFAULT_MIX = "login=1,search=6,add_employee=2,job_details=1"
+
+
+# ---------------- arrival schedule ----------------
+def arrival_times(rate: float, ramp: float, duration: float):
+    """
+    Yield arrival offsets (seconds from start) for a rate that ramps linearly from 0 to
+    `rate` over `ramp` seconds and then stays constant, until `duration`.
+    """
+    if rate <= 0:
+        return
+    ramp_arrivals = rate * ramp / 2  # area under the ramp
+    n = 1
+    while True:
+        if ramp and n <= ramp_arrivals:
+            t = math.sqrt(2 * ramp * n / rate)
+        else:
+            t = ramp + (n - ramp_arrivals) / rate
+        if t > duration:
+            return
+        yield t
+        n += 1
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no samples."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+# ---------------- results ----------------
+class Results:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations = collections.defaultdict(list)
+        self.server = collections.defaultdict(list)
+        self.errors = collections.defaultdict(int)
+        self.error_samples = collections.defaultdict(list)
+        self.queue_lag = []
+        self.dropped = 0
+
+    def record(self, scenario: str, seconds: float, server: list[float], lag: float, error: str = ""):
+        with self.lock:
+            self.durations[scenario].append(seconds)
+            self.server[scenario].extend(server)
+            self.queue_lag.append(lag)
+            if error:
+                self.errors[scenario] += 1
+                if len(self.error_samples[scenario]) < 3:
+                    self.error_samples[scenario].append(error)
+
+    def summary(self) -> dict:
+        out = {}
+        for name in sorted(self.durations):
+            d, s = self.durations[name], self.server[name]
+            out[name] = {
+                "count": len(d), "errors": self.errors[name],
+                "error_rate": self.errors[name] / len(d) if d else 0.0,
+                "duration": {f"p{p}": round(percentile(d, p), 3) for p in (50, 90, 95, 99)},
+                "server": {f"p{p}": round(percentile(s, p), 3) for p in (50, 90, 95, 99)},
+                "server_samples": len(s),
+                "error_samples": self.error_samples[name],
+            }
+        return {"scenarios": out, "dropped": self.dropped,
+                "queue_lag_p95": round(percentile(self.queue_lag, 95), 3)}
+
+
+# ---------------- virtual users ----------------
+class _EmployeePool:
+    """Employees created during the run, shared by the job_details scenario."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items = collections.deque(maxlen=500)
+
+    def add(self, emp_number: int):
+        with self.lock:
+            self.items.append(emp_number)
+
+    def pick(self, rng: random.Random) -> int | None:
+        with self.lock:
+            return rng.choice(self.items) if self.items else None
+
+
+class HttpUser:
+    """Runs scenarios through the REST API with one pooled session per user."""
+
+    def __init__(self, opts, pool: _EmployeePool, rng: random.Random, data: EmployeeDataGenerator | None = None):
+        self.opts, self.pool, self.rng = opts, pool, rng
+        self.data = data or EmployeeDataGenerator(opts.seed)
+        self.api = None
+        self._lookups = {}
+        self._latencies: list[float] = []
+
+    def _new_api(self):
+        from utils.hrm_api import HrmApi
+
+        api = HrmApi(self.opts.app_url, pool_size=2)
+        api.session.hooks["response"].append(self._on_response)
+        return api.login(self.opts.username, self.opts.password)
+
+    def _on_response(self, resp, *args, **kwargs):
+        if "/api/v2/" in resp.url:
+            self._latencies.append(resp.elapsed.total_seconds())
+
+    def _create(self) -> int:
+        rec = self.data.take()
+        emp = self.api.create_employee(rec.first, rec.middle, rec.last, employee_id=new_tag(self.opts.tag_prefix))
+        self.pool.add(emp["empNumber"])
+        return emp["empNumber"]
+
+    def _ids(self, resource: str) -> list[int]:
+        if resource not in self._lookups:
+            self._lookups[resource] = [row["id"] for row in self.api.list_options(resource)]
+        return self._lookups[resource]
+
+    def run(self, scenario: str) -> list[float]:
+        self._latencies = []
+        if scenario == "login" or self.api is None:
+            self.close()   # a login starts a new session; don't leave the old one's sockets open
+            self.api = self._new_api()
+        if scenario == "search":
+            self.api.search_employees(self.rng.choice(self.data.catalog.first_names))
+        elif scenario == "add_employee":
+            self._create()
+        elif scenario == "job_details":
+            emp_number = self.pool.pick(self.rng) or self._create()
+            pick = lambda res: self.rng.choice(self._ids(res))
+            self.api.update_job_details(
+                emp_number, joinedDate=datetime.date.today().isoformat(),
+                jobTitleId=pick("admin/job-titles"), jobCategoryId=pick("admin/job-categories"),
+                subunitId=pick("admin/subunits"), locationId=pick("admin/locations"),
+                empStatusId=pick("admin/employment-statuses"),
+            )
+        elif scenario != "login":
+            raise ValueError(f"Unknown scenario: {scenario}")
+        return self._latencies
+
+    def close(self):
+        if self.api is not None:
+            self.api.session.close()
+            self.api = None
+
+
+class BrowserUser:
+    """Runs scenarios with the page objects in a dedicated Chrome."""
+
+    def __init__(self, opts, pool: _EmployeePool, rng: random.Random, data: EmployeeDataGenerator | None = None):
+        self.opts, self.pool, self.rng = opts, pool, rng
+        self.data = data or EmployeeDataGenerator(opts.seed)
+        self.driver = None
+        self.logged_in = False
+
+    def _start(self):
+        from utils.browser import chrome_options, new_driver
+
+        chrome = chrome_options()
+        if self.opts.headless:
+            chrome.add_argument("--headless=new")
+        chrome.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        self.driver = new_driver(chrome)
+
+    def _server_latencies(self) -> list[float]:
+        """Request-sent → headers-received for every /api/v2 response since the last call."""
+        out = []
+        for entry in self.driver.get_log("performance"):
+            msg = json.loads(entry["message"])["message"]
+            if msg.get("method") != "Network.responseReceived":
+                continue
+            resp = msg["params"]["response"]
+            timing = resp.get("timing")
+            if timing and "/api/v2/" in resp.get("url", ""):
+                out.append(max(0.0, timing["receiveHeadersEnd"] - timing["sendEnd"]) / 1000)
+        return out
+
+    def _add_employee(self) -> int:
+        from pages.add_employee_page import AddEmployeePage
+        from pages.pim_page import PIMPage
+
+        assert PIMPage(self.driver).open_add_employee(), "Could not open Add Employee"
+        add = AddEmployeePage(self.driver)
+        rec = self.data.take()
+        add.fill_employee_details(rec.first, rec.middle, rec.last, employee_id=new_tag(self.opts.tag_prefix))
+        add.save_employee()
+        emp_number = add.get_emp_number()
+        self.pool.add(emp_number)
+        return emp_number
+
+    def run(self, scenario: str) -> list[float]:
+        from pages.employee_list_page import EmployeeListPage
+        from pages.job_details_page import JobDetailsPage
+        from pages.login_page import LoginPage
+        from pages.pim_page import PIMPage
+
+        if self.driver is None:
+            self._start()
+        self._server_latencies()  # drop events from before this scenario
+        if scenario == "login" or not self.logged_in:
+            self.driver.delete_all_cookies()
+            self.logged_in = LoginPage(self.driver).login(self.opts.username, self.opts.password)
+        if scenario == "search":
+            assert PIMPage(self.driver).open_employee_list(), "Could not open Employee List"
+            EmployeeListPage(self.driver).search_employee(name=self.rng.choice(self.data.catalog.first_names))
+        elif scenario == "add_employee":
+            self._add_employee()
+        elif scenario == "job_details":
+            emp_number = self.pool.pick(self.rng) or self._add_employee()
+            PIMPage(self.driver).open_employee(emp_number)
+            JobDetailsPage(self.driver).set_job_details(
+                joined_date=datetime.date.today().isoformat(), job_title="*", job_category="*",
+                sub_unit="*", location="*", employment_status="*",
+            )
+        elif scenario != "login":
+            raise ValueError(f"Unknown scenario: {scenario}")
+        return self._server_latencies()
+
+    def close(self):
+        if self.driver is not None:
+            self.driver.quit()
+
+
+# ---------------- driver ----------------
+def run_load(opts) -> dict:
+    mix = parse_mix(opts.mix)
+    names, weights = list(mix), list(mix.values())
+    rng = random.Random(opts.seed)
+    results = Results()
+    pool = _EmployeePool()
+    work: queue.Queue = queue.Queue(maxsize=max(1, opts.users * 2))
+    done = threading.Event()
+    user_cls = HttpUser if opts.mode == "http" else BrowserUser
+
+    def vu(index: int):
+        # each user creates a disjoint slice of the seeded records, so names never collide
+        data = EmployeeDataGenerator(opts.seed, offset=index, stride=opts.users)
+        user = user_cls(opts, pool, random.Random(f"{opts.seed}-{index}"), data)
+        try:
+            while not (done.is_set() and work.empty()):
+                try:
+                    scenario, scheduled = work.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                lag = time.monotonic() - scheduled
+                start = time.perf_counter()
+                try:
+                    server = user.run(scenario)
+                    results.record(scenario, time.perf_counter() - start, server, lag)
+                except Exception as e:
+                    results.record(scenario, time.perf_counter() - start, [], lag, f"{type(e).__name__}: {e}")
+        finally:
+            user.close()
+
+    threads = [threading.Thread(target=in_context(vu), args=(i,), daemon=True) for i in range(opts.users)]
+    for t in threads:
+        t.start()
+
+    start = time.monotonic()
+    for offset in arrival_times(opts.rate, opts.ramp, opts.duration):
+        delay = start + offset - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        scenario = rng.choices(names, weights)[0]
+        try:
+            work.put_nowait((scenario, start + offset))
+        except queue.Full:
+            with results.lock:
+                results.dropped += 1
+    done.set()
+    for t in threads:
+        t.join()
+
+    summary = results.summary()
+    summary["config"] = {k: getattr(opts, k) for k in ("mode", "users", "rate", "ramp", "duration", "mix", "seed")}
+    summary["elapsed"] = round(time.monotonic() - start, 1)
+    return summary
+
+
+def format_summary(summary: dict) -> list[str]:
+    lines = [f"{'scenario':<14} {'count':>6} {'err%':>6}   {'dur p50':>8} {'p95':>7} {'p99':>7}"
+             f"   {'srv p50':>8} {'p95':>7} {'p99':>7}"]
+    for name, s in summary["scenarios"].items():
+        d, v = s["duration"], s["server"]
+        lines.append(f"{name:<14} {s['count']:>6} {s['error_rate']:>6.1%}   {d['p50']:>8.3f} {d['p95']:>7.3f} "
+                     f"{d['p99']:>7.3f}   {v['p50']:>8.3f} {v['p95']:>7.3f} {v['p99']:>7.3f}")
+        for sample in s["error_samples"]:
+            lines.append(f"    ! {sample[:150]}")
+    lines.append(f"dropped arrivals: {summary['dropped']}   queue lag p95: {summary['queue_lag_p95']:.3f}s   "
+                 f"elapsed: {summary['elapsed']}s")
+    return lines
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--mode", choices=("browser", "http"), default="http")
+    ap.add_argument("--users", type=int, default=5, help="concurrent virtual users")
+    ap.add_argument("--rate", type=float, default=1.0, help="target arrivals per second")
+    ap.add_argument("--ramp", type=float, default=0.0, help="seconds to ramp from 0 to --rate")
+    ap.add_argument("--duration", type=float, default=60.0, help="seconds of arrivals (ramp included)")
+    ap.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted scenarios (default {DEFAULT_MIX})")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--headless", action="store_true", help="browser mode: run Chrome headless")
+    ap.add_argument("--tag-prefix", default=None,
+                    help="Employee Id prefix for created records (default EMPLOYEE_TAG_PREFIX from .env; "
+                         "remove them with tools.cleanup)")
+    ap.add_argument("--base-url", help="host to test (default: BASE_URL from .env)")
+    ap.add_argument("--username")
+    ap.add_argument("--password")
+    ap.add_argument("--json", metavar="PATH", help="also write the summary as JSON")
+    opts = ap.parse_args(argv)
+
+    if not (opts.base_url and opts.username and opts.password and opts.tag_prefix):
+        from utils import config  # only needed for the values not given on the command line
+        opts.base_url = opts.base_url or config.APP_URL[: -len("/web/index.php")]
+        opts.username = opts.username or config.USERNAME
+        opts.password = opts.password or config.PASSWORD
+        opts.tag_prefix = opts.tag_prefix or config.EMPLOYEE_TAG_PREFIX
+    opts.app_url = f"{opts.base_url.rstrip('/')}/web/index.php"
+    try:
+        new_tag(opts.tag_prefix)
+    except ValueError as e:
+        ap.error(str(e))
+
+    summary = run_load(opts)
+    for line in format_summary(summary):
+        print(line)
+    if opts.json:
+        with open(opts.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
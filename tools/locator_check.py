@@ -0,0 +1,42 @@
+# tools/locator_check.py
+"""
+Pre-flight check of every page-object locator against captured DOM snapshots.
+
+    python -m tools.locator_check                  # problems only
+    python -m tools.locator_check -v --slow-ms 2   # every locator with match counts
+
+Exit status 1 when a locator matches nothing, matches more than one element
+(unless expected), or does not parse. Snapshots come from `python -m tools.capture_dom`.
+The same check runs before a pytest session with `--preflight-locators`.
+"""
+import argparse
+import os
+import sys
+import time
+
+from utils.locator_check import check_locators, format_results, load_snapshots
+
+DEFAULT_DIR = os.path.join("snapshots", "dom")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--snapshots", default=DEFAULT_DIR, help=f"directory of <screen>.html files (default {DEFAULT_DIR})")
+    ap.add_argument("--slow-ms", type=float, default=5.0, help="flag locators slower than this on any screen")
+    ap.add_argument("-v", "--verbose", action="store_true", help="list every locator, not only problems")
+    args = ap.parse_args(argv)
+
+    start = time.perf_counter()
+    snapshots = load_snapshots(args.snapshots)
+    if not snapshots:
+        print(f"No snapshots in {args.snapshots}; run `python -m tools.capture_dom` first", file=sys.stderr)
+        return 2
+    results = check_locators(snapshots, slow_ms=args.slow_ms)
+    for line in format_results(results, args.verbose):
+        print(line)
+    print(f"({len(snapshots)} snapshot(s), {time.perf_counter() - start:.2f}s)")
+    return 1 if any(r.status in ("missing", "ambiguous", "invalid") for r in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+# tools/merge_shards.py
+"""
+Combine the reports of `pytest --shard i/N` runners into one run summary.
+
+    HRM_RUN_ID=nightly-42 pytest --shard 1/3      # runner 1 (REPORTS_DIR=reports)
+    ...
+    python -m tools.merge_shards runner1/reports runner2/reports runner3/reports --out reports/merged
+
+Writes <out>/history/merged.jsonl (the dashboard reads it), collects each runner's
+step stats, wait stats, browser health, traces and profiles under <out>/ so the
+existing tools work on the merged tree, and prints outcomes, per-shard wall time
+and how close the split came to a linear speed-up.
+"""
+import argparse
+import os
+import shutil
+from collections import Counter
+
+from utils.report_store import iter_records, merge
+from utils.step_stats import format_flakiness, load_stats
+
+# Per-worker *.json dumps read from ONE directory (flat) vs. trees read recursively
+FLAT_ARTIFACTS = ("steps", "waits", "browser_health")
+TREE_ARTIFACTS = ("traces", "profile")
+
+
+def collect_artifacts(sources: list[str], out: str) -> int:
+    copied = 0
+    for i, src in enumerate(sources, 1):
+        label = f"shard{i}"
+        for sub in FLAT_ARTIFACTS:
+            d = os.path.join(src, sub)
+            if not os.path.isdir(d):
+                continue
+            os.makedirs(os.path.join(out, sub), exist_ok=True)
+            for name in os.listdir(d):
+                shutil.copy2(os.path.join(d, name), os.path.join(out, sub, f"{label}-{name}"))
+                copied += 1
+        for sub in TREE_ARTIFACTS:
+            d = os.path.join(src, sub)
+            if os.path.isdir(d):
+                shutil.copytree(d, os.path.join(out, sub, label), dirs_exist_ok=True)
+                copied += sum(len(files) for _, _, files in os.walk(d))
+    return copied
+
+
+def shard_summary(sources: list[str], run_id: str | None = None) -> list[str]:
+    lines = []
+    outcomes = Counter()
+    walls, test_time = [], 0.0
+    for i, src in enumerate(sources, 1):
+        records = [r for r in iter_records([os.path.join(src, "history")])
+                   if run_id is None or r.get("run_id") == run_id]
+        tests = [r for r in records if r.get("type") == "test"]
+        starts = [r["ts"] for r in records if r.get("type") == "session_start"]
+        ends = [r["ts"] for r in records if r.get("type") == "session_finish"]
+        wall = (max(ends) - min(starts)) if starts and ends else sum(r.get("duration", 0.0) for r in tests)
+        busy = sum(r.get("duration", 0.0) for r in tests)
+        shard = next((r.get("shard") for r in records if r.get("shard")), "?")
+        outcomes.update(r.get("outcome") for r in tests)
+        walls.append(wall)
+        test_time += busy
+        lines.append(f"shard{i} ({shard}): {len(tests)} tests, {busy:.0f}s in tests, {wall:.0f}s wall  [{src}]")
+
+    total = sum(outcomes.values())
+    lines.insert(0, f"{total} tests: " + ", ".join(f"{n} {o}" for o, n in outcomes.most_common()))
+    if walls and max(walls):
+        longest = max(walls)
+        lines.append(f"wall {longest:.0f}s for {test_time:.0f}s of tests: {test_time / longest:.1f}x speed-up "
+                     f"on {len(walls)} runners ({test_time / longest / len(walls):.0%} of linear); "
+                     f"slowest/fastest shard {longest / max(min(walls), 1e-9):.2f}")
+    return lines
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="+", help="REPORTS_DIR of each shard runner")
+    ap.add_argument("--out", default=os.path.join("reports", "merged"))
+    ap.add_argument("--run-id", help="only count records of this run (default: everything in the sources)")
+    args = ap.parse_args(argv)
+
+    histories = [os.path.join(s, "history") for s in args.sources if os.path.isdir(os.path.join(s, "history"))]
+    written = merge(histories, os.path.join(args.out, "history", "merged.jsonl")) if histories else 0
+    copied = collect_artifacts(args.sources, args.out)
+    print(f"merged {written} result records and {copied} artifact file(s) into {args.out}")
+    for line in shard_summary(args.sources, args.run_id):
+        print(line)
+    flaky = load_stats(os.path.join(args.out, "steps"))
+    if any(st.retries or st.failures for st in flaky.values()):
+        print("\nflaky page-object steps (all shards):")
+        for line in format_flakiness(flaky):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
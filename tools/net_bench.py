@@ -0,0 +1,90 @@
+# tools/net_bench.py
+"""
+Run the end-to-end flows under each network profile and compare the page-object waits.
+
+    python -m tools.net_bench                                  # none, 4g, 3g, slow-3g, satellite
+    python -m tools.net_bench -p none -p 3g -p latency=800,down=500 -- tests/test_login.py -k job
+
+Each profile is one `pytest --net-profile <p>` run with its own REPORTS_DIR
+(reports/net_bench/<profile>/). The summary shows pass counts and wall time per
+profile, then every wait site with its p95 (or TIMEOUT count) under each profile —
+the 5 s autocomplete and 8 s table-change waits in EmployeeListPage.search_employee
+are the first to run out of headroom.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+from utils.netprofile import parse_profile
+from utils.report_store import iter_records
+from utils.wait_stats import load_waits
+
+DEFAULT_PROFILES = ["none", "4g", "3g", "slow-3g", "satellite"]
+
+
+def _slug(profile: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", profile)
+
+
+def _run(profile: str, out_dir: str, run_id: str, pytest_args: list[str]) -> tuple[float, int]:
+    env = dict(os.environ, REPORTS_DIR=out_dir, HRM_RUN_ID=run_id)
+    cmd = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "--net-profile", profile, *pytest_args]
+    start = time.perf_counter()
+    code = subprocess.call(cmd, env=env)
+    return time.perf_counter() - start, code
+
+
+def _cell(stat) -> str:
+    if stat is None:
+        return "-"
+    if stat.timeouts:
+        return f"TIMEOUT {stat.timeouts}/{stat.calls}"
+    return f"{stat.percentile(0.95):.2f}s"
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-p", "--profile", action="append", dest="profiles",
+                    help=f"profile name or custom spec, repeatable (default {' '.join(DEFAULT_PROFILES)})")
+    ap.add_argument("--out", default=os.path.join("reports", "net_bench"))
+    ap.add_argument("pytest_args", nargs="*", help="passed to pytest after --")
+    args = ap.parse_args(argv)
+
+    profiles = args.profiles or DEFAULT_PROFILES
+    for p in profiles:
+        parse_profile(p)  # fail fast on typos
+
+    runs = {}
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    for profile in profiles:
+        out_dir = os.path.join(args.out, _slug(profile))
+        run_id = f"net-{_slug(profile)}-{stamp}"
+        print(f"=== {profile} ===", flush=True)
+        seconds, _ = _run(profile, out_dir, run_id, args.pytest_args)
+        runs[profile] = (seconds, out_dir, run_id)
+
+    print(f"\n{'profile':<28} {'passed':>7} {'failed':>7} {'wall':>8}")
+    waits = {}
+    for profile, (seconds, out_dir, run_id) in runs.items():
+        tests = [r for r in iter_records([os.path.join(out_dir, "history")])
+                 if r.get("type") == "test" and r.get("run_id") == run_id]
+        passed = sum(r["outcome"] == "passed" for r in tests)
+        print(f"{profile:<28} {passed:7d} {len(tests) - passed:7d} {seconds:7.0f}s")
+        waits[profile] = next(iter(load_waits(os.path.join(out_dir, "waits")).values()), {})
+
+    sites = sorted({s for stats in waits.values() for s in stats},
+                   key=lambda s: min(st[s].headroom for st in waits.values() if s in st))
+    width = max([len(s) for s in sites] + [20])
+    print(f"\n{'wait site (p95 / timeouts)':<{width}} {'timeout':>7}  " + "  ".join(f"{p[:16]:>16}" for p in profiles))
+    for site in sites:
+        timeout = max(waits[p][site].timeout for p in waits if site in waits[p])
+        cells = "  ".join(f"{_cell(waits.get(p, {}).get(site)):>16}" for p in profiles)
+        print(f"{site:<{width}} {timeout:6.0f}s  {cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
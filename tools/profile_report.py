@@ -0,0 +1,57 @@
+# tools/profile_report.py
+"""
+Merge the per-test cProfile output of `pytest --profile-python` across workers.
+
+    python -m tools.profile_report                         # reports/profile
+    python -m tools.profile_report reports/profile --top 40 --per-test
+    python -m tools.profile_report --area pages            # only our page objects
+    python -m tools.profile_report --out merged.pstats     # for snakeviz / pstats browsing
+
+The first line splits the profiled time into waiting on I/O (chromedriver, the
+browser, the server) and running Python; the table lists where the Python time goes.
+"""
+import argparse
+import os
+import sys
+
+from utils.pyprofile import format_report, hotspots, merge_profiles, per_test, profile_files
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("paths", nargs="*", default=[os.path.join("reports", "profile")],
+                    help="*.pstats files or directories of them")
+    ap.add_argument("--top", type=int, default=25)
+    ap.add_argument("--area", help="only list hotspots of one area (pages, utils, tests, selenium, http, ...)")
+    ap.add_argument("--per-test", action="store_true", help="also list Python vs I/O time per test")
+    ap.add_argument("--out", help="write the merged profile here")
+    args = ap.parse_args(argv)
+
+    files = [f for p in args.paths for f in ([p] if p.endswith(".pstats") else profile_files(p))]
+    stats = merge_profiles(files)
+    if stats is None:
+        print("No profiles found; run pytest with --profile-python first", file=sys.stderr)
+        return 2
+    print(f"{len(files)} profile(s)")
+    if args.area:
+        for tottime, cumtime, ncalls, area, name in hotspots(stats, 10 ** 6, include_io=True):
+            if area == args.area:
+                print(f"{tottime:7.3f}s {cumtime:7.2f}s {ncalls:8d}  {name}")
+                args.top -= 1
+                if args.top <= 0:
+                    break
+    else:
+        for line in format_report(stats, args.top):
+            print(line)
+    if args.per_test:
+        print(f"\n{'python':>8} {'io wait':>8}  test")
+        for name, python, io in per_test(files):
+            print(f"{python:7.2f}s {io:7.2f}s  {name}")
+    if args.out:
+        stats.dump_stats(args.out)
+        print(f"merged profile written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+# tools/report_dashboard.py
+"""
+Render a compact HTML dashboard from the JSONL result store (utils/report_store.py).
+
+    python -m tools.report_dashboard                          # reports/history -> reports/dashboard.html
+    python -m tools.report_dashboard shard_dir_a shard_dir_b --last 20
+    python -m tools.report_dashboard ci1/ ci2/ --merge reports/merged.jsonl
+
+Shards from several workers or machines are merged just by passing them all in.
+Safe to run while tests are still writing.
+"""
+import argparse
+import html
+import os
+import statistics
+
+from utils.report_store import history_by_test, iter_records, merge
+
+_COLORS = {"passed": "#2e7d32", "failed": "#c62828", "error": "#ef6c00", "skipped": "#9e9e9e"}
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>OrangeHRM run dashboard</title>
+<style>
+body {{ font: 13px system-ui, sans-serif; margin: 1.5em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 3px 10px; border-bottom: 1px solid #ddd; text-align: left; }}
+td.num {{ text-align: right; font-variant-numeric: tabular-nums; }}
+.dot {{ display: inline-block; width: 9px; height: 9px; border-radius: 50%; margin-right: 2px; }}
+</style></head><body>
+<h2>OrangeHRM run dashboard</h2>
+<p>{summary}</p>
+<table>
+<tr><th>test</th><th>last {n} runs</th><th>duration trend</th><th>last</th><th>median</th><th>slowest step (last run)</th></tr>
+{rows}
+</table>
+{recycles}
+</body></html>
+"""
+
+
+def _sparkline(values: list[float], width: int = 120, height: int = 22) -> str:
+    if not values:
+        return ""
+    if len(values) == 1:
+        values = values * 2
+    hi = max(values) or 1.0
+    step = width / (len(values) - 1)
+    points = " ".join(f"{i * step:.1f},{height - 2 - (v / hi) * (height - 4):.1f}" for i, v in enumerate(values))
+    return (f'<svg width="{width}" height="{height}"><polyline fill="none" stroke="#1565c0" '
+            f'stroke-width="1.5" points="{points}"/></svg>')
+
+
+def render(paths, last_runs: int = 10) -> str:
+    records = list(iter_records(paths))
+    runs, tests = history_by_test(records, last_runs)
+    rows = []
+    for nodeid in sorted(tests):
+        per_run = tests[nodeid]
+        recent = [per_run[r] for r in runs if r in per_run]
+        if not recent:
+            continue
+        dots = "".join(
+            f'<span class="dot" title="{html.escape(r.get("outcome", ""))}" '
+            f'style="background:{_COLORS.get(r.get("outcome"), "#000")}"></span>'
+            for r in recent
+        )
+        durations = [float(r.get("duration", 0.0)) for r in recent]
+        steps = recent[-1].get("steps") or []
+        slowest = max(steps, key=lambda s: s.get("seconds", 0.0), default=None)
+        slowest_txt = f'{html.escape(slowest["name"])} ({slowest["seconds"]:.1f}s)' if slowest else ""
+        rows.append(
+            f"<tr><td>{html.escape(nodeid)}</td><td>{dots}</td><td>{_sparkline(durations)}</td>"
+            f'<td class="num">{durations[-1]:.1f}s</td><td class="num">{statistics.median(durations):.1f}s</td>'
+            f"<td>{slowest_txt}</td></tr>"
+        )
+    summary = f"{len(runs)} run(s), {len(rows)} test(s)"
+    if runs:
+        summary += f", latest run <code>{html.escape(str(runs[-1]))}</code>"
+    return _PAGE.format(summary=summary, n=len(runs), rows="\n".join(rows),
+                        recycles=_recycles(records, runs[-1] if runs else None))
+
+
+def _recycles(records, run_id) -> str:
+    """Browser recycle events (--reuse-browser) of the latest run."""
+    events = [r for r in records if r.get("type") == "browser_recycle" and r.get("run_id") == run_id]
+    if not events:
+        return ""
+    items = "\n".join(
+        f"<li>{html.escape(str(r.get('worker')))} browser {r.get('browser')} after {r.get('tests')} test(s) "
+        f"({html.escape(r.get('nodeid', ''))}): {html.escape(r.get('reason', ''))}</li>"
+        for r in events
+    )
+    return f"<h3>Browser recycles (latest run)</h3>\n<ul>\n{items}\n</ul>"
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("paths", nargs="*", default=[os.path.join("reports", "history")],
+                    help="shard files or directories of *.jsonl shards")
+    ap.add_argument("--last", type=int, default=10, help="number of most recent runs to show")
+    ap.add_argument("--out", default=os.path.join("reports", "dashboard.html"))
+    ap.add_argument("--merge", metavar="JSONL", help="also write all records into one merged shard")
+    args = ap.parse_args(argv)
+
+    if args.merge:
+        print(f"merged {merge(args.paths, args.merge)} records into {args.merge}")
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        f.write(render(args.paths, args.last))
+    print(f"dashboard written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,246 @@
+# tools/stub_server.py
+"""
+Local stand-in for the OrangeHRM endpoints the HTTP tooling uses.
+
+    python -m tools.stub_server --port 8089 --latency-ms 40 --error-rate 0.01
+
+Serves the login form + `/auth/validate` (session cookie) and an in-memory subset of
+`/api/v2`: employee search/create/bulk-delete, personal and job details, attachments
+and the admin lookups. Good enough to develop the load generator and API helpers
+without touching a real deployment; it does NOT serve the Vue UI, so browser-mode
+runs still need a real instance.
+"""
+import argparse
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PREFIX = "/web/index.php"
+
+LOOKUPS = {
+    "admin/job-titles": [{"id": i, "title": t} for i, t in
+                         enumerate(["QA Engineer", "Software Engineer", "HR Manager", "Account Assistant"], 1)],
+    "admin/job-categories": [{"id": i, "name": n} for i, n in
+                             enumerate(["Professionals", "Technicians", "Officials and Managers"], 1)],
+    "admin/subunits": [{"id": i, "name": n} for i, n in
+                       enumerate(["Quality Assurance", "Engineering", "Human Resources"], 1)],
+    "admin/locations": [{"id": 1, "name": "Texas R&D"}, {"id": 2, "name": "New York Sales Office"}],
+    "admin/employment-statuses": [{"id": i, "name": n} for i, n in
+                                  enumerate(["Full-Time Contract", "Full-Time Permanent", "Part-Time Internship"], 1)],
+    "admin/nationalities": [{"id": i, "name": n} for i, n in
+                            enumerate(["South African", "Kenyan", "British", "American"], 1)],
+}
+
+
+class StubState:
+    def __init__(self, username: str, password: str):
+        self.lock = threading.Lock()
+        self.username, self.password = username, password
+        self.tokens: set[str] = set()
+        self.sessions: set[str] = set()
+        self.employees: dict[int, dict] = {}
+        self.next_emp = 1
+
+    def new_employee(self, body: dict) -> dict:
+        with self.lock:
+            n = self.next_emp
+            self.next_emp += 1
+            emp = {"empNumber": n, "firstName": body.get("firstName", ""),
+                   "middleName": body.get("middleName", ""), "lastName": body.get("lastName", ""),
+                   "employeeId": body.get("employeeId") or f"{n:04d}", "terminationId": None,
+                   "personal": {"birthday": None, "gender": None, "maritalStatus": None, "nationality": None},
+                   "job": {}, "attachments": []}
+            self.employees[n] = emp
+            return emp
+
+
+def _summary(emp: dict) -> dict:
+    job = emp["job"]
+    return {k: emp[k] for k in ("empNumber", "firstName", "middleName", "lastName", "employeeId", "terminationId")} | {
+        "jobTitle": job.get("jobTitle") or {}, "subunit": job.get("subunit") or {},
+        "empStatus": job.get("empStatus") or {},
+    }
+
+
+def _lookup(resource: str, ident, key: str = "id"):
+    for row in LOOKUPS[resource]:
+        if row[key] == ident:
+            return row
+    return None
+
+
+def make_handler(state: StubState, latency: float, error_rate: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):  # keep the console quiet under load
+            pass
+
+        # ---------- plumbing ----------
+        def _send(self, status: int, body=b"", ctype="application/json", headers=None):
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self) -> bytes:
+            return self._payload
+
+        def _session(self) -> str | None:
+            m = re.search(r"orangehrm=([0-9a-f]+)", self.headers.get("Cookie", ""))
+            return m.group(1) if m and m.group(1) in state.sessions else None
+
+        def _dispatch(self, method: str):
+            # always drain the request body, or the next request on this keep-alive connection breaks
+            self._payload = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if latency:
+                time.sleep(random.expovariate(1 / latency))
+            url = urlparse(self.path)
+            path = url.path[len(PREFIX):] if url.path.startswith(PREFIX) else url.path
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if path.startswith("/api/v2/"):
+                if error_rate and random.random() < error_rate:
+                    return self._send(500, {"error": {"message": "injected failure"}})
+                if not self._session():
+                    return self._send(401, {"error": {"message": "Session expired"}})
+                return self._api(method, path[len("/api/v2/"):], query)
+            return self._web(method, path)
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def do_PUT(self):
+            self._dispatch("PUT")
+
+        def do_DELETE(self):
+            self._dispatch("DELETE")
+
+        # ---------- web ----------
+        def _web(self, method: str, path: str):
+            if method == "GET" and path == "/auth/login":
+                token = secrets.token_hex(16)
+                with state.lock:
+                    state.tokens.add(token)
+                page = f'<html><body><auth-login :token="&quot;{token}&quot;"></auth-login></body></html>'
+                return self._send(200, page.encode(), "text/html")
+            if method == "POST" and path == "/auth/validate":
+                form = {k: v[0] for k, v in parse_qs(self._body().decode()).items()}
+                ok = (form.get("_token") in state.tokens and form.get("username") == state.username
+                      and form.get("password") == state.password)
+                if not ok:
+                    return self._send(302, headers={"Location": f"{PREFIX}/auth/login"})
+                sid = secrets.token_hex(16)
+                with state.lock:
+                    state.tokens.discard(form["_token"])
+                    state.sessions.add(sid)
+                return self._send(302, headers={"Location": f"{PREFIX}/dashboard/index",
+                                                "Set-Cookie": f"orangehrm={sid}; Path=/; HttpOnly"})
+            if method == "GET" and path == "/dashboard/index":
+                if not self._session():
+                    return self._send(302, headers={"Location": f"{PREFIX}/auth/login"})
+                return self._send(200, b"<html><body><h6>Dashboard</h6></body></html>", "text/html")
+            return self._send(404, {"error": {"message": "Not found"}})
+
+        # ---------- api ----------
+        def _api(self, method: str, path: str, query: dict):
+            if path in LOOKUPS and method == "GET":
+                rows = LOOKUPS[path]
+                return self._send(200, {"data": rows, "meta": {"total": len(rows)}})
+
+            if path == "pim/employees":
+                if method == "GET":
+                    needle = query.get("nameOrId", "").lower()
+                    with state.lock:
+                        rows = [_summary(e) for e in state.employees.values()
+                                if needle in f"{e['firstName']} {e['middleName']} {e['lastName']}".lower()
+                                or needle in e["employeeId"].lower()]
+                    limit, offset = int(query.get("limit", 50)), int(query.get("offset", 0))
+                    page = rows[offset:offset + limit] if limit else rows[offset:]
+                    return self._send(200, {"data": page, "meta": {"total": len(rows)}})
+                if method == "POST":
+                    emp = state.new_employee(json.loads(self._body() or b"{}"))
+                    return self._send(200, {"data": _summary(emp), "meta": []})
+                if method == "DELETE":
+                    ids = json.loads(self._body() or b"{}").get("ids", [])
+                    with state.lock:
+                        gone = [state.employees.pop(i) for i in ids if i in state.employees]
+                    return self._send(200, {"data": [e["empNumber"] for e in gone], "meta": []})
+
+            m = re.fullmatch(r"pim/employees/(\d+)/(personal-details|job-details|screen/personal/attachments)", path)
+            if m:
+                emp = state.employees.get(int(m.group(1)))
+                if emp is None:
+                    return self._send(404, {"error": {"message": "Record Not Found"}})
+                part = m.group(2)
+                if part == "screen/personal/attachments":
+                    return self._send(200, {"data": emp["attachments"], "meta": {"total": len(emp["attachments"])}})
+                if part == "personal-details":
+                    if method == "PUT":
+                        body = json.loads(self._body() or b"{}")
+                        emp["personal"].update(
+                            birthday=body.get("birthday"), gender=body.get("gender"),
+                            maritalStatus=body.get("maritalStatus"),
+                            nationality=_lookup("admin/nationalities", body.get("nationalityId")))
+                    base = {k: emp[k] for k in ("empNumber", "firstName", "middleName", "lastName", "employeeId")}
+                    return self._send(200, {"data": base | emp["personal"], "meta": []})
+                if method == "PUT":
+                    body = json.loads(self._body() or b"{}")
+                    emp["job"] = {
+                        "joinedDate": body.get("joinedDate"),
+                        "jobTitle": _lookup("admin/job-titles", body.get("jobTitleId")),
+                        "jobCategory": _lookup("admin/job-categories", body.get("jobCategoryId")),
+                        "subunit": _lookup("admin/subunits", body.get("subunitId")),
+                        "location": _lookup("admin/locations", body.get("locationId")),
+                        "empStatus": _lookup("admin/employment-statuses", body.get("empStatusId")),
+                    }
+                return self._send(200, {"data": {"empNumber": emp["empNumber"], **emp["job"]}, "meta": []})
+
+            return self._send(404, {"error": {"message": "Not found"}})
+
+    return Handler
+
+
+def make_server(port: int = 0, username: str = "Admin", password: str = "admin123",
+                latency_ms: float = 0.0, error_rate: float = 0.0) -> tuple[ThreadingHTTPServer, StubState]:
+    """Build (not start) a stub server; port 0 picks a free port (see server.server_port)."""
+    state = StubState(username, password)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state, latency_ms / 1000.0, error_rate))
+    server.daemon_threads = True
+    return server, state
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--port", type=int, default=8089)
+    ap.add_argument("--username", default="Admin")
+    ap.add_argument("--password", default="admin123")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="mean of an exponential per-request delay")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="fraction of API calls answered with HTTP 500")
+    args = ap.parse_args(argv)
+
+    server, _ = make_server(args.port, args.username, args.password, args.latency_ms, args.error_rate)
+    print(f"OrangeHRM stub on http://127.0.0.1:{server.server_port}{PREFIX} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
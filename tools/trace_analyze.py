@@ -0,0 +1,54 @@
+# tools/trace_analyze.py
+"""
+Rank the redundant WebDriver commands recorded with `pytest --trace-commands`.
+
+    python -m tools.trace_analyze reports/traces            # top 20 across all tests
+    python -m tools.trace_analyze reports/traces --per-test # + a breakdown per test
+    python -m tools.trace_analyze reports/traces/gw0/tests_test_login.py_test_valid_login.jsonl
+
+Each line is one call site: total time lost, how often, what kind of waste
+(duplicate lookup, back-to-back waits, wasted scroll, repeated click) and the locator.
+"""
+import argparse
+import sys
+
+from utils.command_trace import analyze, load_traces, rank
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("paths", nargs="+", help="trace files or directories (reports/traces)")
+    ap.add_argument("--top", type=int, default=20)
+    ap.add_argument("--per-test", action="store_true", help="also list time lost per test")
+    args = ap.parse_args(argv)
+
+    traces = load_traces(args.paths)
+    if not traces:
+        print("No traces found; run pytest with --trace-commands first", file=sys.stderr)
+        return 2
+
+    findings, per_test = [], {}
+    total_cmds = total_ms = 0.0
+    for test, records in traces.items():
+        found = analyze(records)
+        findings += found
+        per_test[test] = (len(records), sum(r["ms"] for r in records), sum(f["ms"] for f in found))
+        total_cmds += len(records)
+        total_ms += per_test[test][1]
+
+    ranked = rank(findings)
+    lost = sum(a["ms"] for a in ranked)
+    print(f"{len(traces)} test(s), {int(total_cmds)} command(s), {total_ms / 1000:.1f}s in WebDriver; "
+          f"{lost / 1000:.1f}s ({lost / total_ms:.0%}) redundant" if total_ms else "no commands recorded")
+    for a in ranked[: args.top]:
+        print(f"{a['ms']:9.0f}ms {a['count']:4d}x  {a['kind']:<18} {a['site']:<45} {a['detail']}")
+
+    if args.per_test:
+        print()
+        for test, (cmds, ms, wasted) in sorted(per_test.items(), key=lambda kv: -kv[1][2]):
+            print(f"{wasted:9.0f}ms of {ms:7.0f}ms  {cmds:4d} cmds  {test}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+# utils/api_verify.py
+"""
+Read-only employee assertions answered through the REST API instead of the UI.
+
+Checks are queued first and resolved together: each distinct resource (one employee
+search, or one employee's personal details / job details / attachments) is fetched
+once, concurrently over the pooled session, however many checks read from it.
+
+    checks = EmployeeChecks(api)
+    checks.exists(first="Jane1234", middle="QA", last="Tester")
+    checks.fields(emp_number, nationality="South African", job_title="QA Engineer",
+                  attachment="attachment.txt")
+    checks.assert_all()
+
+Keep UI assertions (EmployeeListPage.verify_result_contains, ...) for what is really
+about rendering; use these for "is the data there / was it saved".
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.hrm_api import HrmApi
+from utils.logsetup import in_context
+
+_GENDERS = {1: "Male", 2: "Female", "1": "Male", "2": "Female"}
+
+
+def _name(obj, key="name"):
+    return (obj or {}).get(key)
+
+
+# field -> (resource, extractor); resource is a path under pim/employees/<empNumber>/
+FIELDS = {
+    "first_name":        ("personal-details", lambda d: d.get("firstName")),
+    "middle_name":       ("personal-details", lambda d: d.get("middleName")),
+    "last_name":         ("personal-details", lambda d: d.get("lastName")),
+    "employee_id":       ("personal-details", lambda d: d.get("employeeId")),
+    "nationality":       ("personal-details", lambda d: _name(d.get("nationality"))),
+    "marital_status":    ("personal-details", lambda d: d.get("maritalStatus")),
+    "dob":               ("personal-details", lambda d: d.get("birthday")),
+    "gender":            ("personal-details", lambda d: _GENDERS.get(d.get("gender"))),
+    "joined_date":       ("job-details", lambda d: d.get("joinedDate")),
+    "job_title":         ("job-details", lambda d: _name(d.get("jobTitle"), "title")),
+    "job_category":      ("job-details", lambda d: _name(d.get("jobCategory"))),
+    "sub_unit":          ("job-details", lambda d: _name(d.get("subunit"))),
+    "location":          ("job-details", lambda d: _name(d.get("location"))),
+    "employment_status": ("job-details", lambda d: _name(d.get("empStatus"))),
+    # list resource: passes when any attachment has this filename
+    "attachment":        ("screen/personal/attachments", lambda rows: [r.get("filename") for r in rows]),
+}
+
+
+class EmployeeChecks:
+    def __init__(self, api: HrmApi, max_parallel: int = 4):
+        self.api = api
+        self.max_parallel = max_parallel
+        self._exists: list[dict] = []
+        self._fields: list[tuple[int, str, object]] = []
+
+    # ---------- queue checks ----------
+    def exists(self, first: str, last: str | None = None, middle: str | None = None) -> "EmployeeChecks":
+        """Expect a current employee with these names (case-insensitive)."""
+        self._exists.append({"firstName": first, "middleName": middle, "lastName": last})
+        return self
+
+    def fields(self, emp_number: int, **expected) -> "EmployeeChecks":
+        """Expect field values on one employee; keys are the names in FIELDS."""
+        for field, value in expected.items():
+            if field not in FIELDS:
+                raise ValueError(f"Unknown employee field: {field} (known: {', '.join(FIELDS)})")
+            self._fields.append((emp_number, field, value))
+        return self
+
+    # ---------- resolve ----------
+    def _fetch_all(self) -> dict:
+        """One request per distinct resource, in parallel over the pooled session."""
+        wanted = {("search", c["firstName"]) for c in self._exists}
+        wanted |= {(emp, FIELDS[field][0]) for emp, field, _ in self._fields}
+
+        def fetch(key):
+            target, resource = key
+            if target == "search":
+                return key, self.api.search_employees(resource)
+            path = f"pim/employees/{target}/{resource}"
+            # list resources are paged; limit=0 returns every row
+            return key, self.api.get_data(path, limit=0) if resource.startswith("screen/") else self.api.get_data(path)
+
+        if not wanted:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(wanted))) as pool:
+            return dict(pool.map(in_context(fetch), sorted(wanted, key=str)))
+
+    def verify(self) -> list[str]:
+        """Resolve every queued check; returns failure messages (empty list = all passed)."""
+        data = self._fetch_all()
+        failures = []
+        for check in self._exists:
+            rows = data[("search", check["firstName"])]
+            wanted = {k: v.lower() for k, v in check.items() if v is not None}
+            if not any(all((row.get(k) or "").lower() == v for k, v in wanted.items()) for row in rows):
+                failures.append(f"No employee matching {wanted} (search returned {len(rows)} row(s))")
+        for emp_number, field, value in self._fields:
+            resource, extract = FIELDS[field]
+            actual = extract(data[(emp_number, resource)])
+            ok = value in actual if field == "attachment" else actual == value
+            if not ok:
+                failures.append(f"Employee {emp_number}: {field} is {actual!r}, expected {value!r}")
+        self._exists.clear()
+        self._fields.clear()
+        return failures
+
+    def assert_all(self) -> bool:
+        failures = self.verify()
+        if failures:
+            raise AssertionError("API verification failed:\n  " + "\n  ".join(failures))
+        return True
@@ -0,0 +1,28 @@
+# utils/browser.py
+"""Chrome construction shared by the pytest fixtures and the tools/ scripts."""
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+def chrome_options(incognito: bool = True, user_data_dir: str | None = None) -> webdriver.ChromeOptions:
+    """`user_data_dir` runs Chrome on a persistent profile (e.g. a warm clone) instead of incognito."""
+    opts = webdriver.ChromeOptions()
+    opts.add_argument("--start-maximized")
+    opts.add_argument("--lang=en-US")
+    opts.add_experimental_option("prefs", {
+        "intl.accept_languages": "en,en_US",
+        "translate": {"enabled": False},
+    })
+    if user_data_dir:
+        opts.add_argument(f"--user-data-dir={user_data_dir}")
+        opts.add_argument("--no-first-run")
+        opts.add_argument("--no-default-browser-check")
+    elif incognito:
+        opts.add_argument("--incognito")
+    return opts
+
+
+def new_driver(opts: webdriver.ChromeOptions | None = None):
+    """Start a Chrome session (same flags the `driver` fixture always used)."""
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts or chrome_options())
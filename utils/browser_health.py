@@ -0,0 +1,237 @@
+# utils/browser_health.py
+"""
+Browser health sampling and automatic recycling of reused browsers.
+
+After each test the monitor samples the browser's process-tree RSS (utils/procmem.py),
+the page's JS heap and DOM node count through CDP `Performance.getMetrics`, and how many
+WebDriver commands the browser has served. `BrowserPool` hands the same Chrome to
+consecutive tests and replaces it once any of the `HealthLimits` is exceeded:
+
+    pool = BrowserPool(new_driver, HealthLimits.from_config())
+    d = pool.acquire()
+    ...                                   # test runs
+    sample, reason = pool.release("tests/test_x.py::test_y")   # reason set when recycled
+"""
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+
+from utils.procmem import driver_rss
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class HealthLimits:
+    rss_mb: float = 1500.0
+    js_heap_mb: float = 300.0
+    dom_nodes: int = 60000
+    commands: int = 5000      # WebDriver commands served by one browser
+    tests: int = 0            # 0 = no limit
+
+    @classmethod
+    def from_config(cls) -> "HealthLimits":
+        from utils import config
+        return cls(config.BROWSER_MAX_RSS_MB, config.BROWSER_MAX_HEAP_MB, config.BROWSER_MAX_DOM_NODES,
+                   config.BROWSER_MAX_COMMANDS, config.BROWSER_MAX_TESTS)
+
+
+@dataclass
+class HealthSample:
+    browser: int
+    test: str
+    tests: int                       # tests served so far, including this one
+    commands: int
+    rss_mb: float | None = None
+    js_heap_mb: float | None = None
+    dom_nodes: int | None = None
+    seconds: float = 0.0             # time spent sampling
+
+
+def page_metrics(driver) -> dict:
+    """CDP Performance.getMetrics as {name: value}; {} when the driver has no CDP."""
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    except Exception:  # remote/non-Chromium driver, or the page is gone
+        return {}
+    return {m["name"]: m["value"] for m in metrics}
+
+
+def _slope(values: list[float]) -> float:
+    """Least-squares growth per test."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x, mean_y = (n - 1) / 2, sum(values) / n
+    num = sum((i - mean_x) * (v - mean_y) for i, v in enumerate(values))
+    return num / sum((i - mean_x) ** 2 for i in range(n))
+
+
+class BrowserMonitor:
+    """Health history of ONE browser instance."""
+
+    def __init__(self, driver, browser_id: int = 1):
+        self.driver = driver
+        self.browser_id = browser_id
+        self.commands = 0
+        self.samples: list[HealthSample] = []
+        executor = driver.command_executor
+        original = executor.execute
+
+        def execute(command, params):
+            self.commands += 1
+            return original(command, params)
+
+        executor.execute = execute
+
+    def sample(self, test: str) -> HealthSample:
+        start = time.perf_counter()
+        commands = self.commands   # don't count the sampling commands themselves
+        metrics = page_metrics(self.driver)
+        self.commands = commands
+        rss = driver_rss(self.driver)
+        s = HealthSample(
+            browser=self.browser_id, test=test, tests=len(self.samples) + 1, commands=commands,
+            rss_mb=round(rss / _MB, 1) if rss else None,
+            js_heap_mb=round(metrics["JSHeapUsedSize"] / _MB, 1) if "JSHeapUsedSize" in metrics else None,
+            dom_nodes=int(metrics["Nodes"]) if "Nodes" in metrics else None,
+        )
+        s.seconds = round(time.perf_counter() - start, 3)
+        self.samples.append(s)
+        return s
+
+    def over_limits(self, limits: HealthLimits) -> str | None:
+        """Why this browser should be recycled, or None."""
+        if not self.samples:
+            return None
+        s = self.samples[-1]
+        checks = [
+            ("rss_mb", s.rss_mb, limits.rss_mb, "MB RSS"),
+            ("js_heap_mb", s.js_heap_mb, limits.js_heap_mb, "MB JS heap"),
+            ("dom_nodes", s.dom_nodes, limits.dom_nodes, "DOM nodes"),
+            ("commands", s.commands, limits.commands, "commands"),
+            ("tests", s.tests, limits.tests, "tests"),
+        ]
+        reasons = [f"{value:g} {unit} >= {limit:g}" for _, value, limit, unit in checks
+                   if limit and value is not None and value >= limit]
+        return "; ".join(reasons) or None
+
+    def trend(self) -> dict:
+        """Growth per test of each sampled metric, plus first/last values."""
+        out = {"browser": self.browser_id, "tests": len(self.samples), "commands": self.commands}
+        for key in ("rss_mb", "js_heap_mb", "dom_nodes"):
+            values = [getattr(s, key) for s in self.samples if getattr(s, key) is not None]
+            if values:
+                out[key] = {"first": values[0], "last": values[-1], "per_test": round(_slope(values), 2)}
+        return out
+
+
+@dataclass
+class RecycleEvent:
+    browser: int
+    test: str                # last test the browser served
+    tests: int
+    reason: str
+
+
+class BrowserPool:
+    """One reused browser at a time; recycled whenever it passes the limits."""
+
+    def __init__(self, factory, limits: HealthLimits, reset=None):
+        self.factory = factory
+        self.limits = limits
+        self.reset = reset or reset_browser
+        self.monitor: BrowserMonitor | None = None
+        self.retired: list[BrowserMonitor] = []
+        self.recycles: list[RecycleEvent] = []
+        self._next_id = 1
+
+    def acquire(self):
+        if self.monitor is None:
+            self.monitor = BrowserMonitor(self.factory(), self._next_id)
+            self._next_id += 1
+        return self.monitor.driver
+
+    def release(self, test: str) -> tuple[HealthSample | None, str | None]:
+        """Sample after a test; recycle on limits, or when the browser can't be reset."""
+        monitor = self.monitor
+        if monitor is None:
+            return None, None
+        sample = monitor.sample(test)
+        reason = monitor.over_limits(self.limits)
+        if reason is None:
+            try:
+                self.reset(monitor.driver)
+            except Exception as e:  # crashed tab / lost session: never hand it to the next test
+                reason = f"reset failed: {type(e).__name__}"
+        if reason is not None:
+            self.recycles.append(RecycleEvent(monitor.browser_id, test, sample.tests, reason))
+            self._retire()
+        return sample, reason
+
+    def _retire(self) -> None:
+        monitor, self.monitor = self.monitor, None
+        self.retired.append(monitor)
+        try:
+            monitor.driver.quit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        if self.monitor is not None:
+            self._retire()
+
+    def trends(self) -> list[dict]:
+        return [m.trend() for m in self.retired + ([self.monitor] if self.monitor else [])]
+
+
+def reset_browser(driver) -> None:
+    """Make a reused browser look fresh to the next test: one blank tab, no cookies."""
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+def dump(path: str, pool_or_monitors) -> None:
+    """Write trends + recycle events of this process (read back by `load_reports`)."""
+    if isinstance(pool_or_monitors, BrowserPool):
+        data = {"trends": pool_or_monitors.trends(), "recycles": [asdict(r) for r in pool_or_monitors.recycles]}
+    else:
+        data = {"trends": [m.trend() for m in pool_or_monitors], "recycles": []}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+
+
+def load_reports(directory: str) -> dict[str, dict]:
+    """{worker: dumped data} for every *.json in `directory`."""
+    out = {}
+    if not os.path.isdir(directory):
+        return out
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                out[name[:-5]] = json.load(f)
+    return out
+
+
+def format_health(reports: dict[str, dict]) -> list[str]:
+    lines = []
+    for worker, data in reports.items():
+        for t in data["trends"]:
+            parts = [f"{worker}/browser {t['browser']}: {t['tests']} test(s), {t['commands']} cmds"]
+            for key, unit in (("rss_mb", "MB RSS"), ("js_heap_mb", "MB heap"), ("dom_nodes", "nodes")):
+                if key in t:
+                    m = t[key]
+                    parts.append(f"{m['first']:g}->{m['last']:g} {unit} ({m['per_test']:+g}/test)")
+            lines.append(", ".join(parts))
+        for r in data["recycles"]:
+            lines.append(f"{worker}/browser {r['browser']} recycled after {r['tests']} test(s) "
+                         f"({r['test']}): {r['reason']}")
+    return lines
@@ -0,0 +1,160 @@
+# utils/cleanup.py
+"""
+Tagging and bulk deletion of the employee records the automation creates.
+
+Every record the suite creates gets an Employee Id "tag": the configured prefix
+(config.EMPLOYEE_TAG_PREFIX, "QA" by default) + the creation hour in base 36 (rounded
+up, so a record never looks older than it is) + a 4-character sequence number, e.g.
+"QAsj3k2a7x" — 10 characters, OrangeHRM's limit. That makes suite records
+recognisable AND tells their age without any ledger, so orphans from crashed runs
+can be swept by an age policy later.
+
+Employee Ids must be unique, and a duplicate is rejected (422). The sequence starts
+at a random value in every process and counts up, so one process never repeats a
+tag within 36**4 records per hour, and concurrent processes (xdist workers, load
+generators) only collide if their sequence ranges happen to overlap in that hour.
+
+Deletion uses the bulk endpoint (DELETE /api/v2/pim/employees {"ids": [...]}),
+in batches.
+"""
+import datetime
+import itertools
+import logging
+import math
+import re
+import secrets
+import string
+import time
+from dataclasses import dataclass, field
+
+from utils.hrm_api import HrmApi, HrmApiError
+
+logger = logging.getLogger(__name__)
+
+_B36 = string.digits + string.ascii_lowercase
+EMPLOYEE_ID_MAX = 10   # OrangeHRM's Employee Id length limit
+_HOUR_CHARS = 4        # creation hour: 36**4 hours is ~190 years
+_SEQ_CHARS = 4
+_TAG_CHARS = _HOUR_CHARS + _SEQ_CHARS
+# next() on a count is atomic, so threads (tools.loadgen) share it safely
+_sequence = itertools.count(secrets.randbelow(36 ** _SEQ_CHARS))
+# Legacy suite records from before tagging: "Jane123 QA Tester" / "Jane1234 QA Tester"
+DEFAULT_NAME_PATTERN = r"^Jane\d{3,5} QA (Tester|Load)$"
+
+
+def _to_b36(n: int, width: int) -> str:
+    out = ""
+    while n:
+        n, r = divmod(n, 36)
+        out = _B36[r] + out
+    return out.rjust(width, "0")[-width:]
+
+
+def new_tag(prefix: str, now: float | None = None) -> str:
+    """Employee Id for a new suite record: prefix + 4 chars of hours since epoch + 4 chars of sequence."""
+    if len(prefix) > EMPLOYEE_ID_MAX - _TAG_CHARS:
+        raise ValueError(f"Employee Id tag prefix {prefix!r} is too long: at most "
+                         f"{EMPLOYEE_ID_MAX - _TAG_CHARS} characters fit OrangeHRM's "
+                         f"{EMPLOYEE_ID_MAX}-character Employee Id (check EMPLOYEE_TAG_PREFIX / --tag-prefix)")
+    hours = math.ceil((time.time() if now is None else now) / 3600)
+    return f"{prefix}{_to_b36(hours, _HOUR_CHARS)}{_to_b36(next(_sequence), _SEQ_CHARS)}"
+
+
+def tag_created_at(tag: str, prefix: str) -> datetime.datetime | None:
+    """Creation time encoded in a tag (rounded up to the hour), or None if `tag` is not one of ours."""
+    if not tag or not re.fullmatch(re.escape(prefix) + rf"[0-9a-z]{{{_TAG_CHARS}}}", tag):
+        return None
+    stamp = tag[len(prefix):]
+    if stamp.startswith("0"):
+        # the earlier format: 6 chars of creation minute (below 36**5 until 2085) + 2 random
+        seconds = int(stamp[:6], 36) * 60
+    else:   # hours since epoch only start with "0" before 1975
+        seconds = int(stamp[:_HOUR_CHARS], 36) * 3600
+    return datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+
+
+@dataclass
+class CleanupReport:
+    found: int = 0
+    removed: int = 0
+    failed: list = field(default_factory=list)
+    seconds: float = 0.0
+
+    def line(self) -> str:
+        text = f"removed {self.removed}/{self.found} employee record(s) in {self.seconds:.1f}s"
+        return text + (f", {len(self.failed)} failed" if self.failed else "")
+
+
+def delete_employees(api: HrmApi, emp_numbers, batch_size: int = 100) -> CleanupReport:
+    """Delete employees in batched API calls; a failing batch is retried one id at a time."""
+    ids = sorted(set(emp_numbers))
+    report = CleanupReport(found=len(ids))
+    start = time.perf_counter()
+    for i in range(0, len(ids), batch_size):
+        batch = ids[i:i + batch_size]
+        try:
+            api.request("DELETE", "pim/employees", json={"ids": batch})
+            report.removed += len(batch)
+            continue
+        except HrmApiError as e:
+            logger.warning("Bulk delete of %d employee(s) failed (%s); retrying one by one", len(batch), e)
+        for emp_number in batch:
+            try:
+                api.request("DELETE", "pim/employees", json={"ids": [emp_number]})
+                report.removed += 1
+            except HrmApiError:
+                report.failed.append(emp_number)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def iter_employees(api: HrmApi, page_size: int = 200):
+    """Every current employee (summary rows), page by page."""
+    offset = 0
+    while True:
+        rows = api.get_data("pim/employees", limit=page_size, offset=offset, includeEmployees="onlyCurrent")
+        yield from rows
+        if len(rows) < page_size:
+            return
+        offset += page_size
+
+
+def find_orphans(api: HrmApi, prefix: str, max_age: datetime.timedelta,
+                 name_pattern: str | None = None, now: datetime.datetime | None = None) -> list[int]:
+    """
+    empNumbers of suite records older than `max_age` (by their tag). With `name_pattern`,
+    untagged records whose "first middle last" name matches it are included too
+    (their age is unknown, so only use this for legacy clean-ups).
+    """
+    now = now or datetime.datetime.now(tz=datetime.timezone.utc)
+    name_re = re.compile(name_pattern) if name_pattern else None
+    orphans = []
+    for row in iter_employees(api):
+        created = tag_created_at(row.get("employeeId") or "", prefix)
+        if created is not None:
+            if now - created >= max_age:
+                orphans.append(row["empNumber"])
+        elif name_re is not None:
+            full = " ".join(p for p in (row.get("firstName"), row.get("middleName"), row.get("lastName")) if p)
+            if name_re.match(full):
+                orphans.append(row["empNumber"])
+    return orphans
+
+
+class CreatedRecords:
+    """Records created by this process, deleted together at session end."""
+
+    def __init__(self):
+        self.emp_numbers: list[int] = []
+
+    def add(self, emp_number: int) -> int:
+        self.emp_numbers.append(emp_number)
+        return emp_number
+
+    def delete_all(self, api: HrmApi) -> CleanupReport:
+        report = delete_employees(api, self.emp_numbers)
+        self.emp_numbers = list(report.failed)
+        return report
+
+
+CREATED = CreatedRecords()
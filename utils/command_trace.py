@@ -0,0 +1,256 @@
+# utils/command_trace.py
+"""
+Record every WebDriver command a test sends, and find the wasted ones.
+
+`CommandTrace.attach(driver)` wraps the driver's command executor: each command is
+logged with its duration, the page-object call site that issued it (e.g.
+`JobDetailsPage._select_dropdown_by_label:83`), and — when it was sent from inside
+a `WebDriverWait.until` — which wait/expected condition it belongs to.
+
+`analyze(records)` then reports, ranked by time lost:
+  - duplicate lookup:   the same locator found again with no input/navigation in between
+  - back-to-back waits: two waits in a row on the same locator (presence_of → clickable)
+  - wasted scroll:      a scroll superseded by another scroll before any interaction
+  - repeated click:     the same locator clicked twice in a row (e.g. Search clicked twice)
+"""
+import functools
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+_FIND = {"findElement", "findElements", "findChildElement", "findChildElements"}
+# Commands after which an earlier lookup / scroll may legitimately be repeated
+_CHANGES_STATE = {"clickElement", "sendKeysToElement", "clearElement", "get", "refresh", "back",
+                  "forward", "switchToWindow", "newWindow", "switchToFrame", "actions", "w3cActions",
+                  "w3cExecuteScript", "executeScript"}
+_ELEMENT_KEY = "element-6066-11e4-a52f-4d8b9f0e6a1a"
+
+_HERE = os.path.dirname(os.path.realpath(__file__))
+_ROOT = os.path.dirname(_HERE)
+_PAGES = os.path.join(_ROOT, "pages")
+_TESTS = os.path.join(_ROOT, "tests")
+
+
+@functools.lru_cache(maxsize=None)
+def _area(filename: str) -> str:
+    """'pages', 'tests' or 'repo' for a source file of this repo (outside utils/), else ''."""
+    path = os.path.realpath(filename)
+
+    def under(directory):
+        try:
+            return os.path.commonpath([path, directory]) == directory
+        except ValueError:   # "<string>", another drive
+            return False
+
+    if not under(_ROOT) or under(_HERE):
+        return ""
+    return "pages" if under(_PAGES) else "tests" if under(_TESTS) else "repo"
+
+
+def _call_site():
+    """(page-object/test call site, wait condition, the enclosing WebDriverWait.until frame)."""
+    site, condition, wait_frame = "", None, None
+    frame = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename
+        if filename.endswith(os.path.join("support", "wait.py")) and code.co_name == "until" and wait_frame is None:
+            wait_frame = frame
+        elif filename.endswith("expected_conditions.py") and condition is None:
+            condition = getattr(code, "co_qualname", code.co_name).split(".<locals>")[0]
+        elif not site and _area(filename):
+            area = _area(filename)
+            owner = frame.f_locals.get("self")
+            prefix = f"{type(owner).__name__}." if owner is not None and area == "pages" else ""
+            site = f"{prefix}{code.co_name}:{frame.f_lineno}"
+            if area != "repo":   # a page object or a test: the caller that matters
+                break
+        frame = frame.f_back
+    return site or "?", condition, wait_frame
+
+
+def _summarize(command: str, params: dict) -> dict:
+    out = {}
+    if command in _FIND:
+        out["locator"] = f"{params.get('using')}={params.get('value')}"
+    if "id" in params and isinstance(params.get("id"), str):
+        out["element"] = params["id"]
+    if "script" in params:
+        out["script"] = " ".join(params["script"].split())[:100]
+        out["elements"] = [a[_ELEMENT_KEY] for a in params.get("args", []) if isinstance(a, dict) and _ELEMENT_KEY in a]
+    if command == "get":
+        out["url"] = params.get("url")
+    return out
+
+
+class CommandTrace:
+    def __init__(self, test_id: str = ""):
+        self.test_id = test_id
+        self.records: list[dict] = []
+        self._t0 = time.perf_counter()
+        self._executor = None
+        self._original = None
+        self._wait_frame = None   # held so its identity can't be reused by the next wait
+        self._wait_seq = 0
+
+    def attach(self, driver) -> "CommandTrace":
+        executor = driver.command_executor
+        original = executor.execute
+
+        def execute(command, params):
+            site, condition, wait_frame = _call_site()
+            if wait_frame is not None and wait_frame is not self._wait_frame:
+                self._wait_seq += 1
+            self._wait_frame = wait_frame
+            wait_id = self._wait_seq if wait_frame is not None else None
+            start = time.perf_counter()
+            error, response = None, None
+            try:
+                response = original(command, params)
+                return response
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                rec = {"seq": len(self.records), "cmd": command,
+                       "t": round((start - self._t0) * 1000, 1),
+                       "ms": round((time.perf_counter() - start) * 1000, 2),
+                       "site": site, **_summarize(command, params or {})}
+                if condition:
+                    rec["wait"] = condition
+                if wait_id is not None:
+                    rec["wait_id"] = wait_id
+                if error:
+                    rec["error"] = error
+                elif command in ("findElement", "findChildElement"):
+                    value = (response or {}).get("value")
+                    if isinstance(value, dict) and _ELEMENT_KEY in value:
+                        rec["found"] = value[_ELEMENT_KEY]
+                self.records.append(rec)
+
+        executor.execute = execute
+        self._executor, self._original = executor, original
+        return self
+
+    def detach(self) -> None:
+        if self._executor is not None:
+            self._executor.execute = self._original
+            self._executor = None
+        self._wait_frame = None
+
+    def dump(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for rec in self.records:
+                f.write(json.dumps({"test": self.test_id, **rec}) + "\n")
+
+
+# ---------------- analysis ----------------
+def _is_scroll(rec: dict) -> bool:
+    return "scroll" in rec.get("script", "").lower() and "click" not in rec.get("script", "").lower()
+
+
+def analyze(records: list[dict]) -> list[dict]:
+    """Findings for ONE test's records (in command order)."""
+    findings = []
+    element_locator: dict[str, str] = {}
+    last_find: dict[str, dict] = {}       # locator -> last find record since a state change
+    last_wait = None                      # wait group of the previous WebDriverWait.until
+    wait_groups: dict[int, dict] = {}
+    pending_scroll = None
+    last_click = None
+
+    def finding(kind, rec, ms, detail):
+        findings.append({"kind": kind, "site": rec["site"], "ms": round(ms, 2), "detail": detail,
+                         "test": rec.get("test", "")})
+
+    # group wait polls first: one entry per WebDriverWait.until call
+    for rec in records:
+        wid = rec.get("wait_id")
+        if wid is None:
+            continue
+        g = wait_groups.setdefault(wid, {"first": rec["seq"], "ms": 0.0, "locator": None,
+                                         "condition": rec.get("wait"), "site": rec["site"]})
+        g["ms"] += rec["ms"]
+        g["locator"] = g["locator"] or rec.get("locator")
+
+    for rec in records:
+        cmd = rec["cmd"]
+        if "found" in rec and "locator" in rec:
+            element_locator[rec["found"]] = rec["locator"]
+
+        # --- back-to-back waits on the same locator ---
+        wid = rec.get("wait_id")
+        if wid is not None and wait_groups[wid]["first"] == rec["seq"]:
+            g = wait_groups[wid]
+            if last_wait is not None and last_wait["locator"] and last_wait["locator"] == g["locator"]:
+                finding("back-to-back waits", rec, g["ms"],
+                        f"{last_wait['condition']} then {g['condition']} on {g['locator']}")
+            last_wait = g
+        elif wid is None and cmd in _CHANGES_STATE and not _is_scroll(rec):
+            last_wait = None
+
+        # --- duplicate lookups ---
+        if cmd in _FIND and "locator" in rec:
+            prev = last_find.get(rec["locator"])
+            # polls of one wait, and wait-after-wait (reported above), are not duplicate lookups
+            both_waits = prev is not None and wid is not None and prev.get("wait_id") is not None
+            if prev is not None and not both_waits and "error" not in prev:
+                finding("duplicate lookup", rec, rec["ms"], f"{rec['locator']} (first at {prev['site']})")
+            last_find[rec["locator"]] = rec
+
+        # --- wasted scrolls ---
+        if cmd in ("executeScript", "w3cExecuteScript") and _is_scroll(rec):
+            if pending_scroll is not None:
+                finding("wasted scroll", pending_scroll, pending_scroll["ms"],
+                        f"superseded by scroll at {rec['site']}")
+            pending_scroll = rec
+        elif cmd in _CHANGES_STATE:
+            pending_scroll = None
+
+        # --- repeated clicks ---
+        if cmd == "clickElement":
+            locator = element_locator.get(rec.get("element"), rec.get("element"))
+            if last_click is not None and last_click[0] == locator:
+                finding("repeated click", rec, rec["ms"], f"{locator} clicked again (first at {last_click[1]})")
+            last_click = (locator, rec["site"])
+        elif cmd in ("sendKeysToElement", "get", "clearElement"):
+            last_click = None
+
+        if cmd in _CHANGES_STATE and not _is_scroll(rec):
+            last_find.clear()
+    return findings
+
+
+def load_traces(paths) -> dict[str, list[dict]]:
+    """{test id: records} from trace files and/or directories of them."""
+    files = []
+    for p in paths:
+        if os.path.isdir(p):
+            for dirpath, _, names in os.walk(p):
+                files += [os.path.join(dirpath, n) for n in names if n.endswith(".jsonl")]
+        else:
+            files.append(p)
+    traces = defaultdict(list)
+    for path in sorted(files):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    rec = json.loads(line)
+                    traces[rec.get("test") or path].append(rec)
+    return traces
+
+
+def rank(findings: list[dict]) -> list[dict]:
+    """Aggregate findings by (kind, site, detail) and sort by total time lost."""
+    agg: dict[tuple, dict] = {}
+    for f in findings:
+        key = (f["kind"], f["site"], f["detail"])
+        a = agg.setdefault(key, {"kind": f["kind"], "site": f["site"], "detail": f["detail"],
+                                 "count": 0, "ms": 0.0, "tests": set()})
+        a["count"] += 1
+        a["ms"] += f["ms"]
+        a["tests"].add(f["test"])
+    return sorted(agg.values(), key=lambda a: -a["ms"])
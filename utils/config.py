@@ -1,24 +1,91 @@
 # utils/config.py
+"""
+Settings from the environment / .env, resolved on first use.
+
+`from utils import config` costs nothing: a value such as `config.DEFAULT_WAIT` is
+read from the environment the first time it is accessed and then cached as a plain
+module attribute. The credentials (BASE_URL, APP_URL, USERNAME, PASSWORD) are
+validated together, so a missing .env reports every missing variable at once — and
+only when something actually needs the application, not during `pytest --collect-only`.
+"""
+import functools
 import os
-from dotenv import load_dotenv
 
-# Load .env from project root
-load_dotenv()
 
-def _env(name: str, default: str | None = None, required: bool = False) -> str:
-    v = os.getenv(name, default)
-    if required and (v is None or str(v).strip() == ""):
-        raise RuntimeError(f"Missing required environment variable: {name}")
-    return v
+@functools.cache
+def _load_dotenv() -> None:
+    # Load .env from project root
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _env(name: str, default: str | None = None) -> str:
+    _load_dotenv()
+    return os.getenv(name, default)
 
-# Base host from .env (no trailing slash)
-_BASE_HOST = _env("BASE_URL", required=True).rstrip("/")
 
 # OrangeHRM login path
 _LOGIN_PATH = "/web/index.php/auth/login"
 
-# Exported config vars used by tests
-BASE_URL = f"{_BASE_HOST}{_LOGIN_PATH}"     # -> full login URL
-USERNAME = _env("HRM_USERNAME", required=True)
-PASSWORD = _env("HRM_PASSWORD", required=True)
-DEFAULT_WAIT = int(_env("DEFAULT_WAIT", "20"))
+# Derived from the required variables, and validated together
+_CREDENTIALS = ("BASE_URL", "APP_URL", "USERNAME", "PASSWORD")
+_REQUIRED_ENV = ("BASE_URL", "HRM_USERNAME", "HRM_PASSWORD")
+
+# Everything else: name -> (default, type); the env var has the same name
+_OPTIONAL = {
+    "DEFAULT_WAIT":          ("20", int),
+    "STEP_RETRIES":          ("2", int),        # extra attempts per page-object step
+    "REPORTS_DIR":           ("reports", str),  # run artifacts (stats, logs, traces)
+    "EMPLOYEE_TAG_PREFIX":   ("QA", str),       # Employee Id prefix of suite-created records
+    "BROWSER_MAX_RSS_MB":    ("1500", float),   # recycle a reused browser past any of these
+    "BROWSER_MAX_HEAP_MB":   ("300", float),
+    "BROWSER_MAX_DOM_NODES": ("60000", int),
+    "BROWSER_MAX_COMMANDS":  ("5000", int),
+    "BROWSER_MAX_TESTS":     ("0", int),        # 0 = no limit
+    "LOG_LEVEL":             ("INFO", str),     # reports/logs/<worker>.log, JSON lines
+    "LOG_MAX_MB":            ("10", float),     # rotate each worker log past this size
+    "LOG_BACKUPS":           ("3", int),
+}
+
+
+def _credentials() -> dict:
+    _load_dotenv()
+    missing = [env for env in _REQUIRED_ENV if not (os.getenv(env) or "").strip()]
+    if missing:
+        raise RuntimeError(f"Missing required environment variable{'s' * (len(missing) > 1)}: {', '.join(missing)}")
+    base_host = _env("BASE_URL").rstrip("/")  # no trailing slash
+    return {
+        "BASE_URL": f"{base_host}{_LOGIN_PATH}",     # -> full login URL
+        "APP_URL":  f"{base_host}/web/index.php",    # -> prefix for deep links (e.g. an employee's record)
+        "USERNAME": _env("HRM_USERNAME"),
+        "PASSWORD": _env("HRM_PASSWORD"),
+    }
+
+
+def __getattr__(name: str):
+    if name in _CREDENTIALS:
+        values = _credentials()
+    elif name in _OPTIONAL:
+        default, cast = _OPTIONAL[name]
+        values = {name: cast(_env(name, default))}
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals().update(values)  # cached: later lookups never get here
+    return values[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CREDENTIALS) | set(_OPTIONAL))
+
+
+def validate() -> None:
+    """Resolve every setting now (raises RuntimeError listing the missing credentials)."""
+    for name in (*_CREDENTIALS, *_OPTIONAL):
+        if name not in globals():
+            __getattr__(name)
+
+
+def reset() -> None:
+    """Forget the cached values (e.g. after changing os.environ in a test)."""
+    for name in (*_CREDENTIALS, *_OPTIONAL):
+        globals().pop(name, None)
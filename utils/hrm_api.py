@@ -0,0 +1,88 @@
+# utils/hrm_api.py
+"""
+Thin client for OrangeHRM's REST API (`/web/index.php/api/v2/...`).
+
+Uses a `requests.Session` with a pooled adapter, so every call re-uses the same
+keep-alive connections. Authentication is the same session cookie the UI uses:
+either log in through the login form (`login()`), or copy the cookies of an
+already logged-in WebDriver session (`from_driver()`).
+"""
+import re
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# The login page embeds the CSRF token as  :token="&quot;<token>&quot;"
+_LOGIN_TOKEN = re.compile(r':token="&quot;([^&"]+)&quot;"')
+
+
+class HrmApiError(RuntimeError):
+    """Raised when the API answers with an unexpected status."""
+
+
+class HrmApi:
+    def __init__(self, app_url: str, pool_size: int = 10, timeout: float = 30.0):
+        """`app_url` is the `.../web/index.php` prefix (config.APP_URL)."""
+        self.app_url = app_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+    # ---------- auth ----------
+    def login(self, username: str, password: str) -> "HrmApi":
+        """Sign in through the login form (same as a browser) and keep the session cookie."""
+        page = self.session.get(f"{self.app_url}/auth/login", timeout=self.timeout)
+        match = _LOGIN_TOKEN.search(page.text)
+        if not match:
+            raise HrmApiError("Could not find the login token on the login page")
+        resp = self.session.post(
+            f"{self.app_url}/auth/validate",
+            data={"_token": match.group(1), "username": username, "password": password},
+            timeout=self.timeout,
+        )
+        if resp.status_code >= 400 or "/auth/login" in resp.url:
+            raise HrmApiError(f"Login failed for {username} (HTTP {resp.status_code}, ended on {resp.url})")
+        return self
+
+    @classmethod
+    def from_driver(cls, driver, app_url: str, **kwargs) -> "HrmApi":
+        """Re-use the cookies of a logged-in WebDriver session (no second login)."""
+        api = cls(app_url, **kwargs)
+        for c in driver.get_cookies():
+            api.session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+        api.session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+        return api
+
+    # ---------- raw calls ----------
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Call `/api/v2/<path>` and return the response; raises HrmApiError on 4xx/5xx."""
+        resp = self.session.request(method, f"{self.app_url}/api/v2/{path.lstrip('/')}",
+                                    timeout=self.timeout, **kwargs)
+        if resp.status_code >= 400:
+            raise HrmApiError(f"{method} {path} -> HTTP {resp.status_code}: {resp.text[:200]}")
+        return resp
+
+    def get_data(self, path: str, **params):
+        return self.request("GET", path, params=params or None).json()["data"]
+
+    # ---------- PIM ----------
+    def search_employees(self, name_or_id: str, limit: int = 50) -> list[dict]:
+        return self.get_data("pim/employees", nameOrId=name_or_id, limit=limit, offset=0,
+                             includeEmployees="onlyCurrent")
+
+    def create_employee(self, first: str, middle: str, last: str, employee_id: str = "") -> dict:
+        body = {"firstName": first, "middleName": middle, "lastName": last,
+                "employeeId": employee_id, "empPicture": None}
+        return self.request("POST", "pim/employees", json=body).json()["data"]
+
+    def update_job_details(self, emp_number: int, **fields) -> dict:
+        """PUT job details; `fields` use API names (joinedDate, jobTitleId, empStatusId, ...)."""
+        return self.request("PUT", f"pim/employees/{emp_number}/job-details", json=fields).json()["data"]
+
+    # ---------- lookups ----------
+    def list_options(self, resource: str) -> list[dict]:
+        """All rows of an admin lookup, e.g. 'admin/job-titles', 'admin/employment-statuses'."""
+        return self.get_data(resource, limit=0)
@@ -0,0 +1,380 @@
+# utils/impact.py
+"""
+Run only the tests a change can affect.
+
+Recording (`pytest --record-impact`): every function and method defined in pages/
+is wrapped, and the page-object symbols each test calls (`JobDetailsPage.set_job_details`,
+`EmployeeListPage._wait_table_change`, `read_card`, ...) are stored per test in
+reports/impact/map.json. Parametrized tests are keyed without their `[...]` id, since
+the generated data labels change with the seed.
+
+Selecting (`pytest --changed-since origin/main`): `git diff` against the ref is mapped
+onto pages/ symbols with `ast`, on both sides of the diff:
+
+  - a changed method or function             -> that symbol
+  - a changed class attribute (a locator)    -> the methods of that class that use it
+  - a changed module constant                -> the functions/methods of the module that use it
+  - anything else in the module (imports...) -> every symbol of the module
+
+A test runs if it called one of those symbols, lives in a changed test file, or is not
+in the map yet. A changed locator also selects the tests that read it without calling
+a page method (e.g. the locator check): tests whose code names the page module, or
+both the class and the attribute (found with `ast` in the test source). Changes to shared code (conftest.py, utils/, requirements, pytest.ini),
+to tools/ (unit tests import the stub server, loadgen and dashboard) or to files we
+can't classify run everything.
+"""
+import ast
+import fnmatch
+import functools
+import importlib
+import inspect
+import json
+import os
+import re
+import subprocess
+from dataclasses import dataclass, field
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Changes here can affect any test: run everything
+SHARED = ("conftest.py", "utils/*", "tools/*", "pages/__init__*", "requirements*.txt", "tests/pytest.ini",
+          "tests/conftest.py", "pytest.ini", "setup.cfg", "setup.py", "pyproject.toml", "tox.ini")
+# Changes here can't affect a test run
+IGNORED = ("*.md", ".idea/*", ".gitignore", "snapshots/*", "reports/*", "reports.html")
+
+
+def base_id(nodeid: str) -> str:
+    return nodeid.split("[", 1)[0]
+
+
+# ---------------- recording ----------------
+class CallRecorder:
+    """Wraps every function/method in pages/ and collects the symbols each test calls."""
+
+    def __init__(self):
+        self.tests: dict[str, set[str]] = {}
+        self._hits: set[str] = set()
+        self._installed = False
+
+    def _wrap(self, func, qualname: str):
+        hits = self._hits
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            hits.add(qualname)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def install(self, package: str = "pages") -> None:
+        if self._installed:
+            return
+        self._installed = True
+        modules = [importlib.import_module(f"{package}.{name[:-3]}")
+                   for name in sorted(os.listdir(os.path.join(_ROOT, package)))
+                   if name.endswith(".py") and not name.startswith("_")]
+        replaced = {}
+        for module in modules:
+            for name, obj in list(vars(module).items()):
+                if getattr(obj, "__module__", None) != module.__name__:
+                    continue
+                if inspect.isfunction(obj):
+                    replaced[obj] = self._wrap(obj, obj.__qualname__)
+                    setattr(module, name, replaced[obj])
+                elif inspect.isclass(obj):
+                    for attr, member in list(vars(obj).items()):
+                        if inspect.isfunction(member):
+                            setattr(obj, attr, self._wrap(member, member.__qualname__))
+                        elif isinstance(member, (staticmethod, classmethod)):
+                            wrapped = self._wrap(member.__func__, member.__func__.__qualname__)
+                            setattr(obj, attr, type(member)(wrapped))
+        # `from pages.form_snapshot import read_card` bound the original in other modules
+        for module in modules:
+            for name, obj in list(vars(module).items()):
+                if inspect.isfunction(obj) and obj in replaced:
+                    setattr(module, name, replaced[obj])
+
+    def begin(self) -> None:
+        self._hits.clear()
+
+    def end(self, nodeid: str) -> None:
+        self.tests.setdefault(base_id(nodeid), set()).update(self._hits)
+        self._hits.clear()
+
+    def dump(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({k: sorted(v) for k, v in self.tests.items()}, f, indent=1)
+
+
+IMPACT = CallRecorder()
+
+
+def load_map(path: str) -> dict[str, set[str]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {k: set(v) for k, v in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def update_map(path: str, dumps: list[str]) -> int:
+    """Fold worker dumps into the map at `path` (tests that ran replace their old entry)."""
+    impact = load_map(path)
+    updated = 0
+    for dump in dumps:
+        for nodeid, symbols in load_map(dump).items():
+            impact[nodeid] = symbols
+            updated += 1
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({k: sorted(v) for k, v in sorted(impact.items())}, f, indent=1)
+    return updated
+
+
+# ---------------- diff -> symbols ----------------
+_FILE = re.compile(r"^diff --git a/(.+?) b/(.+)$")
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def parse_diff(text: str) -> dict[str, tuple[set[int], set[int]]]:
+    """`git diff -U0` output -> {path: (changed old lines, changed new lines)}."""
+    files: dict[str, tuple[set[int], set[int]]] = {}
+    old = new = None
+    for line in text.splitlines():
+        m = _FILE.match(line)
+        if m:
+            old, new = set(), set()
+            files[m.group(2)] = (old, new)
+            continue
+        m = _HUNK.match(line)
+        if m and old is not None:
+            start, count = int(m.group(1)), int(m.group(2) or 1)
+            old.update(range(start, start + count))
+            start, count = int(m.group(3)), int(m.group(4) or 1)
+            new.update(range(start, start + count))
+    return files
+
+
+def _span(node) -> tuple[int, int]:
+    first = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+    return first, node.end_lineno
+
+
+def _targets(node) -> list[str]:
+    targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+    return [n.id for t in targets for n in ast.walk(t) if isinstance(n, ast.Name)]
+
+
+def _uses(node) -> set[str]:
+    """Names and attribute names read inside a function."""
+    return {n.attr if isinstance(n, ast.Attribute) else n.id
+            for n in ast.walk(node) if isinstance(n, (ast.Attribute, ast.Name))}
+
+
+def _is_docstring(node) -> bool:
+    return isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+
+
+@dataclass
+class ModuleIndex:
+    symbols: dict[str, set[str]] = field(default_factory=dict)              # qualname -> names it uses
+    functions: list[tuple[int, int, str]] = field(default_factory=list)      # (first, last, qualname)
+    attributes: list[tuple[int, int, str, str]] = field(default_factory=list)  # (first, last, owner, name)
+    other: list[tuple[int, int, str]] = field(default_factory=list)          # (first, last, owner or "")
+
+
+def index_module(source: str) -> ModuleIndex:
+    idx = ModuleIndex()
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            idx.symbols[node.name] = _uses(node)
+            idx.functions.append((*_span(node), node.name))
+        elif isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    qualname = f"{node.name}.{item.name}"
+                    idx.symbols[qualname] = _uses(item)
+                    idx.functions.append((*_span(item), qualname))
+                elif isinstance(item, (ast.Assign, ast.AnnAssign)):
+                    idx.attributes += [(*_span(item), node.name, t) for t in _targets(item)]
+                elif not _is_docstring(item):
+                    idx.other.append((*_span(item), node.name))
+            first, _ = _span(node)
+            idx.other.append((first, node.body[0].lineno - 1 if node.body else node.end_lineno, node.name))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            idx.attributes += [(*_span(node), "", t) for t in _targets(node)]
+        elif not _is_docstring(node):
+            idx.other.append((*_span(node), ""))
+    return idx
+
+
+def changed_symbols(source: str, lines: set[int]) -> set[str]:
+    """pages/ symbols whose behaviour the changed `lines` of `source` can affect."""
+    if not lines:
+        return set()
+    try:
+        idx = index_module(source)
+    except SyntaxError:
+        return {"*"}
+    out = set()
+    hit = lambda first, last: any(first <= n <= last for n in lines)  # noqa: E731
+    for first, last, qualname in idx.functions:
+        if hit(first, last):
+            out.add(qualname)
+    for first, last, owner, name in idx.attributes:
+        if hit(first, last):
+            out |= {q for q, uses in idx.symbols.items()
+                    if name in uses and (not owner or q.startswith(owner + "."))}
+    for first, last, owner in idx.other:
+        if hit(first, last):
+            out |= {q for q in idx.symbols if not owner or q.startswith(owner + ".")}
+    return out
+
+
+def changed_attributes(source: str, lines: set[int]) -> set[tuple[str, str]]:
+    """(class, attribute) pairs of the class attributes (locators) on the changed `lines`."""
+    if not lines:
+        return set()
+    try:
+        idx = index_module(source)
+    except SyntaxError:
+        return set()
+    return {(owner, name) for first, last, owner, name in idx.attributes
+            if owner and any(first <= n <= last for n in lines)}
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", "-C", _ROOT, *args], check=True, capture_output=True, text=True).stdout
+
+
+def _matches(path: str, patterns) -> bool:
+    return any(fnmatch.fnmatch(path, p) for p in patterns)
+
+
+@dataclass
+class Changes:
+    base: str
+    files: list[str] = field(default_factory=list)
+    symbols: set[str] = field(default_factory=set)
+    test_files: set[str] = field(default_factory=set)
+    locators: dict[str, set[tuple[str, str]]] = field(default_factory=dict)  # page module -> {(class, attr)}
+    full_run: str | None = None   # why everything has to run
+
+
+def classify_changes(diff: dict[str, tuple[set[int], set[int]]], base: str, old_source, new_source) -> Changes:
+    """`old_source(path)` / `new_source(path)` return the file at the base / in the tree ("" if absent)."""
+    changes = Changes(base, sorted(diff))
+    for path, (old_lines, new_lines) in sorted(diff.items()):
+        if _matches(path, SHARED):
+            changes.full_run = changes.full_run or f"shared code changed: {path}"
+        elif _matches(path, IGNORED):
+            continue
+        elif _matches(path, ("tests/*",)):
+            changes.test_files.add(path)
+        elif _matches(path, ("pages/*.py",)):
+            symbols = changed_symbols(old_source(path), old_lines) | changed_symbols(new_source(path), new_lines)
+            if "*" in symbols:
+                changes.full_run = changes.full_run or f"can't parse {path}"
+            changes.symbols |= symbols
+            attrs = changed_attributes(old_source(path), old_lines) | changed_attributes(new_source(path), new_lines)
+            if attrs:
+                changes.locators.setdefault(path[:-3].replace("/", "."), set()).update(attrs)
+        else:
+            changes.full_run = changes.full_run or f"unclassified file changed: {path}"
+    return changes
+
+
+def git_changes(base: str) -> Changes:
+    """Working tree (incl. untracked files) against `base`."""
+    diff = parse_diff(_git("diff", "--relative", "--no-color", "--no-renames", "-U0", base, "--"))
+    for path in _git("ls-files", "--others", "--exclude-standard").splitlines():
+        try:
+            with open(os.path.join(_ROOT, path), encoding="utf-8") as f:
+                diff[path] = (set(), set(range(1, f.read().count("\n") + 2)))
+        except (OSError, UnicodeDecodeError):
+            diff[path] = (set(), {1})
+
+    def old_source(path: str) -> str:
+        try:
+            return _git("show", f"{base}:./{path}")
+        except subprocess.CalledProcessError:
+            return ""
+
+    def new_source(path: str) -> str:
+        try:
+            with open(os.path.join(_ROOT, path), encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    return classify_changes(diff, base, old_source, new_source)
+
+
+# ---------------- selection ----------------
+def _in_files(nodeid: str, files: set[str]) -> bool:
+    path = nodeid.split("::", 1)[0]
+    return any(f == path or f.endswith("/" + path) for f in files)
+
+
+def _read_test(path: str) -> str:
+    for candidate in (os.path.join(_ROOT, path), os.path.join(_ROOT, "tests", path)):
+        try:
+            with open(candidate, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            continue
+    return ""
+
+
+def names_in_tests(source: str) -> dict[str, set[str]]:
+    """{test function: names, attribute names and string constants in it (and in module-level code)}."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return {}
+    strings = lambda node: {n.value for n in ast.walk(node)  # noqa: E731
+                            if isinstance(n, ast.Constant) and isinstance(n.value, str)}
+    funcs = [n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    funcs += [m for c in tree.body if isinstance(c, ast.ClassDef) for m in c.body
+              if isinstance(m, (ast.FunctionDef, ast.AsyncFunctionDef))]
+    shared = set()   # module-level constants and helpers the tests may use
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Import, ast.ImportFrom)):
+            shared |= strings(node)
+    return {f.name: _uses(f) | strings(f) | shared for f in funcs}
+
+
+def _reads_locators(refs: set[str], locators: dict[str, set[tuple[str, str]]]) -> list[str]:
+    out = []
+    for module, attrs in locators.items():
+        for owner, name in sorted(attrs):
+            if module in refs or (owner in refs and name in refs):
+                out.append(f"{owner}.{name}")
+    return out
+
+
+def select_tests(nodeids: list[str], impact: dict[str, set[str]], changes: Changes,
+                 read_source=_read_test) -> dict[str, str]:
+    """{nodeid: why it runs} for the tests to keep, in collection order."""
+    if changes.full_run:
+        return {n: changes.full_run for n in nodeids}
+    keep = {}
+    references: dict[str, dict[str, set[str]]] = {}
+    for nodeid in nodeids:
+        called = impact.get(base_id(nodeid))
+        if _in_files(nodeid, changes.test_files):
+            keep[nodeid] = "test file changed"
+        elif called is None:
+            keep[nodeid] = "not recorded yet"
+        elif called & changes.symbols:
+            keep[nodeid] = "calls " + ", ".join(sorted(called & changes.symbols))
+        elif changes.locators:
+            path, _, func = base_id(nodeid).rpartition("::")
+            path = path.split("::", 1)[0]
+            if path not in references:
+                references[path] = names_in_tests(read_source(path))
+            read = _reads_locators(references[path].get(func, set()), changes.locators)
+            if read:
+                keep[nodeid] = "reads " + ", ".join(read)
+    return keep
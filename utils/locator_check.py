@@ -0,0 +1,170 @@
+# utils/locator_check.py
+"""
+Offline validation of the page-object locators against captured DOM snapshots.
+
+`tools/capture_dom.py` saves the live DOM of every screen the page objects touch
+into `snapshots/dom/<screen>.html`. This module evaluates every locator declared as
+a class attribute on the page objects — `(By.XPATH, "...")`, `(By.NAME, ...)`, CSS, ... —
+against those files with lxml, in-process and without a browser, and reports the ones
+that match nothing, match more than one element, or are slow to evaluate.
+
+Locators built inside methods (f-string XPaths) are not covered.
+"""
+import glob
+import importlib
+import inspect
+import os
+import time
+from dataclasses import dataclass, field
+
+from lxml import etree, html
+from lxml.cssselect import CSSSelector
+
+PAGE_MODULES = (
+    "pages.login_page",
+    "pages.pim_page",
+    "pages.add_employee_page",
+    "pages.employee_list_page",
+    "pages.employee_personal_page",
+    "pages.job_details_page",
+)
+
+# Which captured screens each page object's locators live on
+SCREENS = {
+    "LoginPage": ["login", "dashboard"],
+    "PIMPage": ["dashboard", "employee_list", "add_employee", "personal_details"],
+    "AddEmployeePage": ["add_employee"],
+    "EmployeeListPage": ["employee_list"],
+    "EmployeePersonalPage": ["personal_details", "personal_details_attach_form"],
+    "JobDetailsPage": ["personal_details", "job"],
+}
+
+# Only present for a moment (toasts, loaders) — cannot be checked against a snapshot
+TRANSIENT = {"SUCCESS_TOAST", "TOAST_CONTAINER", "TOAST", "LOADER_OVERLAY", "LOADER"}
+
+# Expected to match several elements
+EXPECT_MANY = {
+    ("EmployeeListPage", "TABLE_ROWS"),
+    ("PIMPage", "PIM_MENU"),   # union of fallbacks: <a> and its <span>
+}
+
+_BY_TO_XPATH = {
+    "name": lambda v: f"//*[@name={_xpath_literal(v)}]",
+    "id": lambda v: f"//*[@id={_xpath_literal(v)}]",
+    "tag name": lambda v: f"//{v}",
+    "link text": lambda v: f"//a[normalize-space()={_xpath_literal(v)}]",
+    "partial link text": lambda v: f"//a[contains(normalize-space(), {_xpath_literal(v)})]",
+}
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{p}'" for p in value.split("'")) + ")"
+
+
+def compile_locator(by: str, value: str):
+    """Turn a Selenium (by, value) pair into a callable(tree) -> list of elements."""
+    if by == "xpath":
+        return etree.XPath(value)
+    if by == "css selector":
+        return CSSSelector(value)
+    if by == "class name":
+        return CSSSelector(f".{value}")
+    if by in _BY_TO_XPATH:
+        return etree.XPath(_BY_TO_XPATH[by](value))
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+def page_locators(modules=PAGE_MODULES):
+    """Yield (class name, attribute, by, value) for every locator class attribute."""
+    for mod_name in modules:
+        module = importlib.import_module(mod_name)
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for attr, val in vars(cls).items():
+                if (attr.isupper() and isinstance(val, tuple) and len(val) == 2
+                        and all(isinstance(v, str) for v in val)):
+                    yield cls_name, attr, val[0], val[1]
+
+
+def load_snapshots(directory: str) -> dict:
+    """{screen name: parsed lxml tree} for every *.html file in `directory`."""
+    trees = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, "rb") as f:
+            trees[os.path.splitext(os.path.basename(path))[0]] = html.fromstring(f.read())
+    return trees
+
+
+@dataclass
+class LocatorResult:
+    owner: str
+    name: str
+    by: str
+    value: str
+    counts: dict = field(default_factory=dict)   # screen -> matches
+    ms: float = 0.0                              # slowest evaluation on one screen
+    status: str = "ok"                           # ok | missing | ambiguous | slow | invalid | transient | no-snapshot
+    detail: str = ""
+
+    @property
+    def label(self) -> str:
+        return f"{self.owner}.{self.name}"
+
+
+def check_locators(snapshots: dict, locators=None, slow_ms: float = 5.0) -> list[LocatorResult]:
+    results = []
+    for owner, name, by, value in (locators if locators is not None else page_locators()):
+        res = LocatorResult(owner, name, by, value)
+        results.append(res)
+        if name in TRANSIENT:
+            res.status = "transient"
+            continue
+        screens = [s for s in SCREENS.get(owner, list(snapshots)) if s in snapshots]
+        if not screens:
+            res.status = "no-snapshot"
+            res.detail = f"none of {SCREENS.get(owner)} captured"
+            continue
+        try:
+            finder = compile_locator(by, value)
+        except Exception as e:  # XPathSyntaxError, cssselect.SelectorError, unsupported strategy
+            res.status, res.detail = "invalid", f"{type(e).__name__}: {e}"
+            continue
+        for screen in screens:
+            start = time.perf_counter()
+            try:
+                found = finder(snapshots[screen])
+            except etree.XPathEvalError as e:
+                res.status, res.detail = "invalid", f"XPathEvalError: {e}"
+                break
+            res.ms = max(res.ms, (time.perf_counter() - start) * 1000)
+            res.counts[screen] = len(found) if isinstance(found, list) else int(bool(found))
+        if res.status != "ok":
+            continue
+        # A page object spans several screens and an element need not be on all of them:
+        # judge each screen the locator resolves on, so one ambiguous screen is enough
+        ambiguous = {s: n for s, n in res.counts.items() if n > 1}
+        if not any(res.counts.values()):
+            res.status = "missing"
+        elif ambiguous and (owner, name) not in EXPECT_MANY:
+            res.status = "ambiguous"
+            res.detail = ", ".join(f"{n} matches on {s}" for s, n in ambiguous.items())
+        if res.status == "ok" and res.ms > slow_ms:
+            res.status = "slow"
+            res.detail = f"{res.ms:.1f} ms"
+    return results
+
+
+def format_results(results, verbose: bool = False) -> list[str]:
+    problems = [r for r in results if r.status not in ("ok", "transient")]
+    lines = []
+    for r in (results if verbose else problems):
+        counts = ", ".join(f"{s}={n}" for s, n in r.counts.items())
+        lines.append(f"{r.status:<11} {r.label:<45} {r.ms:6.2f}ms  {counts}  {r.detail}".rstrip())
+    checked = sum(r.status not in ("transient", "no-snapshot") for r in results)
+    lines.append(f"{checked} locator(s) checked, {len(problems)} problem(s)")
+    return lines
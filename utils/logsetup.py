@@ -0,0 +1,147 @@
+# utils/logsetup.py
+"""
+Structured, non-blocking logging for parallel runs.
+
+`start_logging()` puts a QueueHandler on the root logger; a QueueListener thread
+formats the records and writes them as JSON lines to a size-rotated file per worker,
+reports/logs/<worker>.log, so xdist workers never interleave and a test thread never
+waits on disk I/O. Every record carries the current test, worker and step:
+
+    {"ts": 1718000000.123, "level": "INFO", "logger": "tests.test_login",
+     "msg": "Saving new employee record", "test": "tests/test_login.py::test_can_add_employee",
+     "worker": "gw1", "step": "12:personal.save"}
+
+Formatting happens on the listener thread: the handler queues the record with its
+`msg` and `args` untouched, so `logger.info("Saved %s", emp)` costs a level check and
+a queue put on the caller, and nothing at all below the configured level. (Pass
+values, not objects you are about to mutate — they are formatted a moment later.)
+
+The test and step tags are context variables, which a new thread does not inherit:
+start worker threads and pool tasks through `in_context(fn)` so their records keep
+the caller's tags.
+"""
+import contextlib
+import contextvars
+import functools
+import glob
+import itertools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+
+_test: contextvars.ContextVar[str] = contextvars.ContextVar("log_test", default="")
+_step: contextvars.ContextVar[str] = contextvars.ContextVar("log_step", default="")
+_step_ids = itertools.count(1)
+
+
+def set_test(nodeid: str) -> None:
+    """Tag the following records with this test (the empty string clears it)."""
+    _test.set(nodeid)
+    _step.set("")
+
+
+@contextlib.contextmanager
+def step(name: str):
+    """Tag the records logged inside the block with a unique step id ("<n>:<name>")."""
+    token = _step.set(f"{next(_step_ids)}:{name}")
+    try:
+        yield
+    finally:
+        _step.reset(token)
+
+
+def in_context(fn):
+    """`fn` run in a copy of the caller's current context — for Thread targets and pool tasks."""
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        # one copy per call: a context can't be entered by two threads at once
+        return context.copy().run(fn, *args, **kwargs)
+    return run
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """Stamps test/worker/step on the calling thread, defers all formatting to the listener."""
+
+    def __init__(self, q, worker: str):
+        super().__init__(q)
+        self.worker = worker
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.test = _test.get()
+        record.step = _step.get()
+        record.worker = self.worker
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        out = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "test": getattr(record, "test", ""),
+            "worker": getattr(record, "worker", ""),
+            "step": getattr(record, "step", ""),
+        }
+        if record.exc_info:
+            out["exc"] = self.formatException(record.exc_info)
+        return json.dumps(out, ensure_ascii=False)
+
+
+class LogPipeline:
+    def __init__(self, handler: logging.Handler, listener: logging.handlers.QueueListener, path: str,
+                 root_level: int):
+        self.handler = handler
+        self.listener = listener
+        self.path = path
+        self.root_level = root_level
+        self.running = True
+
+    def stop(self) -> None:
+        """Detach from the root logger and flush everything still queued."""
+        if not self.running:
+            return
+        self.running = False
+        root = logging.getLogger()
+        root.removeHandler(self.handler)
+        root.setLevel(self.root_level)
+        self.listener.stop()
+        for h in self.listener.handlers:
+            h.close()
+
+
+def start_logging(directory: str, worker: str, level: str | int = "INFO",
+                  max_bytes: int = 10 * 2 ** 20, backups: int = 3, handlers=()) -> LogPipeline:
+    """Route the root logger through a queue to <directory>/<worker>.log (plus any extra `handlers`)."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{worker}.log")
+    writer = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups,
+                                                  encoding="utf-8", delay=True)
+    writer.setFormatter(JsonFormatter())
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(q, writer, *handlers, respect_handler_level=True)
+    handler = _ContextQueueHandler(q, worker)
+    root = logging.getLogger()
+    root_level = root.level
+    root.addHandler(handler)
+    root.setLevel(level if isinstance(level, int) else level.upper())
+    listener.start()
+    return LogPipeline(handler, listener, path, root_level)
+
+
+def read_log(path: str) -> list[dict]:
+    """Records of one worker log (rotated files included, oldest first)."""
+    rotated = glob.glob(glob.escape(path) + ".*")
+    paths = sorted((p for p in rotated if p.rsplit(".", 1)[1].isdigit()),
+                   key=lambda p: -int(p.rsplit(".", 1)[1]))
+    out = []
+    for p in paths + [path]:
+        if os.path.exists(p):
+            with open(p, encoding="utf-8") as f:
+                out += [json.loads(line) for line in f if line.strip()]
+    return out
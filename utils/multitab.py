@@ -0,0 +1,279 @@
+# utils/multitab.py
+"""
+Multi-tab execution: several logical sessions inside ONE Chrome.
+
+Each flow gets its own tab in an isolated CDP browser context (separate cookie jar,
+storage and cache; the tab is closed as soon as its flow finishes), and a small
+cooperative scheduler interleaves the flows. A flow
+is a generator that takes the driver and `yield`s a wait condition (any callable
+`condition(driver) -> truthy`, e.g. a Selenium expected condition) whenever it is
+waiting on the server. While one flow waits, the scheduler switches window handles
+and advances the others; the value the condition returned is sent back into the flow.
+
+    def my_flow(driver):
+        driver.get(config.BASE_URL)
+        user = yield EC.visibility_of_element_located(LoginPage.USERNAME_INPUT)
+        user.send_keys(...)
+
+Blocking page-object calls are still allowed between yields; they just don't overlap.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from utils import config
+from utils.cleanup import CREATED
+from utils.procmem import driver_rss
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------- isolated tabs ----------------
+class BrowserContexts:
+    """Open tabs in separate CDP browser contexts (isolation="context") or plain tabs ("tab")."""
+
+    def __init__(self, driver, isolation: str = "context"):
+        if isolation not in ("context", "tab"):
+            raise ValueError(f"Unknown isolation mode: {isolation}")
+        self.driver = driver
+        self.isolation = isolation
+        self.home = driver.current_window_handle   # focus returns here when a tab is closed
+        self._tabs: dict[str, str | None] = {}      # open handle -> its browser context (None for "tab")
+
+    def open(self, url: str = "about:blank") -> str:
+        """Open a new tab and return its window handle."""
+        if self.isolation == "tab":
+            self.driver.switch_to.new_window("tab")
+            self.driver.get(url)
+            handle = self.driver.current_window_handle
+            self._tabs[handle] = None
+            return handle
+
+        ctx = self.driver.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": True})
+        context_id = ctx["browserContextId"]
+        target = self.driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": url, "browserContextId": context_id}
+        )
+        # chromedriver uses the DevTools target id as the window handle
+        handle = target["targetId"]
+        self._tabs[handle] = context_id
+        deadline = time.monotonic() + 5
+        while handle not in self.driver.window_handles:
+            if time.monotonic() > deadline:
+                raise RuntimeError(
+                    "chromedriver did not expose the new browser context as a window; "
+                    "use isolation='tab' (shared cookies) instead"
+                )
+            time.sleep(0.05)
+        return handle
+
+    def close(self, handle: str) -> None:
+        """Close one tab (disposing its browser context) and switch back to the home window."""
+        context_id = self._tabs.pop(handle, None)
+        try:
+            if context_id is not None:
+                self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+            else:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        except Exception:
+            logger.debug("Could not close tab %s", handle, exc_info=True)
+        self.driver.switch_to.window(self.home)
+
+    def close_all(self) -> None:
+        for handle in list(self._tabs):
+            self.close(handle)
+
+
+# ---------------- scheduler ----------------
+@dataclass
+class FlowResult:
+    name: str
+    passed: bool
+    seconds: float
+    error: str = ""
+
+
+@dataclass
+class _Running:
+    name: str
+    gen: object
+    handle: str
+    started: float
+    condition: object = None
+    deadline: float = 0.0
+
+
+def _poll(condition, driver, ignored: tuple):
+    try:
+        return condition(driver)
+    except ignored:
+        return False
+
+
+def run_interleaved(driver, flows: dict, isolation: str = "context", timeout: float | None = None,
+                    poll: float = 0.1) -> list[FlowResult]:
+    """
+    Run `flows` ({name: generator function taking the driver}) concurrently in one browser.
+    A yielded condition that stays falsy for `timeout` seconds (default config.DEFAULT_WAIT)
+    is thrown back into its flow as a TimeoutException.
+    """
+    from selenium.common.exceptions import (
+        NoSuchElementException,
+        StaleElementReferenceException,
+        TimeoutException,
+    )
+
+    ignored = (NoSuchElementException, StaleElementReferenceException)
+    timeout = config.DEFAULT_WAIT if timeout is None else timeout
+    contexts = BrowserContexts(driver, isolation)
+    results: list[FlowResult] = []
+    active: list[_Running] = []
+    current = None
+
+    def switch(handle):
+        nonlocal current
+        if handle != current:
+            driver.switch_to.window(handle)
+            current = handle
+
+    def finish(run: _Running, result: FlowResult):
+        nonlocal current
+        results.append(result)
+        contexts.close(run.handle)
+        current = contexts.home
+
+    def advance(run: _Running, value=None, error=None):
+        """Run the flow until its next wait; record the result when it finishes."""
+        try:
+            cond = run.gen.throw(error) if error is not None else run.gen.send(value)
+        except StopIteration:
+            finish(run, FlowResult(run.name, True, time.perf_counter() - run.started))
+            return False
+        except Exception as e:
+            logger.warning("Flow %s failed: %r", run.name, e)
+            finish(run, FlowResult(run.name, False, time.perf_counter() - run.started, repr(e)))
+            return False
+        run.condition, run.deadline = cond, time.monotonic() + timeout
+        return True
+
+    try:
+        for name, flow in flows.items():
+            handle = contexts.open()
+            switch(handle)
+            run = _Running(name, flow(driver), handle, time.perf_counter())
+            if advance(run):
+                active.append(run)
+
+        while active:
+            progressed = False
+            for run in list(active):
+                switch(run.handle)
+                value = _poll(run.condition, driver, ignored) if run.condition is not None else True
+                if value:
+                    alive = advance(run, value)
+                elif time.monotonic() > run.deadline:
+                    alive = advance(run, error=TimeoutException(f"{run.name}: wait timed out"))
+                else:
+                    continue
+                progressed = True
+                if not alive:
+                    active.remove(run)
+            if not progressed:
+                time.sleep(poll)
+    finally:
+        contexts.close_all()
+    return results
+
+
+# ---------------- flows built from the page objects ----------------
+def login_flow(driver):
+    from selenium.webdriver.support import expected_conditions as EC
+    from pages.login_page import LoginPage
+
+    driver.get(config.BASE_URL)
+    yield EC.any_of(EC.visibility_of_element_located(LoginPage.USERNAME_INPUT),
+                    EC.visibility_of_element_located(LoginPage.DASHBOARD_HEADER))
+    users = driver.find_elements(*LoginPage.USERNAME_INPUT)
+    if not users:   # a plain tab shares the cookies of a session that already logged in
+        return
+    users[0].send_keys(config.USERNAME)
+    driver.find_element(*LoginPage.PASSWORD_INPUT).send_keys(config.PASSWORD)
+    driver.find_element(*LoginPage.LOGIN_BTN).click()
+    yield EC.visibility_of_element_located(LoginPage.DASHBOARD_HEADER)
+
+
+def add_employee_flow(first: str, middle: str, last: str, employee_id: str | None = None):
+    """
+    Login → Add Employee → Save; yields while the server works. The new record is
+    registered in utils.cleanup.CREATED; pass a tag (utils.cleanup.new_tag) as
+    `employee_id` so a crashed run's records can be swept too.
+    """
+    def flow(driver):
+        from selenium.webdriver.support import expected_conditions as EC
+        from pages.add_employee_page import AddEmployeePage
+
+        yield from login_flow(driver)
+        driver.get(f"{config.APP_URL}/pim/addEmployee")
+        yield EC.visibility_of_element_located(AddEmployeePage.FIRST_NAME)
+        AddEmployeePage(driver).fill_employee_details(first, middle, last, employee_id=employee_id)
+        driver.find_element(*AddEmployeePage.SAVE_BTN).click()
+        match = yield lambda d: AddEmployeePage.EMP_NUMBER_URL.search(d.current_url)
+        CREATED.add(int(match.group(1)))
+    return flow
+
+
+# ---------------- memory sampling ----------------
+class PeakRss:
+    """Background sampler of a driver's process-tree RSS; use as a context manager."""
+
+    def __init__(self, drivers, interval: float = 0.5):
+        self.drivers = drivers  # may change while sampling (browsers started and quit by worker threads)
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def sample(self) -> None:
+        total = sum(driver_rss(d) or 0 for d in list(self.drivers))
+        self.peak = max(self.peak, total)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+
+@dataclass
+class ThroughputReport:
+    mode: str
+    flows: int
+    passed: int
+    seconds: float
+    peak_rss: int
+    results: list = field(default_factory=list)
+    startup: float = 0.0   # seconds spent starting browsers (included in `seconds`)
+
+    @property
+    def flows_per_min(self) -> float:
+        return self.passed / self.seconds * 60 if self.seconds else 0.0
+
+    @property
+    def per_gb(self) -> float:
+        """Completed flows per minute per GB of peak browser RSS."""
+        return self.flows_per_min / (self.peak_rss / 1024 ** 3) if self.peak_rss else 0.0
+
+    def line(self) -> str:
+        return (f"{self.mode:<22} flows={self.flows:<4} passed={self.passed:<4} "
+                f"{self.seconds:7.1f}s startup={self.startup:6.1f}s {self.flows_per_min:7.2f}/min "
+                f"rss={self.peak_rss / 1024 ** 2:8.0f}MB {self.per_gb:8.2f}/min/GB")
@@ -0,0 +1,78 @@
+# utils/netprofile.py
+"""
+Network-condition profiles applied to Chrome through CDP `Network.emulateNetworkConditions`.
+
+    apply_profile(driver, PROFILES["3g"])
+    apply_profile(driver, parse_profile("latency=250,down=1500,up=750,loss=1"))
+
+Latency is added to every request; throughput is in kbit/s (-1 = unthrottled);
+loss is a percentage of dropped packets (needs a Chrome recent enough to support
+`packetLoss`, otherwise the profile is applied without it and a warning is logged).
+Emulation is per tab: tabs opened later are not throttled.
+"""
+import logging
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    name: str
+    latency_ms: float = 0.0
+    down_kbps: float = -1
+    up_kbps: float = -1
+    loss_pct: float = 0.0
+
+    def cdp_params(self) -> dict:
+        def throughput(kbps):
+            return -1 if kbps < 0 else kbps * 1000 / 8   # bytes/s
+        params = {"offline": False, "latency": self.latency_ms,
+                  "downloadThroughput": throughput(self.down_kbps), "uploadThroughput": throughput(self.up_kbps)}
+        if self.loss_pct:
+            params["packetLoss"] = self.loss_pct
+        return params
+
+
+PROFILES = {p.name: p for p in (
+    NetworkProfile("none"),
+    NetworkProfile("broadband", 20, 20000, 5000),
+    NetworkProfile("dsl", 50, 4000, 1000),
+    NetworkProfile("4g", 100, 9000, 3000),
+    NetworkProfile("3g", 300, 1600, 750),
+    NetworkProfile("slow-3g", 400, 400, 400),
+    NetworkProfile("satellite", 700, 1000, 256, 1.0),
+    NetworkProfile("lossy-wan", 150, 2000, 1000, 3.0),
+)}
+
+_KEYS = {"latency": "latency_ms", "down": "down_kbps", "up": "up_kbps", "loss": "loss_pct"}
+
+
+def parse_profile(text: str) -> NetworkProfile:
+    """A profile name from PROFILES, or a custom 'latency=200,down=1000,up=500,loss=2'."""
+    if text in PROFILES:
+        return PROFILES[text]
+    if "=" not in text:
+        raise ValueError(f"Unknown network profile {text!r}; known: {', '.join(PROFILES)}")
+    fields = {}
+    for part in text.split(","):
+        key, _, value = part.partition("=")
+        if key.strip() not in _KEYS:
+            raise ValueError(f"Unknown network profile key {key!r}; use {', '.join(_KEYS)}")
+        fields[_KEYS[key.strip()]] = float(value)
+    return NetworkProfile(text, **fields)
+
+
+def apply_profile(driver, profile: NetworkProfile) -> None:
+    if profile.name == "none":
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    params = profile.cdp_params()
+    try:
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", params)
+    except Exception as e:
+        if "packetLoss" not in params:
+            raise
+        logger.warning("Chrome rejected packetLoss (%s); applying %s without packet loss", e, profile.name)
+        del params["packetLoss"]
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", params)
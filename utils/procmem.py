@@ -0,0 +1,69 @@
+# utils/procmem.py
+"""Resident memory of a browser's whole process tree (chromedriver + Chrome children)."""
+import os
+
+try:  # optional: psutil gives the same numbers on every OS
+    import psutil
+except ImportError:  # pragma: no cover - depends on the environment
+    psutil = None
+
+
+def _proc_children() -> dict[int, list[int]]:
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                # comm may contain spaces/brackets, so split after the last ')'
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _proc_rss(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def process_tree_rss(pid: int) -> int | None:
+    """
+    Sum of RSS (bytes) for `pid` and all its descendants, or None when it cannot be measured.
+    Shared pages are counted once per process, so this is an upper bound — fine for comparisons.
+    """
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            procs = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for p in procs:
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+
+    if not os.path.isdir("/proc"):
+        return None
+    children = _proc_children()
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += _proc_rss(current)
+        stack.extend(children.get(current, ()))
+    return total or None
+
+
+def driver_rss(driver) -> int | None:
+    """Process-tree RSS of a local Chrome session started through chromedriver."""
+    try:
+        return process_tree_rss(driver.service.process.pid)
+    except AttributeError:  # remote / grid sessions have no local service process
+        return None
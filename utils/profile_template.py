@@ -0,0 +1,228 @@
+# utils/profile_template.py
+"""
+Pre-warmed Chrome profile templates.
+
+A fresh `--incognito` Chrome starts with an empty HTTP cache and V8 code cache, so
+every test downloads and compiles the OrangeHRM bundles again. `build_template`
+runs Chrome once on a real user-data-dir, visits the login, Dashboard and PIM
+screens, quits, and strips everything that identifies a session (cookies, storage,
+session restore files). `clone_template` gives each new driver its own cheap copy:
+
+  - reflink:  `cp --reflink=always` — real copy-on-write (btrfs, xfs, APFS)
+  - hardlink: cache files are hard-linked and made read-only in the template, so
+              the kernel refuses to open a shared cache file for writing from a clone
+              (Chrome's disk cache does update existing entries in place); small state
+              files (Preferences, Local State, ...) are copied
+  - copy:     plain copy
+
+"auto" tries them in that order. Permission bits do not bind root, which is how
+Chrome usually runs in CI containers, so as root "hardlink" falls back to "copy"
+rather than let one clone rewrite the cache every other clone shares.
+"""
+import json
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import time
+
+try:  # POSIX: one xdist worker builds the template while the others wait
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Directories holding caches worth sharing (relative to the user-data-dir or its profile)
+CACHE_DIRS = ("Cache", "Code Cache", "GPUCache", "GrShaderCache", "ShaderCache", "DawnCache",
+              "DawnGraphiteCache", "DawnWebGPUCache", "component_crx_cache")
+# Session state that must never leak from the warm-up into the tests
+SESSION_STATE = ("Cookies", "Cookies-journal", "Network/Cookies", "Network/Cookies-journal",
+                 "Sessions", "Session Storage", "Current Session", "Current Tabs", "Last Session",
+                 "Last Tabs", "Local Storage", "IndexedDB", "Service Worker", "Web Data",
+                 "Web Data-journal", "Login Data", "Login Data-journal", "History", "History-journal",
+                 "Visited Links", "Top Sites", "Top Sites-journal")
+_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+_STAMP = "template.json"
+
+
+def strip_session_state(user_data_dir: str) -> int:
+    """Delete cookies, storage and restore files from every profile; returns entries removed."""
+    removed = 0
+    for name in _LOCK_FILES:
+        path = os.path.join(user_data_dir, name)
+        if os.path.lexists(path):
+            os.remove(path)
+            removed += 1
+    for entry in os.listdir(user_data_dir):
+        profile = os.path.join(user_data_dir, entry)
+        if not (os.path.isdir(profile) and (entry == "Default" or entry.startswith("Profile "))):
+            continue
+        for rel in SESSION_STATE:
+            path = os.path.join(profile, rel)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+            elif os.path.lexists(path):
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def _is_cache(rel_path: str) -> bool:
+    return any(part in CACHE_DIRS for part in rel_path.split(os.sep))
+
+
+def _read_only_enforced() -> bool:
+    """Whether read-only permission bits stop this process from writing (not so for root)."""
+    return not hasattr(os, "geteuid") or os.geteuid() != 0
+
+
+def _freeze_caches(template: str) -> None:
+    """Make cache files read-only so hard-linked clones can't modify them in place."""
+    for dirpath, _, names in os.walk(template):
+        if _is_cache(os.path.relpath(dirpath, template)):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                os.chmod(path, os.stat(path).st_mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def warm_up(driver) -> None:
+    """Load the screens every test passes through so their bundles land in the caches."""
+    from pages.login_page import LoginPage
+    from pages.pim_page import PIMPage
+
+    LoginPage(driver).login()
+    pim = PIMPage(driver)
+    pim.open_employee_list()
+    pim.open_add_employee()
+
+
+def build_template(template: str, driver_factory, visit=warm_up, key: str = "") -> dict:
+    """
+    Warm a new user-data-dir with `visit(driver)` and store it at `template`.
+    `driver_factory(user_data_dir)` must start Chrome on that directory.
+    """
+    staging = tempfile.mkdtemp(prefix="chrome-template-")
+    start = time.perf_counter()
+    driver = driver_factory(staging)
+    try:
+        visit(driver)
+    finally:
+        driver.quit()
+    time.sleep(0.5)  # let Chrome flush its caches after the process exits
+    removed = strip_session_state(staging)
+    _freeze_caches(staging)
+    if os.path.isdir(template):
+        shutil.rmtree(template, ignore_errors=True)
+    os.makedirs(os.path.dirname(os.path.abspath(template)), exist_ok=True)
+    shutil.move(staging, template)
+    info = {"key": key, "built": time.time(), "seconds": round(time.perf_counter() - start, 1),
+            "stripped": removed, "bytes": _tree_size(template)}
+    with open(os.path.join(template, _STAMP), "w", encoding="utf-8") as f:
+        json.dump(info, f)
+    return info
+
+
+def template_info(template: str) -> dict | None:
+    try:
+        with open(os.path.join(template, _STAMP), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def ensure_template(template: str, driver_factory, visit=warm_up, key: str = "",
+                    max_age_s: float = 12 * 3600) -> dict:
+    """Build the template unless a fresh one (same `key`, e.g. the base URL) exists; process-safe."""
+    os.makedirs(os.path.dirname(os.path.abspath(template)), exist_ok=True)
+    with open(template.rstrip(os.sep) + ".lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        info = template_info(template)
+        if info and info.get("key") == key and time.time() - info["built"] < max_age_s:
+            return info
+        return build_template(template, driver_factory, visit, key)
+
+
+def _tree_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(d, n)) for d, _, names in os.walk(path) for n in names
+               if not os.path.islink(os.path.join(d, n)))
+
+
+def _clone_reflink(template: str, dest: str) -> None:
+    subprocess.run(["cp", "-a", "--reflink=always", template + os.sep + ".", dest],
+                   check=True, capture_output=True)
+
+
+def _clone_links(template: str, dest: str, link: bool) -> None:
+    for dirpath, _, names in os.walk(template):
+        rel = os.path.relpath(dirpath, template)
+        target_dir = os.path.normpath(os.path.join(dest, rel))
+        os.makedirs(target_dir, exist_ok=True)
+        for name in names:
+            src, dst = os.path.join(dirpath, name), os.path.join(target_dir, name)
+            if link and _is_cache(rel):
+                os.link(src, dst)
+            else:
+                shutil.copy2(src, dst)
+                os.chmod(dst, os.stat(dst).st_mode | stat.S_IWUSR)
+
+
+def clone_template(template: str, dest: str, mode: str = "auto") -> str:
+    """Populate `dest` from the template; returns the mode that worked."""
+    os.makedirs(dest, exist_ok=True)
+    modes = ("reflink", "hardlink", "copy") if mode == "auto" else (mode,)
+    if not _read_only_enforced():   # hard-linked caches would be writable through every clone
+        modes = tuple(dict.fromkeys("copy" if m == "hardlink" else m for m in modes))
+    for m in modes:
+        try:
+            if m == "reflink":
+                _clone_reflink(template, dest)
+            else:
+                _clone_links(template, dest, link=(m == "hardlink"))
+            return m
+        except (OSError, subprocess.CalledProcessError):
+            if m == modes[-1]:
+                raise
+            shutil.rmtree(dest, ignore_errors=True)
+            os.makedirs(dest, exist_ok=True)
+    raise ValueError(f"Unknown clone mode: {mode}")
+
+
+class ProfileClones:
+    """Per-process directory of clones; removed in one go at the end."""
+
+    def __init__(self, template: str, mode: str = "auto"):
+        self.template = template
+        self.mode = mode
+        self.root = tempfile.mkdtemp(prefix="chrome-clones-")
+        self.count = 0
+        self.modes: dict[str, int] = {}
+
+    def new(self) -> str:
+        self.count += 1
+        dest = os.path.join(self.root, f"p{self.count}")
+        used = clone_template(self.template, dest, self.mode)
+        self.modes[used] = self.modes.get(used, 0) + 1
+        return dest
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+# ---------------- measuring ----------------
+_PAINT_JS = """
+const paints = {};
+for (const e of performance.getEntriesByType('paint')) paints[e.name] = e.startTime;
+const nav = performance.getEntriesByType('navigation')[0] || {};
+return {fcp: paints['first-contentful-paint'] ?? null, fp: paints['first-paint'] ?? null,
+        transfer: nav.transferSize ?? null, encoded: nav.encodedBodySize ?? null,
+        resources: performance.getEntriesByType('resource').reduce(
+            (a, r) => { a.n += 1; a.bytes += r.transferSize || 0; a.cached += r.transferSize === 0; return a; },
+            {n: 0, bytes: 0, cached: 0})};
+"""
+
+
+def paint_timing(driver) -> dict:
+    """Paint and transfer stats of the current document (ms since navigation start)."""
+    return driver.execute_script(_PAINT_JS) or {}
@@ -0,0 +1,150 @@
+# utils/pyprofile.py
+"""
+cProfile per test, and a hotspot summary that separates our Python from waiting on I/O.
+
+`pytest --profile-python` writes `reports/profile/<worker>/<test>.pstats` for every
+test. `merge_profiles` folds them into one `pstats.Stats` across workers;
+`hotspots` / `format_report` then split the self time into:
+
+  - io:       blocked in socket reads/writes, select/poll, sleeps and lock waits
+              (i.e. waiting on chromedriver / the browser / the server)
+  - pages, utils, tests: our own code (expected conditions, XPath building, page-object setup)
+  - selenium, http, logging, other: library code running on our behalf
+"""
+import cProfile
+import os
+import pstats
+import re
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Self time in these is the interpreter waiting, not computing
+_IO = re.compile(
+    r"\b(sleep|recv|recv_into|recvfrom|send|sendall|connect|connect_ex|accept|select|poll|epoll|"
+    r"acquire|wait|getaddrinfo|read|readinto|readline|do_handshake)\b"
+)
+_IO_OWNERS = ("_socket", "socket", "select", "_thread", "_ssl", "time", "posix", "_io.BufferedReader",
+              "_io.FileIO", "threading")
+
+_AREAS = (
+    ("pages", os.path.join(_ROOT, "pages") + os.sep),
+    ("utils", os.path.join(_ROOT, "utils") + os.sep),
+    ("tests", os.path.join(_ROOT, "tests") + os.sep),
+    ("tests", os.path.join(_ROOT, "conftest.py")),
+)
+_LIBRARIES = (
+    ("selenium", f"{os.sep}selenium{os.sep}"),
+    ("http", f"{os.sep}urllib3{os.sep}"),
+    ("http", f"{os.sep}requests{os.sep}"),
+    ("http", f"{os.sep}http{os.sep}"),
+    ("logging", f"{os.sep}logging{os.sep}"),
+)
+
+
+def classify(func: tuple) -> str:
+    """Area of a pstats function key (filename, line, name)."""
+    filename, _, name = func
+    if filename == "~":  # builtins: "<method 'recv_into' of '_socket.socket' objects>"
+        owner = re.search(r"of '([\w.]+)", name)
+        owner = owner.group(1) if owner else re.sub(r"^<built-in method |>$", "", name).rsplit(".", 1)[0]
+        if _IO.search(name) and (owner.startswith(_IO_OWNERS) or "time.sleep" in name):
+            return "io"
+        return "other"
+    for area, prefix in _AREAS:
+        if filename.startswith(prefix):
+            return area
+    for area, marker in _LIBRARIES:
+        if marker in filename:
+            return area
+    return "other"
+
+
+def label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    if filename.startswith(_ROOT):
+        filename = os.path.relpath(filename, _ROOT)
+    elif "site-packages" in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    return f"{filename}:{line}({name})"
+
+
+class Profiler:
+    """Deterministic profiler around one test (setup + call + teardown)."""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def __enter__(self) -> "Profiler":
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.profile.disable()
+
+    def dump(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.profile.dump_stats(path)
+
+
+def profile_files(directory: str) -> list[str]:
+    out = []
+    for dirpath, _, names in os.walk(directory):
+        out += [os.path.join(dirpath, n) for n in names if n.endswith(".pstats")]
+    return sorted(out)
+
+
+def merge_profiles(paths) -> pstats.Stats | None:
+    paths = list(paths)
+    if not paths:
+        return None
+    stats = pstats.Stats(paths[0])
+    for path in paths[1:]:
+        stats.add(path)
+    return stats
+
+
+def area_totals(stats: pstats.Stats) -> dict[str, float]:
+    """Self time (s) per area; sums to the total profiled time."""
+    totals: dict[str, float] = {}
+    for func, (_, _, tottime, _, _) in stats.stats.items():
+        area = classify(func)
+        totals[area] = totals.get(area, 0.0) + tottime
+    return totals
+
+
+def hotspots(stats: pstats.Stats, top: int = 20, include_io: bool = False) -> list[tuple]:
+    """[(self s, cumulative s, calls, area, label)] by self time."""
+    rows = []
+    for func, (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        area = classify(func)
+        if area == "io" and not include_io:
+            continue
+        rows.append((tottime, cumtime, ncalls, area, label(func)))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def format_report(stats: pstats.Stats, top: int = 20) -> list[str]:
+    totals = area_totals(stats)
+    total = sum(totals.values()) or 1.0
+    io = totals.get("io", 0.0)
+    lines = [f"profiled {total:.1f}s: {io:.1f}s ({io / total:.0%}) waiting on I/O, "
+             f"{total - io:.1f}s ({(total - io) / total:.0%}) running Python"]
+    lines.append("  " + ", ".join(f"{area} {sec:.2f}s" for area, sec in
+                                  sorted(totals.items(), key=lambda kv: -kv[1]) if area != "io"))
+    lines.append(f"{'self':>8} {'cum':>8} {'calls':>8}  {'area':<8} function")
+    for tottime, cumtime, ncalls, area, name in hotspots(stats, top):
+        lines.append(f"{tottime:7.3f}s {cumtime:7.2f}s {ncalls:8d}  {area:<8} {name}")
+    return lines
+
+
+def per_test(paths) -> list[tuple[str, float, float]]:
+    """[(test file stem, python s, io s)] sorted by Python time."""
+    rows = []
+    for path in paths:
+        totals = area_totals(pstats.Stats(path))
+        io = totals.get("io", 0.0)
+        rows.append((os.path.splitext(os.path.basename(path))[0], sum(totals.values()) - io, io))
+    return sorted(rows, key=lambda r: -r[1])
@@ -0,0 +1,92 @@
+# utils/report_store.py
+"""
+Append-only JSONL store for test results and step timings.
+
+Every pytest process (each xdist worker included) appends to its OWN shard file
+under `<REPORTS_DIR>/history/`, one JSON object per line, written with a single
+O_APPEND write and flushed immediately — so results can be tailed while the run
+is going and no two writers ever share a file. Shards from other workers or
+machines are merged simply by reading every `*.jsonl` file together.
+"""
+import glob
+import json
+import os
+import socket
+import time
+import uuid
+
+
+def new_run_id() -> str:
+    return time.strftime("%Y%m%d-%H%M%S") + "-" + uuid.uuid4().hex[:6]
+
+
+class ReportStore:
+    """Writer for one shard file."""
+
+    def __init__(self, directory: str, run_id: str, worker: str = "master"):
+        os.makedirs(directory, exist_ok=True)
+        self.run_id = run_id
+        self.worker = worker
+        self.path = os.path.join(directory, f"{run_id}.{worker}.{os.getpid()}.jsonl")
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def append(self, record_type: str, **fields) -> None:
+        record = {"type": record_type, "run_id": self.run_id, "worker": self.worker,
+                  "host": socket.gethostname(), "ts": time.time(), **fields}
+        os.write(self._fd, (json.dumps(record, default=str) + "\n").encode("utf-8"))
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+# ---------------- reading / merging ----------------
+def iter_records(paths):
+    """Yield records from shard files and/or directories of shards; bad lines are skipped."""
+    files = []
+    for p in paths:
+        files += sorted(glob.glob(os.path.join(p, "*.jsonl"))) if os.path.isdir(p) else [p]
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a shard still being written may end in a partial line
+
+
+def merge(paths, out_path: str) -> int:
+    """Combine shards into one JSONL file, dropping exact duplicates. Returns records written."""
+    seen = set()
+    written = 0
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as out:
+        for rec in iter_records(paths):
+            key = json.dumps(rec, sort_keys=True)
+            if key in seen:
+                continue
+            seen.add(key)
+            out.write(key + "\n")
+            written += 1
+    return written
+
+
+def history_by_test(records, last_runs: int = 10) -> tuple[list[str], dict[str, dict]]:
+    """
+    Group test results by run. Returns (run ids oldest → newest, limited to `last_runs`,
+    {nodeid: {run_id: test record}}).
+    """
+    run_start: dict[str, float] = {}
+    tests: dict[str, dict] = {}
+    for rec in records:
+        run_id = rec.get("run_id")
+        ts = rec.get("ts", 0.0)
+        run_start[run_id] = min(run_start.get(run_id, ts), ts)
+        if rec.get("type") == "test":
+            tests.setdefault(rec["nodeid"], {})[run_id] = rec
+    runs = sorted(run_start, key=run_start.get)[-last_runs:]
+    return runs, tests
@@ -0,0 +1,64 @@
+# utils/sharding.py
+"""
+Split the collected tests into N balanced shards by their recorded duration.
+
+    pytest --shard 1/3        # on runner 1
+    pytest --shard 2/3        # on runner 2, ...
+
+Durations are the median of each test's last recorded runs in the result store
+(utils/report_store.py), so a narrow `-k` run does not push other tests' history out.
+Tests are assigned longest first to the currently lightest shard (LPT scheduling);
+tests with no history get the median of the known ones. Every runner computes the same
+plan from the same history, so give them the same reports/history (e.g. a CI cache).
+"""
+import heapq
+import os
+import re
+import statistics
+
+from utils.report_store import history_by_test, iter_records
+
+DEFAULT_SECONDS = 30.0   # per test when there is no history at all
+
+
+def parse_shard(text: str) -> tuple[int, int]:
+    """'2/4' -> (2, 4); shards are numbered from 1."""
+    m = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", text)
+    if not m or not 1 <= int(m.group(1)) <= int(m.group(2)):
+        raise ValueError(f"--shard must look like i/N with 1 <= i <= N, got {text!r}")
+    return int(m.group(1)), int(m.group(2))
+
+
+def recorded_durations(history_dir: str, last_runs: int = 5) -> dict[str, float]:
+    """{nodeid: median duration over the last `last_runs` runs that ran it} from the result store."""
+    if not os.path.isdir(history_dir):
+        return {}
+    _, tests = history_by_test(iter_records([history_dir]))
+    out = {}
+    for nodeid, per_run in tests.items():
+        recorded = sorted((rec for rec in per_run.values() if rec.get("outcome") in ("passed", "failed")),
+                          key=lambda rec: rec.get("ts", 0.0))
+        if recorded:
+            out[nodeid] = statistics.median(float(rec["duration"]) for rec in recorded[-last_runs:])
+    return out
+
+
+def estimate(nodeids: list[str], durations: dict[str, float]) -> dict[str, float]:
+    """Seconds per test, in collection order; unknown tests get the median of the known ones."""
+    known = [durations[n] for n in nodeids if n in durations]
+    fallback = statistics.median(known) if known else DEFAULT_SECONDS
+    return {n: durations.get(n, fallback) for n in nodeids}
+
+
+def plan_shards(costs: dict[str, float], total: int) -> list[list[str]]:
+    """LPT assignment of `estimate(...)` costs; each shard keeps the collection order."""
+    heap = [(0.0, i) for i in range(total)]
+    assigned: dict[str, int] = {}
+    for nodeid in sorted(costs, key=lambda n: (-costs[n], n)):
+        load, shard = heapq.heappop(heap)
+        assigned[nodeid] = shard
+        heapq.heappush(heap, (load + costs[nodeid], shard))
+    shards: list[list[str]] = [[] for _ in range(total)]
+    for nodeid in costs:
+        shards[assigned[nodeid]].append(nodeid)
+    return shards
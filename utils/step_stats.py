@@ -0,0 +1,95 @@
+# utils/step_stats.py
+"""
+Per-step counters of `utils.steps.run_step`, and the flakiness report built from them.
+
+Kept apart from utils/steps.py so the session hooks, tools.merge_shards and the
+report tests can read and merge the numbers without importing Selenium.
+"""
+import glob
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class StepStat:
+    runs: int = 0          # times the step was started
+    retries: int = 0       # extra attempts across all runs
+    flaky_runs: int = 0    # runs that passed only after a retry
+    failures: int = 0      # runs that used up the retry budget
+    seconds: float = 0.0   # total time spent in the step, retries included
+
+    @property
+    def flaky_rate(self) -> float:
+        return (self.flaky_runs + self.failures) / self.runs if self.runs else 0.0
+
+    def merge(self, other: "StepStat") -> None:
+        self.runs += other.runs
+        self.retries += other.retries
+        self.flaky_runs += other.flaky_runs
+        self.failures += other.failures
+        self.seconds += other.seconds
+
+
+class StepRecorder:
+    """Thread-safe per-step counters for this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats: dict[str, StepStat] = {}
+        self.timeline: list[dict] = []   # steps since the last take_timeline() (i.e. the current test)
+
+    def record(self, name: str, retries: int, passed: bool, seconds: float) -> None:
+        with self._lock:
+            st = self.stats.setdefault(name, StepStat())
+            st.runs += 1
+            st.retries += retries
+            st.seconds += seconds
+            self.timeline.append({"name": name, "seconds": round(seconds, 3),
+                                  "retries": retries, "passed": passed})
+            if not passed:
+                st.failures += 1
+            elif retries:
+                st.flaky_runs += 1
+
+    def take_timeline(self) -> list[dict]:
+        with self._lock:
+            steps, self.timeline = self.timeline, []
+        return steps
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.clear()
+            self.timeline.clear()
+
+    def dump(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._lock:
+            data = {name: asdict(st) for name, st in self.stats.items()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+
+STATS = StepRecorder()
+
+
+# ---------------- flakiness report ----------------
+def load_stats(directory: str) -> dict[str, StepStat]:
+    """Merge the per-worker dumps written by `StepRecorder.dump` in `directory`."""
+    merged: dict[str, StepStat] = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            for name, raw in json.load(f).items():
+                merged.setdefault(name, StepStat()).merge(StepStat(**raw))
+    return merged
+
+
+def format_flakiness(stats: dict[str, StepStat], top: int = 10) -> list[str]:
+    """Lines for the terminal summary, flakiest steps first."""
+    flaky = [(n, s) for n, s in stats.items() if s.retries or s.failures]
+    flaky.sort(key=lambda item: (-item[1].flaky_rate, -item[1].retries, item[0]))
+    lines = [f"{'step':<60} {'runs':>5} {'retries':>7} {'failed':>6} {'flaky%':>7}"]
+    for name, st in flaky[:top]:
+        lines.append(f"{name:<60} {st.runs:>5} {st.retries:>7} {st.failures:>6} {st.flaky_rate:>7.1%}")
+    return lines
@@ -0,0 +1,77 @@
+# utils/steps.py
+"""
+Step-level retries for page-object flows.
+
+A page-object method wraps each of its steps in `run_step(...)`. When a step
+fails with a transient Selenium error, only that step is retried (after a
+readiness reset), so a flaky dropdown does not cost the whole login → PIM →
+create-employee prefix again. Every run is recorded per step name
+(utils/step_stats.py) so the chronically flaky ones can be reported at the end
+of the session. Selenium is imported by the first `run_step`, not with this module.
+"""
+import functools
+import logging
+import time
+
+from utils import config
+from utils.logsetup import step as log_step
+from utils.step_stats import STATS
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _retryable() -> tuple:
+    # Errors that usually mean "the page was not ready yet", not "the app is broken"
+    from selenium.common.exceptions import (
+        ElementClickInterceptedException,
+        ElementNotInteractableException,
+        StaleElementReferenceException,
+        TimeoutException,
+    )
+    return (
+        TimeoutException,
+        StaleElementReferenceException,
+        ElementClickInterceptedException,
+        ElementNotInteractableException,
+    )
+
+
+def __getattr__(name: str):
+    # RETRYABLE, the default `retry_on`, is only built on first use
+    if name != "RETRYABLE":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _retryable()
+
+
+def run_step(name: str, action, reset=None, retries: int | None = None, retry_on=None):
+    """
+    Run `action()` as one named step; on a `retry_on` error (RETRYABLE by default) call
+    `reset()` and retry, up to `retries` extra attempts (config.STEP_RETRIES by default).
+    Returns the action's result.
+    """
+    with log_step(name):
+        return _run_step(name, action, reset, config.STEP_RETRIES if retries is None else retries,
+                         _retryable() if retry_on is None else retry_on)
+
+
+def _run_step(name: str, action, reset, budget: int, retry_on):
+    attempt = 0
+    start = time.perf_counter()
+    while True:
+        try:
+            result = action()
+        except retry_on as e:
+            if attempt >= budget:
+                STATS.record(name, attempt, False, time.perf_counter() - start)
+                raise
+            attempt += 1
+            logger.warning("Step %s failed (%s); retry %d/%d", name, type(e).__name__, attempt, budget)
+            if reset is not None:
+                try:
+                    reset()
+                except Exception:
+                    logger.debug("Readiness reset for %s failed", name, exc_info=True)
+            continue
+        STATS.record(name, attempt, True, time.perf_counter() - start)
+        return result
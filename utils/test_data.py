@@ -0,0 +1,214 @@
+# utils/test_data.py
+"""
+Seeded, random-access generator of valid and unique employee records.
+
+    gen = EmployeeDataGenerator(seed=42)
+    gen[0], gen[1_000_000]          # same seed -> same record, any index, O(1)
+    for rec in gen.stream(start=0, count=10_000): ...   # constant memory
+
+Record `i` is built from `perm(i)`, where `perm` is a seeded bijection (a small
+Feistel network with cycle-walking) over 0..10**digits-1. The permuted number is
+the numeric suffix of the first name, so records with different indexes never
+collide, and nothing but the seed and the catalog is held in memory.
+
+Every other field is derived from a hash of (seed, i). Values for nationality,
+job title, category, sub-unit, location and employment status come from a
+`Catalog`: the defaults match the OrangeHRM demo data, `Catalog.from_api` reads
+what the target instance actually offers.
+"""
+import datetime
+from dataclasses import dataclass, replace
+
+_MASK64 = (1 << 64) - 1
+_DOB_START, _DOB_DAYS = datetime.date(1960, 1, 1), 45 * 365
+_JOINED_START, _JOINED_DAYS = datetime.date(2015, 1, 1), 10 * 365
+
+
+def _mix(x: int) -> int:
+    """splitmix64 finalizer: a cheap, well-distributed 64-bit hash."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class Permutation:
+    """Seeded bijection of range(size); `perm[i]` and `perm.index(p)` in O(1) expected."""
+
+    ROUNDS = 4
+
+    def __init__(self, size: int, seed: int):
+        if size < 2:
+            raise ValueError("size must be at least 2")
+        self.size = size
+        self.half = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half) - 1
+        self.keys = [_mix(seed * 0x100 + r) for r in range(self.ROUNDS)]
+
+    def _encrypt(self, x: int) -> int:
+        left, right = x >> self.half, x & self.mask
+        for key in self.keys:
+            left, right = right, left ^ (_mix(right ^ key) & self.mask)
+        return (left << self.half) | right
+
+    def _decrypt(self, x: int) -> int:
+        left, right = x >> self.half, x & self.mask
+        for key in reversed(self.keys):
+            left, right = right ^ (_mix(left ^ key) & self.mask), left
+        return (left << self.half) | right
+
+    def __getitem__(self, i: int) -> int:
+        if not 0 <= i < self.size:
+            raise IndexError(i)
+        x = self._encrypt(i)
+        while x >= self.size:           # cycle-walk back into range; < 4 steps on average
+            x = self._encrypt(x)
+        return x
+
+    def index(self, value: int) -> int:
+        x = self._decrypt(value)
+        while x >= self.size:
+            x = self._decrypt(x)
+        return x
+
+
+@dataclass(frozen=True)
+class Catalog:
+    first_names: tuple = ("Jane", "Thandi", "Amara", "Lerato", "Nomsa", "Zanele", "Ayanda", "Kagiso",
+                          "Sipho", "Thabo", "Liam", "Noah", "Olivia", "Emma", "Mia", "Lucas")
+    middle_names: tuple = ("QA", "Lee", "Marie", "James", "Rose", "Ann")
+    last_names: tuple = ("Tester", "Mavundla", "Dlamini", "Nkosi", "Smith", "Jones", "Naidoo",
+                         "Botha", "Mokoena", "Brown", "Khumalo", "Williams")
+    genders: tuple = ("Female", "Male")
+    marital_statuses: tuple = ("Single", "Married", "Other")
+    nationalities: tuple = ("South African", "Kenyan", "British", "American", "Nigerian", "Indian")
+    job_titles: tuple = ("QA Engineer", "Software Engineer", "HR Manager", "Account Assistant")
+    job_categories: tuple = ("Professionals", "Technicians", "Officials and Managers")
+    sub_units: tuple = ("Quality Assurance", "Engineering", "Human Resources")
+    locations: tuple = ("*",)           # "*" = first option the form offers
+    employment_statuses: tuple = ("Full-Time Contract", "Full-Time Permanent", "Part-Time Internship")
+
+    # catalog field -> (admin lookup, key holding the visible text)
+    API_LOOKUPS = {
+        "nationalities": ("admin/nationalities", "name"),
+        "job_titles": ("admin/job-titles", "title"),
+        "job_categories": ("admin/job-categories", "name"),
+        "sub_units": ("admin/subunits", "name"),
+        "locations": ("admin/locations", "name"),
+        "employment_statuses": ("admin/employment-statuses", "name"),
+    }
+
+    @classmethod
+    def from_api(cls, api, base: "Catalog | None" = None) -> "Catalog":
+        """`base` (default catalog) with every lookup replaced by the instance's own values."""
+        values = {}
+        for attr, (resource, key) in cls.API_LOOKUPS.items():
+            names = tuple(sorted({row[key] for row in api.list_options(resource) if row.get(key)}))
+            if names:
+                values[attr] = names
+        return replace(base or cls(), **values)
+
+
+@dataclass(frozen=True)
+class EmployeeData:
+    index: int
+    first: str
+    middle: str
+    last: str
+    gender: str
+    dob: str
+    marital_status: str
+    nationality: str
+    joined_date: str
+    job_title: str
+    job_category: str
+    sub_unit: str
+    location: str
+    employment_status: str
+
+    @property
+    def label(self) -> str:
+        """Short pytest id."""
+        return f"{self.index}-{self.first}"
+
+    def personal_details(self) -> dict:
+        """kwargs for EmployeePersonalPage.set_personal_details / EmployeeChecks.fields."""
+        return {"nationality": self.nationality, "marital_status": self.marital_status,
+                "dob": self.dob, "gender": self.gender}
+
+    def job_details(self) -> dict:
+        """kwargs for JobDetailsPage.set_job_details / EmployeeChecks.fields (without location)."""
+        return {"joined_date": self.joined_date, "job_title": self.job_title, "job_category": self.job_category,
+                "sub_unit": self.sub_unit, "employment_status": self.employment_status}
+
+    def personal_form(self) -> dict:
+        """Expected labels of the Personal Details card (pages.form_snapshot.read_card)."""
+        return {"Nationality": self.nationality, "Marital Status": self.marital_status,
+                "Date of Birth": self.dob, "Gender": self.gender}
+
+    def job_form(self) -> dict:
+        """Expected labels of the Job Details card."""
+        return {"Joined Date": self.joined_date, "Job Title": self.job_title, "Job Category": self.job_category,
+                "Sub Unit": self.sub_unit, "Employment Status": self.employment_status}
+
+
+class EmployeeDataGenerator:
+    """
+    `len(gen)` == 10**digits unique records. `offset`/`stride` split the index space,
+    e.g. between xdist workers: worker k of n uses offset=k, stride=n.
+    """
+
+    def __init__(self, seed: int = 0, catalog: Catalog | None = None, digits: int = 7,
+                 offset: int = 0, stride: int = 1):
+        self.seed = seed
+        self.catalog = catalog or Catalog()
+        self.digits = digits
+        self.perm = Permutation(10 ** digits, seed)
+        self.offset, self.stride = offset, stride
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return self.perm.size
+
+    def __getitem__(self, i: int) -> EmployeeData:
+        c = self.catalog
+        unique = self.perm[i]
+        h = _mix(self.seed ^ _mix(i))
+
+        def pick(values, salt):
+            return values[_mix(h + salt) % len(values)]
+
+        dob = _DOB_START + datetime.timedelta(days=_mix(h + 7) % _DOB_DAYS)
+        joined = _JOINED_START + datetime.timedelta(days=_mix(h + 8) % _JOINED_DAYS)
+        return EmployeeData(
+            index=i,
+            first=f"{pick(c.first_names, 1)}{unique:0{self.digits}d}",
+            middle=pick(c.middle_names, 2),
+            last=pick(c.last_names, 3),
+            gender=pick(c.genders, 4),
+            dob=dob.isoformat(),
+            marital_status=pick(c.marital_statuses, 5),
+            nationality=pick(c.nationalities, 6),
+            joined_date=joined.isoformat(),
+            job_title=pick(c.job_titles, 9),
+            job_category=pick(c.job_categories, 10),
+            sub_unit=pick(c.sub_units, 11),
+            location=pick(c.locations, 12),
+            employment_status=pick(c.employment_statuses, 13),
+        )
+
+    def index_of(self, first_name: str) -> int:
+        """Index of the record whose first name this is (names encode their index)."""
+        return self.perm.index(int(first_name[-self.digits:]))
+
+    def stream(self, start: int = 0, count: int | None = None):
+        """Records start, start+1, ... lazily (never materialised)."""
+        stop = len(self) if count is None else min(len(self), start + count)
+        for i in range(start, stop):
+            yield self[i]
+
+    def take(self) -> EmployeeData:
+        """Next record of this generator's slice (offset, offset+stride, ...)."""
+        record = self[self.offset + self._cursor * self.stride]
+        self._cursor += 1
+        return record
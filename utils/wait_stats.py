@@ -0,0 +1,141 @@
+# utils/wait_stats.py
+"""
+How long every page-object wait actually takes, and how close it gets to its timeout.
+
+`WAITS.install()` patches `WebDriverWait.until` so each call is recorded against its
+call site (e.g. `EmployeeListPage.search_employee:63` for the 5 s autocomplete wait)
+with its timeout, elapsed time and whether it timed out. Comparing the per-site
+numbers across network profiles shows which waits turn into timeouts as latency rises.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PAGES = os.path.join(_ROOT, "pages") + os.sep
+
+
+def _call_site(frame) -> str:
+    """First frame in pages/ (with its class), else the first project frame."""
+    fallback = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_PAGES):
+            owner = frame.f_locals.get("self")
+            prefix = f"{type(owner).__name__}." if owner is not None else ""
+            return f"{prefix}{frame.f_code.co_name}:{frame.f_lineno}"
+        if fallback is None and filename.startswith(_ROOT) and filename != __file__:
+            fallback = f"{os.path.basename(filename)}:{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return fallback or "?"
+
+
+@dataclass
+class WaitStat:
+    timeout: float = 0.0
+    calls: int = 0
+    timeouts: int = 0
+    durations: list = field(default_factory=list)   # seconds of the calls that succeeded
+
+    def merge(self, other: "WaitStat") -> None:
+        self.timeout = max(self.timeout, other.timeout)
+        self.calls += other.calls
+        self.timeouts += other.timeouts
+        self.durations += other.durations
+
+    def percentile(self, q: float) -> float:
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def headroom(self) -> float:
+        """1 - p95 / timeout: how much of the timeout is still unused (negative = already failing)."""
+        if not self.timeout:
+            return 1.0
+        if self.timeouts and not self.durations:
+            return 0.0
+        return 1.0 - self.percentile(0.95) / self.timeout
+
+
+class WaitRecorder:
+    def __init__(self):
+        self.stats: dict[str, WaitStat] = {}
+        self._lock = threading.Lock()
+        self._original = None
+
+    def install(self) -> None:
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.wait import WebDriverWait
+
+        if self._original is not None:
+            return
+        original = self._original = WebDriverWait.until
+        recorder = self
+
+        def until(wait, method, message=""):
+            site = _call_site(sys._getframe(1))
+            start = time.perf_counter()
+            try:
+                value = original(wait, method, message)
+            except TimeoutException:
+                recorder.record(site, getattr(wait, "_timeout", 0.0), None)
+                raise
+            recorder.record(site, getattr(wait, "_timeout", 0.0), time.perf_counter() - start)
+            return value
+
+        WebDriverWait.until = until
+
+    def uninstall(self) -> None:
+        if self._original is not None:
+            from selenium.webdriver.support.wait import WebDriverWait
+            WebDriverWait.until = self._original
+            self._original = None
+
+    def record(self, site: str, timeout: float, seconds: float | None) -> None:
+        with self._lock:
+            st = self.stats.setdefault(site, WaitStat())
+            st.timeout = max(st.timeout, float(timeout))
+            st.calls += 1
+            if seconds is None:
+                st.timeouts += 1
+            else:
+                st.durations.append(round(seconds, 3))
+
+    def dump(self, path: str, profile: str = "none") -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"profile": profile, "waits": {k: asdict(v) for k, v in self.stats.items()}}, f)
+
+
+WAITS = WaitRecorder()
+
+
+def load_waits(directory: str) -> dict[str, dict[str, WaitStat]]:
+    """{profile: {site: merged WaitStat}} from every worker dump in `directory`."""
+    out: dict[str, dict[str, WaitStat]] = {}
+    if not os.path.isdir(directory):
+        return out
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            data = json.load(f)
+        sites = out.setdefault(data.get("profile", "none"), {})
+        for site, raw in data["waits"].items():
+            sites.setdefault(site, WaitStat()).merge(WaitStat(**raw))
+    return out
+
+
+def format_waits(stats: dict[str, WaitStat], limit: int = 15) -> list[str]:
+    """Waits closest to (or past) their timeout first."""
+    rows = sorted(stats.items(), key=lambda kv: (kv[1].headroom, -kv[1].calls))[:limit]
+    lines = [f"{'wait site':<45} {'timeout':>7} {'calls':>5} {'t/o':>4} {'p50':>6} {'p95':>6} {'headroom':>8}"]
+    for site, st in rows:
+        lines.append(f"{site:<45} {st.timeout:6.0f}s {st.calls:5d} {st.timeouts:4d} "
+                     f"{st.percentile(0.5):5.2f}s {st.percentile(0.95):5.2f}s {st.headroom:8.0%}")
+    return lines